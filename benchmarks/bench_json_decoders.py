@@ -0,0 +1,107 @@
+"""
+Benchmark the JSON decoder backends on a realistic getStatsData page.
+
+Builds a 100,000-row response from the metadata of a real e-Stat page
+(TABLE_INF and CLASS_INF of the sample response in tests/fixtures), then
+times decoding the body alone and decoding followed by parse_response
+for every installed backend.
+
+Usage:
+    uv run python benchmarks/bench_json_decoders.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import itertools
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from estat_api_dlt_helper.api.json_decoder import (
+    JSON_DECODER_BACKENDS,
+    get_json_decoder,
+)
+from estat_api_dlt_helper.parser import parse_response
+
+FIXTURE = (
+    Path(__file__).resolve().parent.parent
+    / "tests"
+    / "fixtures"
+    / "SampleResponse1752633595900.json"
+)
+
+
+def _codes(class_obj: Dict[str, Any]) -> List[str]:
+    classes = class_obj["CLASS"]
+    if isinstance(classes, dict):
+        classes = [classes]
+    return [c["@code"] for c in classes]
+
+
+def build_page(rows: int) -> bytes:
+    """Build a getStatsData response body with the given number of rows.
+
+    TABLE_INF and CLASS_INF are taken from the sample response in
+    tests/fixtures, and VALUE rows cycle through combinations of its codes.
+    """
+    with FIXTURE.open(encoding="utf-8") as f:
+        response = json.load(f)
+    statistical_data = response["GET_STATS_DATA"]["STATISTICAL_DATA"]
+
+    codes = {
+        class_obj["@id"]: _codes(class_obj)
+        for class_obj in statistical_data["CLASS_INF"]["CLASS_OBJ"]
+    }
+    combinations = itertools.cycle(itertools.product(*codes.values()))
+    values = []
+    for i, combination in zip(range(rows), combinations, strict=False):
+        row = {f"@{dim}": code for dim, code in zip(codes, combination, strict=True)}
+        row["@unit"] = "人"
+        row["$"] = str(i * 37 % 1000003)
+        values.append(row)
+
+    statistical_data["RESULT_INF"] = {
+        "TOTAL_NUMBER": rows,
+        "FROM_NUMBER": 1,
+        "TO_NUMBER": rows,
+    }
+    statistical_data["DATA_INF"] = {"VALUE": values}
+    return json.dumps(response, ensure_ascii=False).encode("utf-8")
+
+
+def _median_time(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_page(args.rows)
+    print(f"Page: {args.rows:,} rows, {len(body) / 1024**2:.1f} MiB")
+    print(f"{'backend':<10}{'decode [ms]':>14}{'decode+parse [ms]':>20}")
+
+    for backend in JSON_DECODER_BACKENDS:
+        try:
+            decode = get_json_decoder(backend, stats_data=True)
+        except ImportError:
+            print(f"{backend:<10}{'not installed':>14}")
+            continue
+
+        decode_time = _median_time(lambda decode=decode: decode(body), args.repeat)
+        total_time = _median_time(
+            lambda decode=decode: parse_response(decode(body)), args.repeat
+        )
+        print(f"{backend:<10}{decode_time * 1000:>14.1f}{total_time * 1000:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
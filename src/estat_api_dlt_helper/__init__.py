@@ -2,24 +2,41 @@
 
 __version__ = "0.3.1"
 
-from .api.client import EstatApiClient
+from .api.async_client import AsyncEstatApiClient
+from .api.cache import ResponseCache
+from .api.client import AdaptiveConcurrency, EstatApiClient
+from .api.client_registry import ClientRegistry, get_client_registry
+from .api.rate_limiter import RateLimiter, get_rate_limiter
 from .config import DestinationConfig, EstatDltConfig, SourceConfig
 from .loader import (
+    async_estat_table,
     create_estat_pipeline,
     create_estat_resource,
     create_estat_source,
+    estat_dimensions,
     estat_source,
     estat_table,
+    estat_table_info,
+    explain_load,
     load_estat_data,
 )
 from .loader.unified_schema_resource import create_unified_estat_resource
-from .parser import parse_response
+from .parser import ParserSession, StreamingResponseParser, parse_response
 
 __all__ = [
     # API Client
     "EstatApiClient",
+    "AsyncEstatApiClient",
+    "ResponseCache",
+    "ClientRegistry",
+    "get_client_registry",
+    "RateLimiter",
+    "get_rate_limiter",
+    "AdaptiveConcurrency",
     # Parser
     "parse_response",
+    "StreamingResponseParser",
+    "ParserSession",
     # Main configuration
     "EstatDltConfig",
     "SourceConfig",
@@ -27,12 +44,16 @@ __all__ = [
     # Source / Resource
     "estat_source",
     "estat_table",
+    "estat_table_info",
+    "estat_dimensions",
+    "async_estat_table",
     # Loader functions
     "load_estat_data",
     "create_estat_resource",
     "create_unified_estat_resource",
     "create_estat_pipeline",
     "create_estat_source",
+    "explain_load",
     # Version
     "__version__",
 ]
@@ -1,4 +1,18 @@
-from .client import EstatApiClient
+from .async_client import AsyncEstatApiClient
+from .cache import ResponseCache
+from .client import AdaptiveConcurrency, EstatApiClient
+from .client_registry import ClientRegistry, get_client_registry
 from .endpoints import ESTAT_ENDPOINTS
+from .rate_limiter import RateLimiter, get_rate_limiter
 
-__all__ = ["EstatApiClient", "ESTAT_ENDPOINTS"]
+__all__ = [
+    "AsyncEstatApiClient",
+    "EstatApiClient",
+    "ESTAT_ENDPOINTS",
+    "ResponseCache",
+    "ClientRegistry",
+    "get_client_registry",
+    "RateLimiter",
+    "get_rate_limiter",
+    "AdaptiveConcurrency",
+]
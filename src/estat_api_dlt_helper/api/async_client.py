@@ -0,0 +1,268 @@
+import asyncio
+from types import TracebackType
+from typing import Any, AsyncGenerator, Dict, Optional, Type
+
+from ..utils.logging import get_logger
+from .client import (
+    _build_stats_data_params,
+    _build_stats_list_params,
+    _get_result_info,
+    _page_limit,
+)
+from .endpoints import ESTAT_ENDPOINTS
+from .rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+# Same retry policy as dlt's requests Client defaults
+_RETRY_STATUS_CODES = frozenset([429, *range(500, 600)])
+
+
+class AsyncEstatApiClient:
+    """Asyncio-native client for accessing e-Stat API.
+
+    Mirrors the surface of EstatApiClient with coroutine methods so that
+    many tables can be fetched concurrently from a single thread. Uses
+    httpx's AsyncClient for connection pooling, and retries on throttling,
+    server errors and transport errors with exponential backoff.
+
+    Unlike EstatApiClient, responses are never served from or written to a
+    ResponseCache.
+
+    Requires the optional ``httpx`` dependency
+    (``pip install estat-api-dlt-helper[async]``).
+
+    Attributes:
+        app_id: e-Stat API application ID for authentication.
+        base_url: Base URL for API endpoints.
+        timeout: Request timeout in seconds.
+        max_attempts: Maximum number of attempts per request.
+        backoff_factor: Base delay in seconds for exponential backoff.
+        rate_limiter: Optional token bucket limiting the request rate.
+        client: Async HTTP client with connection pooling.
+    """
+
+    def __init__(
+        self,
+        app_id: str,
+        base_url: Optional[str] = None,
+        timeout: int = 60,
+        max_attempts: int = 5,
+        backoff_factor: float = 1.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Initialize async e-Stat API client.
+
+        Args:
+            app_id: e-Stat API application ID
+            base_url: Base URL for API (defaults to official endpoint)
+            timeout: Request timeout in seconds
+            max_attempts: Maximum number of attempts per request
+            backoff_factor: Base delay in seconds for exponential backoff
+            rate_limiter: Token bucket every attempt waits on, without
+                blocking the event loop. Share one limiter between clients
+                of the same appId, e.g. with get_rate_limiter.
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncEstatApiClient requires httpx. "
+                "Install it with: pip install estat-api-dlt-helper[async]"
+            ) from e
+
+        self.app_id = app_id
+        self.base_url = base_url or ESTAT_ENDPOINTS["base_url"]
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter
+        self.default_headers = {"accept": "application/json"}
+        self.client = httpx.AsyncClient(timeout=timeout)
+        self._transport_errors = (httpx.TransportError,)
+
+    async def __aenter__(self) -> "AsyncEstatApiClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def _make_request(
+        self, endpoint: str, params: Dict[str, Any], **kwargs: Any
+    ) -> Any:
+        """Make HTTP request to e-Stat API with retries.
+
+        Args:
+            endpoint: API endpoint name
+            params: Query parameters
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            httpx.Response object
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        # Add appId to params
+        params = {"appId": self.app_id, **params}
+        safe_params = {
+            key: ("***REDACTED***" if key == "appId" else value)
+            for key, value in params.items()
+        }
+
+        logger.debug(f"Making async request to {url} with params: {safe_params}")
+
+        for attempt in range(1, self.max_attempts + 1):
+            if self.rate_limiter is not None:
+                await asyncio.to_thread(self.rate_limiter.acquire)
+            try:
+                response = await self.client.get(
+                    url, params=params, headers=self.default_headers, **kwargs
+                )
+            except self._transport_errors as e:
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning(f"Request to {url} failed ({e}), retrying")
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUS_CODES
+                    or attempt == self.max_attempts
+                ):
+                    response.raise_for_status()
+                    return response
+                logger.warning(
+                    f"Request to {url} returned {response.status_code}, retrying"
+                )
+
+            await asyncio.sleep(self.backoff_factor * 2 ** (attempt - 1))
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def get_stats_data(
+        self,
+        stats_data_id: str,
+        start_position: int = 1,
+        limit: int = 100000,
+        meta_get_flg: str = "Y",
+        cnt_get_flg: str = "N",
+        explanation_get_flg: str = "Y",
+        annotation_get_flg: str = "Y",
+        replace_sp_chars: str = "0",
+        lang: str = "J",
+        **additional_params: Any,
+    ) -> Dict[str, Any]:
+        """Get statistical data from e-Stat API.
+
+        Args:
+            stats_data_id: Statistical data ID
+            start_position: Start position for data retrieval (1-based)
+            limit: Maximum number of records to retrieve
+            meta_get_flg: Whether to get metadata (Y/N)
+            cnt_get_flg: Whether to get count only (Y/N)
+            explanation_get_flg: Whether to get explanations (Y/N)
+            annotation_get_flg: Whether to get annotations (Y/N)
+            replace_sp_chars: Replace special characters (0: No, 1: Yes, 2: Remove)
+            lang: Language (J: Japanese, E: English)
+            **additional_params: Additional query parameters
+
+        Returns:
+            API response as dictionary
+        """
+        params = _build_stats_data_params(
+            stats_data_id=stats_data_id,
+            start_position=start_position,
+            limit=limit,
+            meta_get_flg=meta_get_flg,
+            cnt_get_flg=cnt_get_flg,
+            explanation_get_flg=explanation_get_flg,
+            annotation_get_flg=annotation_get_flg,
+            replace_sp_chars=replace_sp_chars,
+            lang=lang,
+            **additional_params,
+        )
+
+        response = await self._make_request(ESTAT_ENDPOINTS["stats_data"], params)
+        return response.json()
+
+    async def get_stats_data_generator(
+        self,
+        stats_data_id: str,
+        limit_per_request: int = 100000,
+        max_rows: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Get statistical data as an async generator for pagination.
+
+        Args:
+            stats_data_id: Statistical data ID
+            limit_per_request: Number of records per request
+            max_rows: Stop after this many records; the limit of the last
+                page is trimmed so that no records beyond it are requested
+            **kwargs: Additional parameters for get_stats_data
+
+        Yields:
+            Response data for each page
+        """
+        start_position = 1
+
+        while True:
+            response_data = await self.get_stats_data(
+                stats_data_id=stats_data_id,
+                start_position=start_position,
+                limit=_page_limit(start_position, limit_per_request, max_rows),
+                **kwargs,
+            )
+
+            total_number, from_number, to_number = _get_result_info(response_data)
+
+            logger.info(
+                f"Retrieved records {from_number} to {to_number} of {total_number}"
+            )
+
+            yield response_data
+
+            if to_number >= total_number:
+                break
+            if max_rows and to_number >= max_rows:
+                break
+
+            start_position = to_number + 1
+
+    async def get_stats_list(
+        self,
+        search_word: Optional[str] = None,
+        survey_years: Optional[str] = None,
+        stats_code: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Get list of available statistics.
+
+        Args:
+            search_word: Search keyword
+            survey_years: Survey years (YYYY or YYYYMM-YYYYMM)
+            stats_code: Statistics code
+            **kwargs: Additional query parameters
+
+        Returns:
+            API response as dictionary
+        """
+        params = _build_stats_list_params(
+            search_word=search_word,
+            survey_years=survey_years,
+            stats_code=stats_code,
+            **kwargs,
+        )
+
+        response = await self._make_request(ESTAT_ENDPOINTS["stats_list"], params)
+        return response.json()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
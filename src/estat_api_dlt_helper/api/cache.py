@@ -0,0 +1,181 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# e-Stat reports errors in RESULT.STATUS (100 and above) with HTTP 200
+_STATUS_PATTERN = re.compile(rb'"STATUS"\s*:\s*"?(\d+)')
+_ERROR_STATUS_THRESHOLD = 100
+_ENTRY_SUFFIX = ".json.gz"
+
+
+def _has_error_status(content: bytes) -> bool:
+    """Whether a response body carries an e-Stat error RESULT.STATUS.
+
+    RESULT comes first in every response body, so only its start is read.
+    STATUS 0-2 are successes (2: some parameters were ignored).
+    """
+    match = _STATUS_PATTERN.search(content, 0, 1024)
+    return match is not None and int(match.group(1)) >= _ERROR_STATUS_THRESHOLD
+
+
+class ResponseCache:
+    """Persistent on-disk cache for e-Stat API responses.
+
+    Entries are keyed by the request URL and the normalized query
+    parameters (excluding ``appId``) and stored gzip-compressed, one file
+    per entry. Each entry expires ``ttl`` seconds after it was written, and
+    the least recently used entries are evicted once the total size of the
+    cache exceeds ``max_size_bytes``. Only successful responses are cached.
+
+    The cache is safe to share between threads and between clients.
+
+    Attributes:
+        directory: Directory where entries are stored.
+        ttl: Time-to-live of an entry in seconds (None: never expires).
+        max_size_bytes: Maximum total size of stored entries (None: unbounded).
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups not found (or expired) in the cache.
+        evictions: Number of entries removed by the size cap.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        ttl: Optional[float] = 24 * 60 * 60,
+        max_size_bytes: Optional[int] = 1024**3,
+    ):
+        """Initialize response cache.
+
+        Args:
+            directory: Directory where entries are stored (created if missing)
+            ttl: Time-to-live of an entry in seconds (None: never expires)
+            max_size_bytes: Maximum total size of stored entries in bytes
+                (None: unbounded)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """Create a cache key from the request URL and query parameters.
+
+        Args:
+            url: Request URL (base URL and endpoint)
+            params: Query parameters; ``appId`` is ignored
+
+        Returns:
+            Hex digest identifying the request
+        """
+        normalized = {
+            key: str(value)
+            for key, value in params.items()
+            if key != "appId" and value is not None
+        }
+        payload = json.dumps([url, normalized], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Look up a cached response body.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Response body, or None on a miss or an expired entry
+        """
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            if self.ttl is not None and time.time() - stat.st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                content = None
+            else:
+                content = gzip.decompress(path.read_bytes())
+                # Record the access time for LRU eviction, keep the write time
+                os.utime(path, (time.time(), stat.st_mtime))
+        except (FileNotFoundError, OSError, EOFError):
+            content = None
+
+        with self._lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return content
+
+    def set(self, key: str, content: bytes) -> None:
+        """Store a response body.
+
+        Responses carrying an e-Stat error STATUS are not stored.
+
+        Args:
+            key: Cache key from make_key
+            content: Raw response body
+        """
+        if _has_error_status(content):
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(content))
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Failed to write response cache entry: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        if self.max_size_bytes is not None:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the size cap is met."""
+        assert self.max_size_bytes is not None
+        with self._lock:
+            entries = []
+            for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total_size -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -1,14 +1,343 @@
-from typing import Any, Dict, Generator, Optional
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Generator, Optional, Tuple, Union
 
 from dlt.sources.helpers.requests.retry import Client
-from requests import Response
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Response, Timeout
 
 from ..utils.logging import get_logger
+from .cache import ResponseCache, _has_error_status
 from .endpoints import ESTAT_ENDPOINTS
+from .json_decoder import JsonDecoder, get_json_decoder
+from .rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
 
+def _build_stats_data_params(
+    stats_data_id: str,
+    start_position: int,
+    limit: int,
+    meta_get_flg: str,
+    cnt_get_flg: str,
+    explanation_get_flg: str,
+    annotation_get_flg: str,
+    replace_sp_chars: str,
+    lang: str,
+    **additional_params: Any,
+) -> Dict[str, Any]:
+    """Build getStatsData query parameters.
+
+    Additional parameters are applied last, so camelCase keys such as
+    ``metaGetFlg`` override the corresponding keyword arguments.
+    """
+    return {
+        "statsDataId": stats_data_id,
+        "startPosition": start_position,
+        "limit": limit,
+        "metaGetFlg": meta_get_flg,
+        "cntGetFlg": cnt_get_flg,
+        "explanationGetFlg": explanation_get_flg,
+        "annotationGetFlg": annotation_get_flg,
+        "replaceSpChars": replace_sp_chars,
+        "lang": lang,
+        **additional_params,
+    }
+
+
+def _build_stats_list_params(
+    search_word: Optional[str] = None,
+    survey_years: Optional[str] = None,
+    stats_code: Optional[str] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Build getStatsList query parameters."""
+    params: Dict[str, Any] = {}
+
+    if search_word:
+        params["searchWord"] = search_word
+    if survey_years:
+        params["surveyYears"] = survey_years
+    if stats_code:
+        params["statsCode"] = stats_code
+
+    params.update(kwargs)
+    return params
+
+
+def _get_result_info(response_data: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Extract (TOTAL_NUMBER, FROM_NUMBER, TO_NUMBER) from a getStatsData response.
+
+    Args:
+        response_data: getStatsData API response
+
+    Returns:
+        Tuple of total number, from number and to number
+    """
+    result_inf = (
+        response_data.get("GET_STATS_DATA", {})
+        .get("STATISTICAL_DATA", {})
+        .get("RESULT_INF", {})
+    )
+    return (
+        int(result_inf.get("TOTAL_NUMBER", 0)),
+        int(result_inf.get("FROM_NUMBER", 0)),
+        int(result_inf.get("TO_NUMBER", 0)),
+    )
+
+
+def _page_limit(start_position: int, limit: int, max_rows: Optional[int]) -> int:
+    """Limit of the page starting at start_position, trimmed to max_rows.
+
+    Args:
+        start_position: startPosition of the page (1-based)
+        limit: Number of records per request
+        max_rows: Maximum total records to fetch (None: unlimited)
+
+    Returns:
+        limit, or fewer records so that the page ends at max_rows
+    """
+    if not max_rows:
+        return limit
+    return max(1, min(limit, max_rows - start_position + 1))
+
+
+def _cached_response(url: str, content: bytes) -> Response:
+    """Build a Response object from a cached response body."""
+    response = Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    return response
+
+
+def _is_overload_status(status_code: int) -> bool:
+    """Whether an HTTP status means the API is throttling or overloaded."""
+    return status_code == 429 or status_code >= 500
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for the number of e-Stat API requests in flight.
+
+    A fixed number of workers is either too timid or overloads the API at
+    busy times. The controller keeps a concurrency limit that requests
+    wait on before they are sent, and adjusts it the way TCP congestion
+    control does:
+
+    - Additive increase: after ``limit`` consecutive requests whose
+      latency stays within ``latency_tolerance`` times the baseline (the
+      lowest latency of the recent requests), the limit grows by
+      ``increase``.
+    - Multiplicative decrease: when a request is throttled (HTTP 429),
+      fails on the server (5xx), times out or cannot connect, or the API
+      answers with an error STATUS, the limit is multiplied by
+      ``decrease_factor``. Requests that were already in flight when the
+      limit was cut do not cut it again.
+
+    The controller only bounds requests; the threads issuing them (page
+    prefetching, parallel tables) set the actual parallelism, so
+    ``max_limit`` should not exceed their number. One controller is safe to
+    share between threads and clients.
+
+    Attributes:
+        min_limit: Lowest concurrency limit.
+        max_limit: Highest concurrency limit.
+        increase: Step of an additive increase.
+        decrease_factor: Factor of a multiplicative decrease.
+        latency_tolerance: Latency ratio to the baseline still considered
+            flat.
+        in_flight: Number of requests currently sent.
+        increases: Number of additive increases.
+        decreases: Number of multiplicative decreases.
+        history: Recent (unix time, limit) pairs, one per limit change.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        increase: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 1.5,
+        latency_window: int = 20,
+        history_size: int = 1000,
+    ):
+        """Initialize adaptive concurrency controller.
+
+        Args:
+            initial_limit: Concurrency limit to start with (clamped to
+                min_limit..max_limit)
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            increase: Step of an additive increase
+            decrease_factor: Factor of a multiplicative decrease (0 < f < 1)
+            latency_tolerance: Latency ratio to the baseline still
+                considered flat (at least 1)
+            latency_window: Number of recent latencies the baseline is
+                taken from
+            history_size: Number of limit changes kept in history
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must not be lower than min_limit")
+        if increase < 1:
+            raise ValueError("increase must be at least 1")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if latency_tolerance < 1:
+            raise ValueError("latency_tolerance must be at least 1")
+        if latency_window < 1 or history_size < 1:
+            raise ValueError("latency_window and history_size must be at least 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._condition = threading.Condition()
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._flat_requests = 0
+        self._last_decrease = float("-inf")
+        self.history: Deque[Tuple[float, int]] = deque(maxlen=history_size)
+        self.history.append((time.time(), self._limit))
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Lowest latency of the recent requests, in seconds."""
+        with self._condition:
+            return min(self._latencies) if self._latencies else None
+
+    def _set_limit(self, limit: int) -> None:
+        self._limit = limit
+        self._flat_requests = 0
+        self.history.append((time.time(), limit))
+        logger.debug(f"Adaptive concurrency limit set to {limit}")
+
+    def acquire(self) -> float:
+        """Wait until the number of requests in flight is under the limit.
+
+        Returns:
+            Start time of the request (time.monotonic), to pass to release
+        """
+        with self._condition:
+            while self.in_flight >= self._limit:
+                self._condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """Record the outcome of a request and free its slot.
+
+        Args:
+            started: Start time returned by acquire
+            overloaded: Whether the request was throttled or failed in a
+                way that signals overload
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self._overloaded(started)
+            elif started >= self._last_decrease:
+                self._completed(time.monotonic() - started)
+            self._condition.notify_all()
+
+    def overloaded(self, started: float) -> None:
+        """Record an overload signal of a request still in flight.
+
+        Used for attempts that are retried, e.g. a 429 answered before the
+        retry succeeds.
+
+        Args:
+            started: Start time returned by acquire
+        """
+        with self._condition:
+            self._overloaded(started)
+
+    def _overloaded(self, started: float) -> None:
+        if started < self._last_decrease:
+            # Already accounted for by the decrease since it was sent
+            return
+        self._last_decrease = time.monotonic()
+        self._latencies.clear()
+        self.decreases += 1
+        self._set_limit(max(self.min_limit, int(self._limit * self.decrease_factor)))
+
+    def _completed(self, latency: float) -> None:
+        self._latencies.append(latency)
+        if latency > min(self._latencies) * self.latency_tolerance:
+            # Latency is rising: hold the limit
+            self._flat_requests = 0
+            return
+        self._flat_requests += 1
+        if self._flat_requests >= self._limit and self._limit < self.max_limit:
+            self.increases += 1
+            self._set_limit(min(self.max_limit, self._limit + self.increase))
+
+    @contextmanager
+    def slot(self) -> Generator[float, None, None]:
+        """Hold a request slot, treating timeouts and HTTP errors as signals.
+
+        Yields:
+            Start time of the request, to pass to overloaded
+        """
+        started = self.acquire()
+        try:
+            yield started
+        except (Timeout, RequestsConnectionError):
+            self.release(started, overloaded=True)
+            raise
+        except HTTPError as e:
+            response = e.response
+            self.release(
+                started,
+                overloaded=response is not None
+                and _is_overload_status(response.status_code),
+            )
+            raise
+        except BaseException:
+            self.release(started)
+            raise
+        else:
+            self.release(started)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current state of the controller.
+
+        Returns:
+            Dictionary with the current limit, requests in flight, number of
+            increases and decreases, baseline latency and limit history
+        """
+        with self._condition:
+            return {
+                "limit": self._limit,
+                "in_flight": self.in_flight,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "baseline_latency": min(self._latencies) if self._latencies else None,
+                "history": list(self.history),
+            }
+
+
 class EstatApiClient:
     """Client for accessing e-Stat API.
 
@@ -22,6 +351,11 @@ class EstatApiClient:
         base_url: Base URL for API endpoints.
         timeout: Request timeout in seconds.
         client: HTTP client with retry and connection pooling.
+        cache: Optional on-disk response cache.
+        json_decoder: JSON decoder backend name or decoder callable.
+        shared: Whether the HTTP client is borrowed (see ClientRegistry).
+        rate_limiter: Optional token bucket limiting the request rate.
+        adaptive_concurrency: Optional controller of the requests in flight.
     """
 
     def __init__(
@@ -29,6 +363,11 @@ class EstatApiClient:
         app_id: str,
         base_url: Optional[str] = None,
         timeout: int = 60,
+        cache: Optional[ResponseCache] = None,
+        json_decoder: Union[str, JsonDecoder] = "json",
+        http_client: Optional[Client] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
     ):
         """Initialize e-Stat API client.
 
@@ -36,21 +375,66 @@ class EstatApiClient:
             app_id: e-Stat API application ID
             base_url: Base URL for API (defaults to official endpoint)
             timeout: Request timeout in seconds
+            cache: Response cache to serve repeated requests from local disk
+            json_decoder: Backend used to decode response bodies: "json"
+                (standard library), "orjson" or "msgspec", or a callable
+                taking the body bytes. With "msgspec", getStatsData rows
+                are decoded directly into typed mappings.
+            http_client: HTTP client to borrow instead of creating one, e.g.
+                from ClientRegistry. It is shared with other API clients, so
+                close() leaves it open and timeout is applied per request.
+            rate_limiter: Token bucket every request sent to the API (not
+                served from the cache) waits on. Share one limiter between
+                clients of the same appId, e.g. with get_rate_limiter.
+            adaptive_concurrency: Controller every request sent to the API
+                waits on for a slot and reports its latency and throttling
+                to. Share one controller between the clients of concurrent
+                threads.
+
+        Raises:
+            ValueError: If the decoder backend is unknown
+            ImportError: If the decoder backend is not installed
         """
         self.app_id = app_id
         self.base_url = base_url or ESTAT_ENDPOINTS["base_url"]
         self.timeout = timeout
-        self.client = Client(request_timeout=timeout)
+        self.shared = http_client is not None
+        self.client = http_client or Client(request_timeout=timeout)
         self.default_headers = {"accept": "application/json"}
+        self.cache = cache
+        self.json_decoder = json_decoder
+        self.rate_limiter = rate_limiter
+        self.adaptive_concurrency = adaptive_concurrency
+
+        # None keeps requests' own Response.json() for the stdlib backend
+        self._decoder: Optional[JsonDecoder] = None
+        self._stats_data_decoder: Optional[JsonDecoder] = None
+        if callable(json_decoder):
+            self._decoder = self._stats_data_decoder = json_decoder
+        elif json_decoder != "json":
+            self._decoder = get_json_decoder(json_decoder)
+            self._stats_data_decoder = get_json_decoder(json_decoder, stats_data=True)
+
+    def _decode(self, response: Response, stats_data: bool = False) -> Any:
+        """Decode a JSON response body with the configured backend."""
+        decoder = self._stats_data_decoder if stats_data else self._decoder
+        if decoder is None:
+            return response.json()
+        return decoder(response.content)
 
     def _make_request(
-        self, endpoint: str, params: Dict[str, Any], **kwargs: Any
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        use_cache: bool = True,
+        **kwargs: Any,
     ) -> Response:
         """Make HTTP request to e-Stat API.
 
         Args:
             endpoint: API endpoint name
             params: Query parameters
+            use_cache: Whether the response cache (if any) may be used
             **kwargs: Additional arguments for requests
 
         Returns:
@@ -65,14 +449,62 @@ class EstatApiClient:
             for key, value in params.items()
         }
 
+        cache_key: Optional[str] = None
+        if self.cache is not None and use_cache:
+            cache_key = self.cache.make_key(url, params)
+            content = self.cache.get(cache_key)
+            if content is not None:
+                logger.debug(f"Serving {url} from cache with params: {safe_params}")
+                return _cached_response(url, content)
+
         logger.debug(f"Making request to {url} with params: {safe_params}")
 
-        response = self.client.get(
-            url, params=params, headers=self.default_headers, **kwargs
-        )
+        if self.shared:
+            kwargs.setdefault("timeout", self.timeout)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        if self.adaptive_concurrency is None:
+            response = self.client.get(
+                url, params=params, headers=self.default_headers, **kwargs
+            )
+        else:
+            response = self._send_adaptive(
+                self.adaptive_concurrency, url, params, **kwargs
+            )
+
+        if self.cache is not None and cache_key is not None and response.ok:
+            self.cache.set(cache_key, response.content)
 
         return response
 
+    def _send_adaptive(
+        self,
+        controller: AdaptiveConcurrency,
+        url: str,
+        params: Dict[str, Any],
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request in a slot of the adaptive concurrency controller.
+
+        Attempts retried by the HTTP client on 429/5xx are reported through
+        a response hook; an error STATUS in the body of a successful
+        response is reported as overload too.
+        """
+        with controller.slot() as started:
+
+            def on_response(response: Response, *args: Any, **kwargs: Any) -> None:
+                if _is_overload_status(response.status_code):
+                    controller.overloaded(started)
+
+            kwargs.setdefault("hooks", {"response": on_response})
+            response = self.client.get(
+                url, params=params, headers=self.default_headers, **kwargs
+            )
+            if not kwargs.get("stream") and _has_error_status(response.content):
+                controller.overloaded(started)
+            return response
+
     def get_stats_data(
         self,
         stats_data_id: str,
@@ -103,54 +535,176 @@ class EstatApiClient:
         Returns:
             API response as dictionary
         """
-        params = {
-            "statsDataId": stats_data_id,
-            "startPosition": start_position,
-            "limit": limit,
-            "metaGetFlg": meta_get_flg,
-            "cntGetFlg": cnt_get_flg,
-            "explanationGetFlg": explanation_get_flg,
-            "annotationGetFlg": annotation_get_flg,
-            "replaceSpChars": replace_sp_chars,
-            "lang": lang,
+        params = _build_stats_data_params(
+            stats_data_id=stats_data_id,
+            start_position=start_position,
+            limit=limit,
+            meta_get_flg=meta_get_flg,
+            cnt_get_flg=cnt_get_flg,
+            explanation_get_flg=explanation_get_flg,
+            annotation_get_flg=annotation_get_flg,
+            replace_sp_chars=replace_sp_chars,
+            lang=lang,
             **additional_params,
-        }
+        )
+
+        response = self._make_request(ESTAT_ENDPOINTS["stats_data"], params)
+        return self._decode(response, stats_data=True)
+
+    def get_stats_data_raw(
+        self,
+        stats_data_id: str,
+        start_position: int = 1,
+        limit: int = 100000,
+        meta_get_flg: str = "Y",
+        cnt_get_flg: str = "N",
+        explanation_get_flg: str = "Y",
+        annotation_get_flg: str = "Y",
+        replace_sp_chars: str = "0",
+        lang: str = "J",
+        **additional_params: Any,
+    ) -> bytes:
+        """Get statistical data as the undecoded JSON response body.
+
+        Same request as get_stats_data, but decoding is left to the caller,
+        e.g. to a worker process (see _fetch_estat_data's parse_workers).
+
+        Args:
+            stats_data_id: Statistical data ID
+            start_position: Start position for data retrieval (1-based)
+            limit: Maximum number of records to retrieve
+            meta_get_flg: Whether to get metadata (Y/N)
+            cnt_get_flg: Whether to get count only (Y/N)
+            explanation_get_flg: Whether to get explanations (Y/N)
+            annotation_get_flg: Whether to get annotations (Y/N)
+            replace_sp_chars: Replace special characters (0: No, 1: Yes, 2: Remove)
+            lang: Language (J: Japanese, E: English)
+            **additional_params: Additional query parameters
+
+        Returns:
+            Response body bytes
+        """
+        params = _build_stats_data_params(
+            stats_data_id=stats_data_id,
+            start_position=start_position,
+            limit=limit,
+            meta_get_flg=meta_get_flg,
+            cnt_get_flg=cnt_get_flg,
+            explanation_get_flg=explanation_get_flg,
+            annotation_get_flg=annotation_get_flg,
+            replace_sp_chars=replace_sp_chars,
+            lang=lang,
+            **additional_params,
+        )
 
         response = self._make_request(ESTAT_ENDPOINTS["stats_data"], params)
-        return response.json()
+        return response.content
+
+    def get_stats_data_stream(
+        self,
+        stats_data_id: str,
+        start_position: int = 1,
+        limit: int = 100000,
+        meta_get_flg: str = "Y",
+        cnt_get_flg: str = "N",
+        explanation_get_flg: str = "Y",
+        annotation_get_flg: str = "Y",
+        replace_sp_chars: str = "0",
+        lang: str = "J",
+        **additional_params: Any,
+    ) -> Response:
+        """Get statistical data as a streamed response.
+
+        The body is not read; consume it incrementally from ``response.raw``
+        (e.g. with StreamingResponseParser) and close the response when
+        done. Streamed responses bypass the response cache.
+
+        Args:
+            stats_data_id: Statistical data ID
+            start_position: Start position for data retrieval (1-based)
+            limit: Maximum number of records to retrieve
+            meta_get_flg: Whether to get metadata (Y/N)
+            cnt_get_flg: Whether to get count only (Y/N)
+            explanation_get_flg: Whether to get explanations (Y/N)
+            annotation_get_flg: Whether to get annotations (Y/N)
+            replace_sp_chars: Replace special characters (0: No, 1: Yes, 2: Remove)
+            lang: Language (J: Japanese, E: English)
+            **additional_params: Additional query parameters
+
+        Returns:
+            Response object with an unread, content-decoding raw stream
+        """
+        params = _build_stats_data_params(
+            stats_data_id=stats_data_id,
+            start_position=start_position,
+            limit=limit,
+            meta_get_flg=meta_get_flg,
+            cnt_get_flg=cnt_get_flg,
+            explanation_get_flg=explanation_get_flg,
+            annotation_get_flg=annotation_get_flg,
+            replace_sp_chars=replace_sp_chars,
+            lang=lang,
+            **additional_params,
+        )
+
+        response = self._make_request(
+            ESTAT_ENDPOINTS["stats_data"], params, use_cache=False, stream=True
+        )
+        # Let urllib3 undo gzip/deflate transfer encoding while streaming
+        response.raw.decode_content = True
+        return response
 
     def get_stats_data_generator(
-        self, stats_data_id: str, limit_per_request: int = 100000, **kwargs: Any
+        self,
+        stats_data_id: str,
+        limit_per_request: int = 100000,
+        max_workers: int = 1,
+        meta_first_page_only: bool = False,
+        max_rows: Optional[int] = None,
+        start_position: int = 1,
+        **kwargs: Any,
     ) -> Generator[Dict[str, Any], None, None]:
         """Get statistical data as a generator for pagination.
 
+        With ``max_workers > 1`` the first page is fetched alone to learn
+        TOTAL_NUMBER and the number of records a page holds (fewer than
+        ``limit_per_request`` if the API caps it). Every remaining
+        ``startPosition`` is then computed up front and fetched on a bounded
+        thread pool. At most ``max_workers`` pages are in flight or buffered
+        at any time, and pages are still yielded in order.
+
         Args:
             stats_data_id: Statistical data ID
             limit_per_request: Number of records per request
+            max_workers: Number of pages fetched concurrently (1: sequential)
+            meta_first_page_only: Request pages after the first one with
+                metaGetFlg=N, so CLASS_INF is downloaded only once
+            max_rows: Stop after this many records; the limit of the last
+                page is trimmed so that no records beyond it are requested
+            start_position: startPosition of the first page (1-based), e.g.
+                to resume after the records already fetched
             **kwargs: Additional parameters for get_stats_data
 
         Yields:
             Response data for each page
+
+        Raises:
+            ValueError: If max_workers is not positive, or a page fetched
+                concurrently does not hold the records it was requested for
         """
-        start_position = 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
 
         while True:
             response_data = self.get_stats_data(
                 stats_data_id=stats_data_id,
                 start_position=start_position,
-                limit=limit_per_request,
+                limit=_page_limit(start_position, limit_per_request, max_rows),
                 **kwargs,
             )
 
-            # Extract data info
-            stats_data = response_data.get("GET_STATS_DATA", {})
-            statistical_data = stats_data.get("STATISTICAL_DATA", {})
-            result_inf = statistical_data.get("RESULT_INF", {})
-
             # Get total number of records
-            total_number = int(result_inf.get("TOTAL_NUMBER", 0))
-            from_number = int(result_inf.get("FROM_NUMBER", 0))
-            to_number = int(result_inf.get("TO_NUMBER", 0))
+            total_number, from_number, to_number = _get_result_info(response_data)
 
             logger.info(
                 f"Retrieved records {from_number} to {to_number} of {total_number}"
@@ -161,10 +715,137 @@ class EstatApiClient:
             # Check if we've retrieved all records
             if to_number >= total_number:
                 break
+            if max_rows and to_number >= max_rows:
+                break
 
             # Update start position for next request
             start_position = to_number + 1
 
+            if meta_first_page_only:
+                kwargs = {**kwargs, "metaGetFlg": "N"}
+
+            if max_workers > 1:
+                # Step by the records the first page really held
+                page_size = min(limit_per_request, to_number - from_number + 1)
+                yield from self._fetch_pages_concurrently(
+                    stats_data_id=stats_data_id,
+                    start_positions=range(
+                        start_position,
+                        min(total_number, max_rows or total_number) + 1,
+                        page_size,
+                    ),
+                    limit_per_request=page_size,
+                    max_workers=max_workers,
+                    max_rows=min(total_number, max_rows or total_number),
+                    **kwargs,
+                )
+                break
+
+    def _fetch_pages_concurrently(
+        self,
+        stats_data_id: str,
+        start_positions: range,
+        limit_per_request: int,
+        max_workers: int,
+        max_rows: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Fetch known pages on a bounded thread pool and yield them in order.
+
+        Each page must start at its startPosition and reach the next one
+        (or max_rows); otherwise records would be skipped silently.
+
+        Args:
+            stats_data_id: Statistical data ID
+            start_positions: startPosition of every page to fetch
+            limit_per_request: Number of records per request
+            max_workers: Maximum number of pages in flight
+            max_rows: Maximum total records; trims the limit of the last page
+            **kwargs: Additional parameters for get_stats_data
+
+        Yields:
+            Response data for each page, in start position order
+
+        Raises:
+            ValueError: If a page does not hold the records it was
+                requested for
+        """
+        positions = iter(start_positions)
+        pending: Deque[Tuple[int, Future[Dict[str, Any]]]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="estat-page"
+        )
+
+        def submit_next() -> None:
+            position = next(positions, None)
+            if position is not None:
+                future = executor.submit(
+                    self.get_stats_data,
+                    stats_data_id=stats_data_id,
+                    start_position=position,
+                    limit=_page_limit(position, limit_per_request, max_rows),
+                    **kwargs,
+                )
+                pending.append((position, future))
+
+        try:
+            for _ in range(max_workers):
+                submit_next()
+
+            while pending:
+                position, future = pending.popleft()
+                response_data = future.result()
+                # Keep the window full before handing the page to the consumer
+                submit_next()
+
+                total_number, from_number, to_number = _get_result_info(response_data)
+                expected_to = (
+                    position + _page_limit(position, limit_per_request, max_rows) - 1
+                )
+                if max_rows is None:
+                    expected_to = min(expected_to, total_number)
+                if from_number != position or to_number < expected_to:
+                    raise ValueError(
+                        f"Page at startPosition {position} returned records "
+                        f"{from_number} to {to_number}, expected {position} "
+                        f"to {expected_to}"
+                    )
+                logger.info(
+                    f"Retrieved records {from_number} to {to_number} of {total_number}"
+                )
+
+                yield response_data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_meta_info(
+        self,
+        stats_data_id: str,
+        explanation_get_flg: str = "N",
+        lang: str = "J",
+        **additional_params: Any,
+    ) -> Dict[str, Any]:
+        """Get metadata (TABLE_INF and CLASS_INF) of a statistical table.
+
+        Args:
+            stats_data_id: Statistical data ID
+            explanation_get_flg: Whether to get explanations (Y/N)
+            lang: Language (J: Japanese, E: English)
+            **additional_params: Additional query parameters
+
+        Returns:
+            API response as dictionary
+        """
+        params = {
+            "statsDataId": stats_data_id,
+            "explanationGetFlg": explanation_get_flg,
+            "lang": lang,
+            **additional_params,
+        }
+
+        response = self._make_request(ESTAT_ENDPOINTS["meta_info"], params)
+        return self._decode(response)
+
     def get_stats_list(
         self,
         search_word: Optional[str] = None,
@@ -183,20 +864,17 @@ class EstatApiClient:
         Returns:
             API response as dictionary
         """
-        params = {}
-
-        if search_word:
-            params["searchWord"] = search_word
-        if survey_years:
-            params["surveyYears"] = survey_years
-        if stats_code:
-            params["statsCode"] = stats_code
-
-        params.update(kwargs)
+        params = _build_stats_list_params(
+            search_word=search_word,
+            survey_years=survey_years,
+            stats_code=stats_code,
+            **kwargs,
+        )
 
         response = self._make_request(ESTAT_ENDPOINTS["stats_list"], params)
-        return response.json()
+        return self._decode(response)
 
     def close(self) -> None:
-        """Close the underlying HTTP session."""
-        self.client.session.close()
+        """Close the underlying HTTP session, unless it is borrowed."""
+        if not self.shared:
+            self.client.session.close()
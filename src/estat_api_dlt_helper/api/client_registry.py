@@ -0,0 +1,137 @@
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from dlt.sources.helpers.requests.retry import Client
+
+from ..utils.logging import get_logger
+from .cache import ResponseCache
+from .client import AdaptiveConcurrency, EstatApiClient
+from .endpoints import ESTAT_ENDPOINTS
+from .json_decoder import JsonDecoder
+from .rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+
+class ClientRegistry:
+    """Process-wide registry of HTTP clients shared by e-Stat resources.
+
+    Creating an EstatApiClient per resource opens a new connection pool,
+    and so a new TCP and TLS handshake, for every table. The registry keeps
+    one HTTP client per (app_id, base_url) and lends it to the API clients
+    of all resources. dlt's Client gives each thread its own session on top
+    of a single connection pool, so borrowed clients are thread-safe and
+    reuse keep-alive connections across resources and threads.
+
+    Attributes:
+        pool_size: Maximum number of connections kept alive per host by
+            clients created from now on.
+    """
+
+    def __init__(self, pool_size: int = 10):
+        """
+        Initialize client registry.
+
+        Args:
+            pool_size: Maximum number of connections kept alive per host
+
+        Raises:
+            ValueError: If pool_size is not positive
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.pool_size = pool_size
+        self._clients: Dict[Tuple[str, str], Client] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get_http_client(self, app_id: str, base_url: Optional[str] = None) -> Client:
+        """
+        Get the shared HTTP client of an application ID and base URL.
+
+        Args:
+            app_id: e-Stat API application ID
+            base_url: Base URL for API (defaults to official endpoint)
+
+        Returns:
+            HTTP client with retry and connection pooling
+        """
+        key = (app_id, base_url or ESTAT_ENDPOINTS["base_url"])
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                logger.debug(
+                    f"Creating shared HTTP client for {key[1]} "
+                    f"with pool size {self.pool_size}"
+                )
+                client = self._clients[key] = Client(max_connections=self.pool_size)
+            return client
+
+    def client(
+        self,
+        app_id: str,
+        base_url: Optional[str] = None,
+        timeout: int = 60,
+        cache: Optional[ResponseCache] = None,
+        json_decoder: Union[str, JsonDecoder] = "json",
+        rate_limiter: Optional[RateLimiter] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+    ) -> EstatApiClient:
+        """
+        Create an API client borrowing the shared HTTP client.
+
+        The API client is cheap; closing it leaves the shared connections
+        open for the next resource.
+
+        Args:
+            app_id: e-Stat API application ID
+            base_url: Base URL for API (defaults to official endpoint)
+            timeout: Request timeout in seconds
+            cache: Response cache to serve repeated requests from local disk
+            json_decoder: Backend used to decode response bodies
+            rate_limiter: Token bucket limiting the request rate
+            adaptive_concurrency: Controller of the requests in flight
+
+        Returns:
+            EstatApiClient sharing the connection pool of the registry
+        """
+        return EstatApiClient(
+            app_id=app_id,
+            base_url=base_url,
+            timeout=timeout,
+            cache=cache,
+            json_decoder=json_decoder,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=adaptive_concurrency,
+            http_client=self.get_http_client(app_id, base_url),
+        )
+
+    def clear(self) -> None:
+        """Forget all shared clients, e.g. after changing pool_size."""
+        with self._lock:
+            self._clients.clear()
+
+
+_default_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """
+    Get the process-wide client registry used by estat_source.
+
+    Example:
+        ```python
+        from estat_api_dlt_helper import get_client_registry
+
+        registry = get_client_registry()
+        registry.pool_size = 32
+        registry.clear()
+        ```
+
+    Returns:
+        The default ClientRegistry
+    """
+    return _default_registry
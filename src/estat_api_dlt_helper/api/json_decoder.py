@@ -0,0 +1,73 @@
+import json
+from typing import Any, Callable, Dict, List, TypedDict, Union
+
+# Callable decoding a JSON response body into Python objects
+JsonDecoder = Callable[[bytes], Any]
+
+JSON_DECODER_BACKENDS = ("json", "orjson", "msgspec")
+
+# Typed shape of a getStatsData response for msgspec. Only DATA_INF.VALUE is
+# typed; the other sections are decoded as-is. TypedDicts decode into plain
+# dicts, so the result can be passed to parse_response unchanged.
+_StatsDataValue = Dict[str, str]
+_DataInf = TypedDict(
+    "_DataInf",
+    {"NOTE": Any, "VALUE": Union[List[_StatsDataValue], _StatsDataValue]},
+    total=False,
+)
+_StatisticalData = TypedDict(
+    "_StatisticalData",
+    {"RESULT_INF": Any, "TABLE_INF": Any, "CLASS_INF": Any, "DATA_INF": _DataInf},
+    total=False,
+)
+_GetStatsData = TypedDict(
+    "_GetStatsData",
+    {"RESULT": Any, "PARAMETER": Any, "STATISTICAL_DATA": _StatisticalData},
+    total=False,
+)
+_StatsDataResponse = TypedDict(
+    "_StatsDataResponse", {"GET_STATS_DATA": _GetStatsData}, total=False
+)
+
+
+def get_json_decoder(backend: str = "json", stats_data: bool = False) -> JsonDecoder:
+    """Get a JSON decoder for the given backend.
+
+    Args:
+        backend: Decoder backend ("json", "orjson" or "msgspec")
+        stats_data: Whether the decoder is used for getStatsData responses.
+            With msgspec, DATA_INF.VALUE rows are then decoded and validated
+            as typed string mappings.
+
+    Returns:
+        Callable decoding a response body
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend library is not installed
+    """
+    if backend not in JSON_DECODER_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON decoder backend: {backend!r}. "
+            f"Choose one of: {', '.join(JSON_DECODER_BACKENDS)}"
+        )
+
+    if backend == "json":
+        return json.loads
+
+    try:
+        if backend == "orjson":
+            import orjson
+
+            return orjson.loads
+
+        import msgspec  # type: ignore[import-not-found]
+
+        if stats_data:
+            return msgspec.json.Decoder(type=_StatsDataResponse).decode
+        return msgspec.json.Decoder().decode
+    except ImportError as e:
+        raise ImportError(
+            f"The {backend} JSON decoder requires {backend}. "
+            f"Install it with: pip install estat-api-dlt-helper[{backend}]"
+        ) from e
@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Generator, List, Optional, Union
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """Token bucket limiting the request rate of e-Stat API clients.
+
+    The bucket holds up to ``burst`` tokens and is refilled at
+    ``requests_per_second``. Every request takes one token and waits until
+    one is available, so the request rate stays under the limit instead of
+    being corrected by retries after the API starts rejecting requests.
+
+    One limiter is safe to share between threads and clients. With
+    ``state_file``, the bucket is stored in that file and updated under an
+    exclusive file lock, so that every process on the host using the same
+    file (e.g. parallel pipelines with the same appId) shares one bucket.
+    File locking requires a POSIX system (``fcntl``).
+
+    Attributes:
+        requests_per_second: Rate at which tokens are refilled.
+        burst: Maximum number of tokens, i.e. requests sent back to back.
+        state_file: File holding the shared bucket, if any.
+        waits: Number of requests that had to wait for a token.
+        waited_seconds: Total time spent waiting for tokens.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: Optional[int] = None,
+        state_file: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_second: Sustained request rate
+            burst: Bucket size (defaults to one second of requests, at
+                least 1)
+            state_file: File shared by processes on the same host. Created
+                if missing.
+
+        Raises:
+            ValueError: If requests_per_second or burst is not positive
+            ImportError: If state_file is given on a system without fcntl
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if burst is None:
+            burst = max(1, int(requests_per_second))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.state_file = Path(state_file) if state_file is not None else None
+        self.waits = 0
+        self.waited_seconds = 0.0
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+        if self.state_file is not None:
+            try:
+                import fcntl  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "Sharing a RateLimiter between processes requires fcntl "
+                    "(POSIX systems)"
+                ) from e
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.state_file.touch(exist_ok=True)
+
+    def _now(self) -> float:
+        # Processes share wall-clock time; a single process uses the
+        # monotonic clock
+        return time.time() if self.state_file is not None else time.monotonic()
+
+    def _read_state(self, content: str) -> List[float]:
+        try:
+            state = json.loads(content)
+            return [float(state["tokens"]), float(state["updated"])]
+        except (ValueError, KeyError, TypeError):
+            # New or unreadable state file: start with a full bucket
+            return [float(self.burst), self._now()]
+
+    @contextmanager
+    def _bucket(self) -> Generator[List[float], None, None]:
+        """Lock the bucket and yield its [tokens, updated] state, saved on exit."""
+        with self._lock:
+            if self.state_file is None:
+                state = [self._tokens, self._updated]
+                yield state
+                self._tokens, self._updated = state
+                return
+
+            import fcntl
+
+            with open(self.state_file, "r+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    state = self._read_state(f.read())
+                    yield state
+                    f.seek(0)
+                    f.write(json.dumps({"tokens": state[0], "updated": state[1]}))
+                    f.truncate()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the number of seconds until
+            the next token is available
+        """
+        with self._bucket() as state:
+            now = self._now()
+            elapsed = max(0.0, now - state[1])
+            tokens = min(
+                float(self.burst), state[0] + elapsed * self.requests_per_second
+            )
+            state[1] = now
+            if tokens >= 1:
+                state[0] = tokens - 1
+                return 0.0
+            state[0] = tokens
+            return (1 - tokens) / self.requests_per_second
+
+    def acquire(self) -> float:
+        """Wait until a token is available and take it.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                break
+            time.sleep(wait)
+            waited += wait
+
+        if waited:
+            with self._lock:
+                self.waits += 1
+                self.waited_seconds += waited
+            logger.debug(f"Waited {waited:.3f}s for the rate limit")
+        return waited
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    app_id: str,
+    requests_per_second: float,
+    burst: Optional[int] = None,
+    state_file: Optional[Union[str, Path]] = None,
+) -> RateLimiter:
+    """Get the process-wide rate limiter of an application ID.
+
+    The first call for an app_id creates the limiter; later calls return
+    the same instance, so that all clients and threads using the app_id
+    draw from one bucket. Settings of later calls are ignored.
+
+    Args:
+        app_id: e-Stat API application ID
+        requests_per_second: Sustained request rate
+        burst: Bucket size (defaults to one second of requests)
+        state_file: File shared by processes on the same host
+
+    Returns:
+        RateLimiter shared by the app_id
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(app_id)
+        if limiter is None:
+            limiter = _rate_limiters[app_id] = RateLimiter(
+                requests_per_second, burst, state_file
+            )
+        elif (limiter.requests_per_second, limiter.burst) != (
+            requests_per_second,
+            burst or limiter.burst,
+        ):
+            logger.warning(
+                "A rate limiter with different settings already exists for "
+                "this app_id; using the existing one"
+            )
+        return limiter
@@ -24,7 +24,9 @@ class SourceConfig(BaseModel):
         ...,
         description="Statistical table ID(s) to fetch. Can be a single ID or list of IDs",
     )
-    lang: Literal["J", "E"] = Field(default="J", description="Language of the API response")
+    lang: Literal["J", "E"] = Field(
+        default="J", description="Language of the API response"
+    )
     metaGetFlg: Literal["Y", "N"] = Field(
         default="Y", description="Whether to fetch metadata (Y/N)"
     )
@@ -116,7 +118,9 @@ class DestinationConfig(BaseModel):
     )
 
     # DLT pipeline configuration
-    pipeline_name: Optional[str] = Field(default=None, description="Name of the DLT pipeline")
+    pipeline_name: Optional[str] = Field(
+        default=None, description="Name of the DLT pipeline"
+    )
     dev_mode: bool = Field(default=False, description="Enable DLT development mode")
 
     # Additional destination-specific configuration
@@ -150,9 +154,28 @@ class EstatDltConfig(BaseModel):
     Attributes:
         source: e-Stat API source configuration.
         destination: DLT destination configuration.
-        batch_size: Number of records per batch.
+        batch_size: Maximum number of records per yielded record batch.
         max_retries: Maximum API retry attempts.
         timeout: API request timeout in seconds.
+        reuse_metadata: Fetch CLASS_INF only once per table.
+        stream_chunk_size: Rows per table when decoding responses as a stream.
+        json_decoder: JSON decoder backend for API responses.
+        keep_value_symbols: Keep non-numeric values in a value_symbol column.
+        stat_inf_mode: How TABLE_INF is attached to the rows.
+        star_schema: Load dimension codes only and one table per dimension.
+        prefetch_pages: Pages downloaded ahead while the current one is parsed.
+        parse_workers: Worker processes decoding and converting pages.
+        max_concurrency: Tables fetched at the same time.
+        share_connections: Borrow the process-wide HTTP connection pool.
+        requests_per_second: Request rate limit of the appId.
+        rate_burst: Requests allowed back to back under the rate limit.
+        rate_limit_state_file: File sharing the rate limit between processes.
+        adaptive_concurrency: Adapt the requests in flight to the API load.
+        plan_schema: Plan the superset schema of all tables before loading.
+        partition_by: Dimension tables are split along into code ranges.
+        partition_workers: Code ranges fetched at the same time.
+        resumable: Spool fetched pages to disk and resume after a failed page.
+        full_reload: Ignore pagination checkpoints and fetch every table whole.
     """
 
     source: SourceConfig = Field(..., description="e-Stat API source configuration")
@@ -162,17 +185,108 @@ class EstatDltConfig(BaseModel):
 
     # Optional processing configuration
     batch_size: Optional[int] = Field(
-        default=None, description="Number of records to process in each batch"
+        default=None,
+        gt=0,
+        description="Maximum number of records per Arrow record batch yielded to dlt (None: one table per page)",
+    )
+    max_retries: int = Field(
+        default=3, description="Maximum number of API retry attempts"
+    )
+    timeout: Optional[int] = Field(
+        default=None, description="API request timeout in seconds"
+    )
+
+    reuse_metadata: bool = Field(
+        default=False,
+        description="Fetch CLASS_INF only once per table and reuse it for later pages",
+    )
+    stream_chunk_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Decode responses incrementally and yield tables of at most this many rows (requires ijson)",
+    )
+    json_decoder: Literal["json", "orjson", "msgspec"] = Field(
+        default="json",
+        description="JSON decoder backend for API responses (orjson/msgspec must be installed)",
+    )
+    keep_value_symbols: bool = Field(
+        default=False,
+        description="Keep the original string of non-numeric values (e.g. special symbols) in a value_symbol column",
+    )
+    stat_inf_mode: Literal["struct", "id"] = Field(
+        default="struct",
+        description="'struct': stat_inf struct on every row | 'id': only stat_inf_id (load TABLE_INF with estat_table_info)",
+    )
+    star_schema: bool = Field(
+        default=False,
+        description="Write rows without <dimension>_metadata structs and the metadata of each code once into a <table>_<dimension> table",
+    )
+    prefetch_pages: int = Field(
+        default=0,
+        ge=0,
+        description="Number of pages downloaded ahead, concurrently when more than one, while the current page is parsed (0: no prefetch)",
+    )
+    parse_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Decode and convert pages on this many worker processes (None: parse in the current thread)",
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Fetch up to this many tables at the same time, sharing one API client; rows are still yielded table by table (None: one table at a time)",
+    )
+    share_connections: bool = Field(
+        default=False,
+        description="Borrow the HTTP connection pool of the process-wide client registry (keyed by app_id and base URL) instead of opening a new one per resource",
+    )
+    requests_per_second: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Limit API requests of the app_id to this rate with a token bucket shared by all threads of the process (None: no limit)",
+    )
+    rate_burst: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Token bucket size, i.e. requests allowed back to back (None: one second of requests)",
+    )
+    rate_limit_state_file: Optional[str] = Field(
+        default=None,
+        description="File holding the token bucket, shared under a file lock by all processes on the host using it (POSIX only)",
+    )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description="Adapt the number of API requests in flight between 1 and max_concurrency: raise it while latency stays flat, halve it on throttling, server errors, timeouts or error STATUS codes",
+    )
+    plan_schema: bool = Field(
+        default=False,
+        description="Fetch the CLASS_INF of every table through getMetaInfo before loading and yield all tables with the union of their dimensions and metadata fields, so that the destination schema is complete from the first batch",
+    )
+    partition_by: Optional[str] = Field(
+        default=None,
+        description="Split each table into code ranges of this dimension ('auto', 'time', 'area', 'cat01', ...) of about source.limit rows each, counted with cntGetFlg=Y probes, and fetch them in parallel; a range that times out is split again (None: offset pagination only)",
+    )
+    partition_workers: int = Field(
+        default=4,
+        gt=0,
+        description="Number of code ranges fetched at the same time when partition_by is set",
+    )
+    resumable: bool = Field(
+        default=False,
+        description="Spool the fetched pages of each table to the pipeline working directory; a failed page fails the extract and the next run loads the spooled pages and resumes from the next record (not with partition_by or max_concurrency > 1)",
+    )
+    full_reload: bool = Field(
+        default=False,
+        description="With resumable, ignore the checkpoints and fetch every table from the first record",
     )
-    max_retries: int = Field(default=3, description="Maximum number of API retry attempts")
-    timeout: Optional[int] = Field(default=None, description="API request timeout in seconds")
 
     # Data transformation options
     flatten_metadata: bool = Field(
         default=False, description="Whether to flatten metadata into table columns"
     )
     include_api_metadata: bool = Field(
-        default=True, description="Whether to include API response metadata in the table"
+        default=True,
+        description="Whether to include API response metadata in the table",
     )
 
     model_config = ConfigDict(
@@ -4,7 +4,13 @@ from .dlt_pipeline import create_estat_pipeline
 from .dlt_resource import create_estat_resource
 from .dlt_source import create_estat_source
 from .estat_source import estat_source
-from .estat_table import estat_table
+from .estat_table import (
+    async_estat_table,
+    estat_dimensions,
+    estat_table,
+    estat_table_info,
+)
+from .explain import LoadPlan, TablePlan, explain_load
 from .load_manager import load_estat_data
 
 __all__ = [
@@ -14,4 +20,10 @@ __all__ = [
     "create_estat_source",
     "estat_source",
     "estat_table",
+    "estat_table_info",
+    "estat_dimensions",
+    "async_estat_table",
+    "explain_load",
+    "LoadPlan",
+    "TablePlan",
 ]
@@ -0,0 +1,106 @@
+"""Pages of a table spooled to disk so that a failed load can resume."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import dlt
+import pyarrow as pa
+
+_MANIFEST = "checkpoint.json"
+
+
+def checkpoint_dir() -> Path:
+    """Checkpoint directory of the resource being extracted.
+
+    Returns:
+        Directory named after the resource in the working directory of the
+        running pipeline
+    """
+    pipeline = dlt.current.pipeline()
+    return (
+        Path(pipeline.working_dir) / "estat_checkpoints" / dlt.current.resource_name()
+    )
+
+
+class TableCheckpoint:
+    """Items of the pages of a table fetched so far, spooled to disk.
+
+    dlt discards both the items and the resource state of a failed extract,
+    so progress kept in state cannot outlive the failure. Instead, every
+    item is written to an Arrow IPC file and, once a page is complete, a
+    manifest records its TO_NUMBER and the number of items spooled up to
+    it. The next run yields those items again and fetches the next page.
+
+    Attributes:
+        directory: Directory holding the items and the manifest.
+        fingerprint: Fingerprint of the request the checkpoint is valid for.
+        items: Number of items spooled so far.
+    """
+
+    def __init__(self, directory: Union[str, Path], fingerprint: str):
+        self.directory = Path(directory)
+        self.fingerprint = fingerprint
+        self.items = 0
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read the manifest of the last completed page, if any.
+
+        Returns:
+            Dict with fingerprint, to_number, total_number and items, or
+            None when no page was completed
+        """
+        try:
+            return json.loads((self.directory / _MANIFEST).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def replay(self, items: int) -> Iterator[pa.Table]:
+        """Yield the first items spooled by an earlier run.
+
+        Args:
+            items: Number of items of the completed pages
+
+        Yields:
+            Spooled items as Arrow tables, in order
+        """
+        for index in range(items):
+            with pa.OSFile(str(self._item_path(index))) as source:
+                yield pa.ipc.open_file(source).read_all()
+        self.items = items
+
+    def append(self, item: Union[pa.Table, pa.RecordBatch]) -> None:
+        """Spool an item of the page being fetched."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with pa.OSFile(str(self._item_path(self.items)), "wb") as sink:
+            with pa.ipc.new_file(sink, item.schema) as writer:
+                writer.write(item)
+        self.items += 1
+
+    def commit(self, to_number: int, total_number: int) -> None:
+        """Record that the items spooled so far complete a page.
+
+        Args:
+            to_number: TO_NUMBER of the page
+            total_number: TOTAL_NUMBER of the request
+        """
+        manifest = {
+            "fingerprint": self.fingerprint,
+            "to_number": to_number,
+            "total_number": total_number,
+            "items": self.items,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.directory / f"{_MANIFEST}.tmp"
+        tmp_path.write_text(json.dumps(manifest))
+        os.replace(tmp_path, self.directory / _MANIFEST)
+
+    def clear(self) -> None:
+        """Remove the spooled items and the manifest."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.items = 0
+
+    def _item_path(self, index: int) -> Path:
+        return self.directory / f"{index:06d}.arrow"
@@ -1,18 +1,74 @@
 """DLT resource creation for e-Stat API data."""
 
-from typing import Any, Callable, Dict, Generator, Optional
+import asyncio
+import functools
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import dlt
-from dlt.extract.resource import DltResource
 import pyarrow as pa
+from dlt.extract.resource import DltResource
 
-from ..api.client import EstatApiClient
+from ..api.async_client import AsyncEstatApiClient
+from ..api.client import (
+    AdaptiveConcurrency,
+    EstatApiClient,
+    _get_result_info,
+    _page_limit,
+)
+from ..api.client_registry import get_client_registry
+from ..api.endpoints import ESTAT_ENDPOINTS
+from ..api.rate_limiter import get_rate_limiter
 from ..config.models import EstatDltConfig
-from ..parser import parse_response
+from ..models import TableInf
+from ..parser import (
+    ParserSession,
+    PreparedMetadata,
+    ProcessPoolParser,
+    StatInfMode,
+    StreamingResponseParser,
+    dimensions_to_arrow,
+    prepare_metadata,
+)
 from ..utils.logging import get_logger
+from ..utils.prefetch import prefetch, prefetch_each
+from .checkpoint import TableCheckpoint, checkpoint_dir
+from .partition_planner import (
+    AUTO,
+    choose_partition_dimension,
+    fetch_partition,
+    partition_param,
+    plan_partitions,
+)
+from .schema_planner import conform_to_schema, plan_superset_schema
 
 logger = get_logger(__name__)
 
+ArrowItem = Union[pa.Table, pa.RecordBatch]
+
+# Called with (TO_NUMBER, TOTAL_NUMBER) once all items of a page were yielded
+PageCallback = Callable[[int, int], None]
+
+# Called with the metadata of the table once a page with CLASS_INF was parsed
+MetadataCallback = Callable[[PreparedMetadata], None]
+
 
 def _create_api_params(config: EstatDltConfig) -> Dict[str, Any]:
     """Create API parameters from config."""
@@ -55,38 +111,738 @@ def _create_api_params(config: EstatDltConfig) -> Dict[str, Any]:
     return params
 
 
+def _reached_maximum_offset(
+    response: Dict[str, Any], maximum_offset: Optional[int]
+) -> bool:
+    """Check whether a page reaches the configured maximum offset."""
+    if not maximum_offset:
+        return False
+
+    result_info = (
+        response.get("GET_STATS_DATA", {})
+        .get("STATISTICAL_DATA", {})
+        .get("RESULT_INF", {})
+    )
+    to_number = int(result_info.get("TO_NUMBER", 0))
+    if to_number >= maximum_offset:
+        logger.info(f"Reached maximum offset: {maximum_offset}")
+        return True
+    return False
+
+
+def _fetch_table_metadata(
+    client: EstatApiClient, stats_data_id: str, params: Dict[str, Any]
+) -> PreparedMetadata:
+    """Fetch and prepare table metadata through getMetaInfo."""
+    meta_params = {
+        key: params[key] for key in ("lang", "explanationGetFlg") if key in params
+    }
+    return prepare_metadata(client.get_meta_info(stats_data_id, **meta_params))
+
+
+def _dimension_rows(
+    stats_data_id: str, metadata: PreparedMetadata
+) -> Iterator[Tuple[str, pa.Table]]:
+    """Yield the dimension tables of a table, keyed by stats_data_id and code.
+
+    Codes are local to each table, so the rows carry the stats_data_id of
+    the table they belong to.
+
+    Args:
+        stats_data_id: Statistical table ID the metadata belongs to
+        metadata: Prepared metadata of the table
+
+    Yields:
+        Tuple of the CLASS_OBJ id and the table of its codes
+    """
+    for dimension, table in dimensions_to_arrow(metadata).items():
+        if len(table) > 0:
+            yield (
+                dimension,
+                table.add_column(
+                    0, "stats_data_id", pa.repeat(pa.scalar(stats_data_id), len(table))
+                ),
+            )
+
+
+def _page_metadata(
+    session: ParserSession, response: Dict[str, Any]
+) -> Optional[PreparedMetadata]:
+    """Prepared metadata of a page, or None when it has no CLASS_INF."""
+    section = response.get("GET_STATS_DATA", {}).get("STATISTICAL_DATA", {})
+    if "TABLE_INF" not in section or "CLASS_INF" not in section:
+        return None
+    return session.prepare_metadata(section)
+
+
+def _get_updated_date(
+    client: EstatApiClient, stats_data_id: str, params: Dict[str, Any]
+) -> Optional[str]:
+    """Get UPDATED_DATE of a table through getMetaInfo, bypassing the cache.
+
+    Returns:
+        UPDATED_DATE of the table, or None if it could not be determined
+    """
+    meta_params = {
+        "statsDataId": stats_data_id,
+        "explanationGetFlg": "N",
+        "lang": params.get("lang", "J"),
+    }
+    response = client._make_request(
+        ESTAT_ENDPOINTS["meta_info"], meta_params, use_cache=False
+    )
+    table_inf = (
+        response.json()
+        .get("GET_META_INFO", {})
+        .get("METADATA_INF", {})
+        .get("TABLE_INF")
+    )
+    if not table_inf:
+        logger.warning(f"Could not get UPDATED_DATE for stats_data_id: {stats_data_id}")
+        return None
+    return TableInf.model_validate(table_inf).updated_date
+
+
+def _plan_schema(
+    client: EstatApiClient,
+    stats_data_ids: List[str],
+    params: Dict[str, Any],
+    embed_metadata: bool = True,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+) -> pa.Schema:
+    """Plan the superset schema of tables from their getMetaInfo metadata."""
+    logger.info(f"Planning the schema of {len(stats_data_ids)} tables")
+    return plan_superset_schema(
+        (
+            _fetch_table_metadata(client, stats_data_id, params)
+            for stats_data_id in stats_data_ids
+        ),
+        embed_metadata=embed_metadata,
+        keep_value_symbols=keep_value_symbols,
+        stat_inf_mode=stat_inf_mode,
+    )
+
+
+def _log_concurrency_metrics(controller: AdaptiveConcurrency) -> None:
+    """Log where the adaptive concurrency limit ended up after a run."""
+    metrics = controller.metrics()
+    logger.info(
+        f"Adaptive concurrency: limit {metrics['limit']} "
+        f"(max {controller.max_limit}), {metrics['increases']} increases, "
+        f"{metrics['decreases']} decreases"
+    )
+
+
+def _notify_page(on_page: PageCallback, response: Dict[str, Any]) -> None:
+    """Report the TO_NUMBER and TOTAL_NUMBER of a page to a callback."""
+    total_number, _, to_number = _get_result_info(response)
+    on_page(to_number, total_number)
+
+
+def _request_fingerprint(stats_data_id: str, params: Dict[str, Any]) -> str:
+    """Fingerprint of the request parameters a checkpoint is valid for."""
+    payload = json.dumps(
+        {**params, "statsDataId": stats_data_id}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _fetch_with_checkpoints(
+    fetch: Callable[[int, PageCallback], Iterable[ArrowItem]],
+    directory: Union[str, Path],
+    stats_data_id: str,
+    params: Dict[str, Any],
+    full_reload: bool = False,
+) -> Generator[ArrowItem, None, None]:
+    """Fetch a table from its checkpoint, spooling every completed page.
+
+    The items of the table are spooled to a TableCheckpoint in
+    directory/stats_data_id. When a page fails, the error is re-raised so
+    that the extract fails (dlt discards its items and state), while the
+    checkpoint stays on disk. The next run with the same request yields the
+    spooled items of the completed pages and fetches from the next record;
+    full_reload (or a changed request) starts from the first one. The
+    checkpoint is removed once the table is complete, or when the consumer
+    stops iterating it.
+
+    Args:
+        fetch: Items of the table from a startPosition, calling the
+            callback after each page
+        directory: Checkpoint directory of the resource
+        stats_data_id: Statistical table ID
+        params: API parameters of the request
+        full_reload: Ignore the checkpoint and fetch the whole table
+
+    Yields:
+        Items of the table
+    """
+    checkpoint = TableCheckpoint(
+        Path(directory) / stats_data_id, _request_fingerprint(stats_data_id, params)
+    )
+    progress = checkpoint.load()
+    if progress is not None and (
+        full_reload or progress.get("fingerprint") != checkpoint.fingerprint
+    ):
+        if not full_reload:
+            logger.info(
+                f"Request of stats_data_id {stats_data_id} changed since its "
+                "checkpoint; fetching from the first record"
+            )
+        progress = None
+    if progress is None:
+        checkpoint.clear()
+
+    start_position = 1
+    try:
+        if progress is not None:
+            start_position = int(progress["to_number"]) + 1
+            logger.info(
+                f"Resuming stats_data_id {stats_data_id} from record "
+                f"{start_position} of {progress.get('total_number')}"
+            )
+            yield from checkpoint.replay(int(progress["items"]))
+
+        for item in fetch(start_position, checkpoint.commit):
+            checkpoint.append(item)
+            yield item
+    except GeneratorExit:
+        # The consumer stopped: what it took is extracted, or discarded
+        # with the rest of the extract; fetching again is safe either way
+        checkpoint.clear()
+        raise
+    except BaseException as e:
+        logger.error(
+            f"Fetching stats_data_id {stats_data_id} failed: {e}. The next run "
+            "resumes after the last completed page"
+        )
+        raise
+    checkpoint.clear()
+
+
+def _count_rows(
+    client: EstatApiClient, stats_data_id: str, params: Dict[str, Any]
+) -> int:
+    """Count the rows of a request with a cntGetFlg=Y probe."""
+    probe_params = {
+        **params,
+        "metaGetFlg": "N",
+        "cntGetFlg": "Y",
+        "explanationGetFlg": "N",
+        "annotationGetFlg": "N",
+    }
+    response = client.get_stats_data(stats_data_id=stats_data_id, **probe_params)
+    return _get_result_info(response)[0]
+
+
+def _fetch_estat_data_partitioned(
+    client: EstatApiClient,
+    stats_data_id: str,
+    params: Dict[str, Any],
+    partition_by: str,
+    partition_workers: int = 4,
+    limit: int = 100000,
+    prefetch_pages: int = 0,
+    on_metadata: Optional[MetadataCallback] = None,
+    **fetch_options: Any,
+) -> Generator[Union[pa.Table, pa.RecordBatch], None, None]:
+    """Fetch a table in code ranges of a dimension, several at a time.
+
+    The ranges are planned from CLASS_INF and cntGetFlg=Y probes so that
+    each holds about one page (limit) of rows. Up to partition_workers
+    ranges are fetched concurrently with _fetch_estat_data and yielded in
+    CLASS_OBJ order. A range whose request times out is split again.
+
+    When the rows of the ranges do not add up to the TOTAL_NUMBER of the
+    unfiltered request, the ranges would miss or repeat rows, and the
+    table is fetched without partitions instead.
+    """
+    metadata = _fetch_table_metadata(client, stats_data_id, params)
+    if on_metadata is not None:
+        # CLASS_INF of the pages only covers the codes of their range
+        on_metadata(metadata)
+    dimension = (
+        choose_partition_dimension(metadata, params)
+        if partition_by == AUTO
+        else partition_by
+    )
+    if dimension is None:
+        logger.info(f"No dimension to partition {stats_data_id} along")
+        partitions = None
+    else:
+        if dimension not in metadata.mappings:
+            raise ValueError(
+                f"Table {stats_data_id} has no dimension {dimension!r} to "
+                "partition along"
+            )
+        if any(key.startswith(partition_param(dimension)) for key in params):
+            raise ValueError(
+                f"Cannot partition along {dimension!r}, which the request "
+                "already filters"
+            )
+        partitions = plan_partitions(
+            lambda extra: _count_rows(client, stats_data_id, {**params, **extra}),
+            dimension,
+            metadata.mappings[dimension],
+            limit,
+        )
+        if len(partitions) < 2:
+            partitions = None
+        else:
+            total_rows = _count_rows(client, stats_data_id, params)
+            planned_rows = sum(p.rows or 0 for p in partitions)
+            if planned_rows != total_rows:
+                logger.warning(
+                    f"Partitions of {stats_data_id} along {dimension} hold "
+                    f"{planned_rows} rows but the table has {total_rows}; "
+                    "fetching it without partitions"
+                )
+                partitions = None
+
+    def fetch(extra: Dict[str, str]) -> Iterable[Union[pa.Table, pa.RecordBatch]]:
+        return _fetch_estat_data(
+            client,
+            stats_data_id,
+            {**params, **extra},
+            limit=limit,
+            prefetch_pages=prefetch_pages,
+            **fetch_options,
+        )
+
+    if partitions is None:
+        yield from fetch({})
+        return
+
+    chunks = prefetch_each(
+        (fetch_partition(fetch, partition) for partition in partitions),
+        partition_workers,
+        max(prefetch_pages, 1),
+    )
+    try:
+        for items in chunks:
+            yield from items
+    finally:
+        chunks.close()
+
+
 def _fetch_estat_data(
     client: EstatApiClient,
     stats_data_id: str,
     params: Dict[str, Any],
     limit: int = 100000,
     maximum_offset: Optional[int] = None,
-) -> Generator[pa.Table, None, None]:
-    """Fetch data from e-Stat API and convert to Arrow format."""
+    reuse_metadata: bool = False,
+    stream_chunk_size: Optional[int] = None,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+    embed_metadata: bool = True,
+    batch_size: Optional[int] = None,
+    prefetch_pages: int = 0,
+    parse_workers: Optional[int] = None,
+    partition_by: Optional[str] = None,
+    partition_workers: int = 4,
+    start_position: int = 1,
+    on_page: Optional[PageCallback] = None,
+    on_metadata: Optional[MetadataCallback] = None,
+) -> Generator[Union[pa.Table, pa.RecordBatch], None, None]:
+    """Fetch data from e-Stat API and convert to Arrow format.
+
+    With reuse_metadata, CLASS_INF is taken from the first page (or from
+    getMetaInfo when metaGetFlg=N) and later pages are requested with
+    metaGetFlg=N and parsed with the cached metadata.
+
+    With stream_chunk_size, each page is decoded incrementally from the
+    response stream and yielded in tables of at most that many rows.
+
+    With batch_size, each page is converted and yielded as record batches
+    of at most that many rows instead of one table per page. Streamed pages
+    are already bounded by stream_chunk_size, so batch_size only applies to
+    pages decoded whole.
+
+    With prefetch_pages, a fetcher thread downloads up to that many pages
+    ahead while the current page is parsed and yielded. Streamed pages are
+    not prefetched.
+
+    With parse_workers, raw page bodies are decoded and converted on that
+    many worker processes while the next pages are downloaded. Pages are
+    still yielded in order. Streaming takes precedence over parse_workers.
+
+    With partition_by ("auto" or a CLASS_OBJ id such as "time", "area" or
+    "cat01"), the table is split into code ranges of that dimension, which
+    are fetched by up to partition_workers threads (see
+    _fetch_estat_data_partitioned). Each range is fetched with the options
+    above. Not supported together with maximum_offset.
+
+    With start_position, pagination starts at that record instead of the
+    first one (e.g. to resume from a checkpoint). on_page is called with
+    TO_NUMBER and TOTAL_NUMBER after the items of each page were yielded.
+    Neither is supported with partition_by.
+
+    on_metadata is called once with the metadata of the table, taken from
+    the first page parsed (or from getMetaInfo when that was requested
+    anyway). It is not called when no page was decoded in this process,
+    i.e. with parse_workers and without reuse_metadata.
+    """
+    if partition_by is not None:
+        if maximum_offset is not None:
+            raise ValueError("partition_by cannot be combined with maximum_offset")
+        if start_position != 1 or on_page is not None:
+            raise ValueError("partition_by cannot be combined with checkpoints")
+        yield from _fetch_estat_data_partitioned(
+            client=client,
+            stats_data_id=stats_data_id,
+            params=params,
+            partition_by=partition_by,
+            partition_workers=partition_workers,
+            limit=limit,
+            prefetch_pages=prefetch_pages,
+            reuse_metadata=reuse_metadata,
+            stream_chunk_size=stream_chunk_size,
+            keep_value_symbols=keep_value_symbols,
+            stat_inf_mode=stat_inf_mode,
+            embed_metadata=embed_metadata,
+            batch_size=batch_size,
+            parse_workers=parse_workers,
+            on_metadata=on_metadata,
+        )
+        return
+
+    if stream_chunk_size is None and parse_workers is not None:
+        yield from _fetch_estat_data_processes(
+            client=client,
+            stats_data_id=stats_data_id,
+            params=params,
+            limit=limit,
+            maximum_offset=maximum_offset,
+            reuse_metadata=reuse_metadata,
+            keep_value_symbols=keep_value_symbols,
+            stat_inf_mode=stat_inf_mode,
+            embed_metadata=embed_metadata,
+            batch_size=batch_size,
+            parse_workers=parse_workers,
+            start_position=start_position,
+            on_page=on_page,
+            on_metadata=on_metadata,
+        )
+        return
+
+    if stream_chunk_size is not None:
+        yield from _fetch_estat_data_streaming(
+            client=client,
+            stats_data_id=stats_data_id,
+            params=params,
+            limit=limit,
+            maximum_offset=maximum_offset,
+            reuse_metadata=reuse_metadata,
+            chunk_size=stream_chunk_size,
+            keep_value_symbols=keep_value_symbols,
+            stat_inf_mode=stat_inf_mode,
+            embed_metadata=embed_metadata,
+            start_position=start_position,
+            on_page=on_page,
+            on_metadata=on_metadata,
+        )
+        return
+
     logger.info(f"Fetching data for stats_data_id: {stats_data_id}")
 
-    # Use generator for pagination
-    for response in client.get_stats_data_generator(
-        stats_data_id=stats_data_id, limit_per_request=limit, **params
-    ):
+    metadata: Optional[PreparedMetadata] = None
+    if reuse_metadata and params.get("metaGetFlg") == "N":
+        metadata = _fetch_table_metadata(client, stats_data_id, params)
+
+    # Pages of the table share CLASS_INF; prepare it once
+    session = ParserSession()
+
+    # Use generator for pagination. The next pages are downloaded while
+    # this one is parsed and yielded: several at a time on the thread pool
+    # of the client, or a single one on a fetcher thread.
+    pages: Iterable[Dict[str, Any]] = client.get_stats_data_generator(
+        stats_data_id=stats_data_id,
+        limit_per_request=limit,
+        max_workers=max(prefetch_pages, 1),
+        meta_first_page_only=reuse_metadata,
+        max_rows=maximum_offset,
+        start_position=start_position,
+        **params,
+    )
+    if prefetch_pages == 1:
+        pages = prefetch(pages, prefetch_pages)
+
+    for response in pages:
         try:
+            if reuse_metadata and metadata is None:
+                metadata = prepare_metadata(response)
+            if on_metadata is not None:
+                page_metadata = metadata or _page_metadata(session, response)
+                if page_metadata is not None:
+                    on_metadata(page_metadata)
+                    on_metadata = None
+
+            if batch_size is not None:
+                # Parse response to bounded Arrow record batches
+                has_rows = False
+                for batch in session.iter_record_batches(
+                    response,
+                    batch_size,
+                    metadata,
+                    keep_value_symbols,
+                    stat_inf_mode,
+                    embed_metadata,
+                ):
+                    has_rows = True
+                    yield batch
+                if has_rows and on_page is not None:
+                    _notify_page(on_page, response)
+                if has_rows and _reached_maximum_offset(response, maximum_offset):
+                    break
+                continue
+
             # Parse response to Arrow table
-            table = parse_response(response)
+            table = session.parse_response(
+                response, metadata, keep_value_symbols, stat_inf_mode, embed_metadata
+            )
 
             if table is not None and len(table) > 0:
                 yield table
+                if on_page is not None:
+                    _notify_page(on_page, response)
 
                 # Check if we've reached the maximum offset
-                if maximum_offset:
-                    result_info = (
-                        response.get("GET_STATS_DATA", {})
-                        .get("STATISTICAL_DATA", {})
-                        .get("RESULT_INF", {})
-                    )
-                    to_number = int(result_info.get("TO_NUMBER", 0))
-                    if to_number >= maximum_offset:
-                        logger.info(f"Reached maximum offset: {maximum_offset}")
-                        break
+                if _reached_maximum_offset(response, maximum_offset):
+                    break
+
+        except Exception as e:
+            logger.error(f"Error processing response: {e}")
+            raise
+
+
+def _fetch_estat_data_streaming(
+    client: EstatApiClient,
+    stats_data_id: str,
+    params: Dict[str, Any],
+    limit: int = 100000,
+    maximum_offset: Optional[int] = None,
+    reuse_metadata: bool = False,
+    chunk_size: int = 10000,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+    embed_metadata: bool = True,
+    start_position: int = 1,
+    on_page: Optional[PageCallback] = None,
+    on_metadata: Optional[MetadataCallback] = None,
+) -> Generator[pa.Table, None, None]:
+    """Fetch data page by page, decoding each response body as a stream."""
+    logger.info(f"Streaming data for stats_data_id: {stats_data_id}")
+
+    metadata: Optional[PreparedMetadata] = None
+    if reuse_metadata and params.get("metaGetFlg") == "N":
+        metadata = _fetch_table_metadata(client, stats_data_id, params)
+
+    page_params = dict(params)
+    session = ParserSession()
+
+    while True:
+        parser = StreamingResponseParser(
+            chunk_size=chunk_size,
+            metadata=metadata,
+            keep_value_symbols=keep_value_symbols,
+            stat_inf_mode=stat_inf_mode,
+            embed_metadata=embed_metadata,
+            session=session,
+        )
+        response = client.get_stats_data_stream(
+            stats_data_id=stats_data_id,
+            start_position=start_position,
+            limit=_page_limit(start_position, limit, maximum_offset),
+            **page_params,
+        )
+        try:
+            for table in parser.iter_tables(response.raw):
+                yield table
+        except Exception as e:
+            logger.error(f"Error processing response: {e}")
+            raise
+        finally:
+            response.close()
+
+        if on_metadata is not None and parser.metadata is not None:
+            on_metadata(parser.metadata)
+            on_metadata = None
+
+        total_number = int(parser.result_inf.get("TOTAL_NUMBER", 0))
+        to_number = int(parser.result_inf.get("TO_NUMBER", 0))
+        logger.info(
+            f"Retrieved records {start_position} to {to_number} of {total_number}"
+        )
+        if on_page is not None and to_number:
+            on_page(to_number, total_number)
+
+        if to_number >= total_number:
+            break
+        if maximum_offset and to_number >= maximum_offset:
+            logger.info(f"Reached maximum offset: {maximum_offset}")
+            break
+
+        start_position = to_number + 1
+        if reuse_metadata:
+            metadata = parser.metadata
+            page_params["metaGetFlg"] = "N"
+
+
+def _fetch_estat_data_processes(
+    client: EstatApiClient,
+    stats_data_id: str,
+    params: Dict[str, Any],
+    limit: int = 100000,
+    maximum_offset: Optional[int] = None,
+    reuse_metadata: bool = False,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+    embed_metadata: bool = True,
+    batch_size: Optional[int] = None,
+    parse_workers: int = 1,
+    start_position: int = 1,
+    on_page: Optional[PageCallback] = None,
+    on_metadata: Optional[MetadataCallback] = None,
+) -> Generator[Union[pa.Table, pa.RecordBatch], None, None]:
+    """Fetch data page by page, parsing the page bodies on worker processes.
+
+    The first page is parsed alone to learn TOTAL_NUMBER and how many
+    records a page holds. The remaining pages are downloaded one after
+    another on a fetcher thread, so downloads overlap parsing but are not
+    parallel themselves, and handed to the pool with at most twice
+    parse_workers pages in flight. A page that does not hold the records
+    of its startPosition raises ValueError instead of skipping them.
+    """
+    logger.info(
+        f"Fetching data for stats_data_id: {stats_data_id} "
+        f"with {parse_workers} parse workers"
+    )
+
+    page_params = dict(params)
+    metadata_section: Optional[Dict[str, Any]] = None
+    if reuse_metadata:
+        # Workers get CLASS_INF once, every page is requested without it
+        meta_params = {
+            key: params[key] for key in ("lang", "explanationGetFlg") if key in params
+        }
+        metadata_section = client.get_meta_info(stats_data_id, **meta_params)[
+            "GET_META_INFO"
+        ]["METADATA_INF"]
+        page_params["metaGetFlg"] = "N"
+        if on_metadata is not None:
+            on_metadata(
+                prepare_metadata({"GET_META_INFO": {"METADATA_INF": metadata_section}})
+            )
+
+    parser = ProcessPoolParser(
+        max_workers=parse_workers,
+        metadata_section=metadata_section,
+        json_decoder=client.json_decoder,
+        keep_value_symbols=keep_value_symbols,
+        stat_inf_mode=stat_inf_mode,
+        embed_metadata=embed_metadata,
+        batch_size=batch_size,
+    )
+
+    page_size = limit
+    stop: Optional[int] = maximum_offset
+
+    def fetch(start_position: int) -> bytes:
+        return client.get_stats_data_raw(
+            stats_data_id=stats_data_id,
+            start_position=start_position,
+            limit=_page_limit(start_position, page_size, stop),
+            **page_params,
+        )
+
+    def read(buffer: pa.Buffer, result_inf: Dict[str, Any]) -> Iterator[Any]:
+        yield from parser.read(buffer)
+        to_number = int(result_inf.get("TO_NUMBER", 0))
+        if on_page is not None and to_number:
+            on_page(to_number, int(result_inf.get("TOTAL_NUMBER", 0)))
+
+    def read_page(position: int, future: Future) -> Iterator[Any]:
+        buffer, result_inf = future.result()
+        from_number = int(result_inf.get("FROM_NUMBER", 0))
+        to_number = int(result_inf.get("TO_NUMBER", 0))
+        expected_to = position + _page_limit(position, page_size, stop) - 1
+        if from_number != position or to_number < expected_to:
+            raise ValueError(
+                f"Page at startPosition {position} returned records "
+                f"{from_number} to {to_number}, expected {position} to "
+                f"{expected_to}"
+            )
+        yield from read(buffer, result_inf)
+
+    try:
+        buffer, result_inf = parser.submit(fetch(start_position)).result()
+        yield from read(buffer, result_inf)
+
+        total_number = int(result_inf.get("TOTAL_NUMBER", 0))
+        from_number = int(result_inf.get("FROM_NUMBER", 0))
+        to_number = int(result_inf.get("TO_NUMBER", 0))
+        logger.info(
+            f"Retrieved records {start_position} to {to_number} of {total_number}"
+        )
+        if not to_number:
+            return
+
+        # Every remaining page up to the total (or the maximum offset),
+        # stepping by the records the first page held
+        page_size = min(limit, to_number - from_number + 1)
+        stop = min(total_number, maximum_offset or total_number)
+        positions = range(to_number + 1, stop + 1, page_size)
+        bodies = prefetch(
+            ((position, fetch(position)) for position in positions), parse_workers
+        )
+
+        in_flight: Deque[Tuple[int, Future]] = deque()
+        try:
+            for position, body in bodies:
+                in_flight.append((position, parser.submit(body)))
+                if len(in_flight) >= 2 * parse_workers:
+                    yield from read_page(*in_flight.popleft())
+            while in_flight:
+                yield from read_page(*in_flight.popleft())
+        finally:
+            bodies.close()
+    except Exception as e:
+        logger.error(f"Error processing response: {e}")
+        raise
+    finally:
+        parser.close()
+
+
+async def _fetch_estat_data_async(
+    client: AsyncEstatApiClient,
+    stats_data_id: str,
+    params: Dict[str, Any],
+    limit: int = 100000,
+    maximum_offset: Optional[int] = None,
+) -> AsyncGenerator[pa.Table, None]:
+    """Fetch data from e-Stat API asynchronously and convert to Arrow format.
+
+    Pages are converted on a worker thread so that the event loop keeps
+    serving the requests of other resources meanwhile.
+    """
+    logger.info(f"Fetching data for stats_data_id: {stats_data_id}")
+
+    session = ParserSession()
+    async for response in client.get_stats_data_generator(
+        stats_data_id=stats_data_id,
+        limit_per_request=limit,
+        max_rows=maximum_offset,
+        **params,
+    ):
+        try:
+            table = await asyncio.to_thread(session.parse_response, response)
+
+            if table is not None and len(table) > 0:
+                yield table
+
+                if _reached_maximum_offset(response, maximum_offset):
+                    break
 
         except Exception as e:
             logger.error(f"Error processing response: {e}")
@@ -204,25 +960,140 @@ def create_estat_resource(
     # Add any additional resource kwargs
     resource_config.update(resource_kwargs)
 
+    resource_name = resource_config["name"]
+
+    if config.resumable:
+        if config.partition_by is not None:
+            raise ValueError("resumable cannot be combined with partition_by")
+        if config.max_concurrency is not None and config.max_concurrency > 1:
+            # Pages would be checkpointed when prefetched, not when extracted
+            raise ValueError("resumable cannot be combined with max_concurrency > 1")
+
     @dlt.resource(**resource_config)  # type: ignore
-    def estat_data() -> Generator[pa.Table, None, None]:
+    def estat_data() -> Generator[Any, None, None]:
         """Generator function for e-Stat data."""
         client_kwargs: Dict[str, Any] = {"app_id": config.source.app_id}
         if config.timeout is not None:
             client_kwargs["timeout"] = config.timeout
-        client = EstatApiClient(**client_kwargs)
+        if config.json_decoder != "json":
+            client_kwargs["json_decoder"] = config.json_decoder
+        if config.requests_per_second is not None:
+            client_kwargs["rate_limiter"] = get_rate_limiter(
+                config.source.app_id,
+                config.requests_per_second,
+                config.rate_burst,
+                config.rate_limit_state_file,
+            )
+        controller: Optional[AdaptiveConcurrency] = None
+        if config.adaptive_concurrency:
+            controller = AdaptiveConcurrency(max_limit=config.max_concurrency or 1)
+            client_kwargs["adaptive_concurrency"] = controller
+        if config.share_connections:
+            client = get_client_registry().client(**client_kwargs)
+        else:
+            client = EstatApiClient(**client_kwargs)
+
+        # Metadata of the pages fetched so far, for the dimension tables
+        table_metadata: Dict[str, PreparedMetadata] = {}
+
+        def fetch(
+            stats_data_id: str,
+            start_position: int = 1,
+            on_page: Optional[PageCallback] = None,
+        ) -> Iterable[Any]:
+            return _fetch_estat_data(
+                client=client,
+                stats_data_id=stats_data_id,
+                params=api_params,
+                limit=config.source.limit,
+                maximum_offset=config.source.maximum_offset,
+                reuse_metadata=config.reuse_metadata,
+                stream_chunk_size=config.stream_chunk_size,
+                keep_value_symbols=config.keep_value_symbols,
+                stat_inf_mode=config.stat_inf_mode,
+                embed_metadata=not config.star_schema,
+                batch_size=config.batch_size,
+                prefetch_pages=config.prefetch_pages,
+                parse_workers=config.parse_workers,
+                partition_by=config.partition_by,
+                partition_workers=config.partition_workers,
+                start_position=start_position,
+                on_page=on_page,
+                on_metadata=(
+                    functools.partial(table_metadata.__setitem__, stats_data_id)
+                    if config.star_schema
+                    else None
+                ),
+            )
+
+        directory = checkpoint_dir() if config.resumable else None
+
+        def fetch_table(stats_data_id: str) -> Iterable[Any]:
+            if directory is None:
+                return fetch(stats_data_id)
+            return _fetch_with_checkpoints(
+                functools.partial(fetch, stats_data_id),
+                directory,
+                stats_data_id,
+                api_params,
+                full_reload=config.full_reload,
+            )
+
+        tables: Generator[Iterable[Any], None, None] = (
+            fetch_table(stats_data_id) for stats_data_id in stats_data_ids
+        )
+        if config.max_concurrency is not None and config.max_concurrency > 1:
+            # Fetch the next tables on the shared client while the current
+            # one is yielded
+            tables = prefetch_each(
+                tables, config.max_concurrency, max(config.prefetch_pages, 1)
+            )
 
         try:
-            # Process each stats data ID
-            for stats_data_id in stats_data_ids:
-                yield from _fetch_estat_data(
-                    client=client,
-                    stats_data_id=stats_data_id,
-                    params=api_params,
-                    limit=config.source.limit,
-                    maximum_offset=config.source.maximum_offset,
+            schema: Optional[pa.Schema] = None
+            if config.plan_schema:
+                # Before the first table is fetched
+                schema = _plan_schema(
+                    client,
+                    stats_data_ids,
+                    api_params,
+                    embed_metadata=not config.star_schema,
+                    keep_value_symbols=config.keep_value_symbols,
+                    stat_inf_mode=config.stat_inf_mode,
                 )
+
+            # Process each stats data ID
+            for stats_data_id, items in zip(stats_data_ids, tables, strict=True):
+                if schema is None:
+                    yield from items
+                else:
+                    for item in items:
+                        yield conform_to_schema(item, schema)
+
+                if config.star_schema:
+                    # Dimension tables are table variants of this resource,
+                    # built from the CLASS_INF of the pages. getMetaInfo is
+                    # only needed when no page was decoded here (e.g. all
+                    # of them were replayed from a checkpoint).
+                    metadata = table_metadata.pop(stats_data_id, None)
+                    if metadata is None:
+                        metadata = _fetch_table_metadata(
+                            client, stats_data_id, api_params
+                        )
+                    for dimension, table in _dimension_rows(stats_data_id, metadata):
+                        yield dlt.mark.with_hints(
+                            table,
+                            dlt.mark.make_hints(
+                                table_name=f"{resource_name}_{dimension}",
+                                write_disposition="replace",
+                                primary_key=["stats_data_id", "code"],
+                            ),
+                            create_table_variant=True,
+                        )
         finally:
+            tables.close()
             client.close()
+            if controller is not None:
+                _log_concurrency_metrics(controller)
 
     return estat_data()
@@ -1,12 +1,19 @@
 """DLT source for e-Stat API data."""
 
-from typing import Any, Dict, Iterable, List, Optional, Union
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 import dlt
 from dlt.extract.resource import DltResource
 from dlt.sources import incremental as dlt_incremental
 
-from .estat_table import estat_table
+from ..api.cache import ResponseCache
+from ..api.client import AdaptiveConcurrency
+from ..api.rate_limiter import RateLimiter
+from ..utils.logging import get_logger
+from .estat_table import estat_dimensions, estat_table, estat_table_info
+
+logger = get_logger(__name__)
 
 
 def _normalize_stats_data_ids(
@@ -44,6 +51,73 @@ def _normalize_stats_data_ids(
     return stats_data_ids
 
 
+def _parallelize(resources: List[DltResource]) -> List[DltResource]:
+    """Let dlt extract the estat_table resources on its worker pool.
+
+    The resources must be bound to a shared concurrency_limiter, which caps
+    how many of them fetch pages at the same time. Pages of a table are
+    still fetched and yielded in order by a single generator, so per-table
+    ordering and incremental state are unchanged.
+    """
+    for resource in resources:
+        if getattr(resource, "_supports_max_concurrency", False):
+            resource.parallelize()
+    return resources
+
+
+def _with_metadata_resources(
+    resources: Iterable[DltResource],
+    app_id: str,
+    timeout: int,
+    cache: Optional[ResponseCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+) -> Iterator[DltResource]:
+    """Add the resources holding metadata left out of the table rows.
+
+    An estat_dimensions resource follows each table created with
+    star_schema=True, and one estat_table_info resource covers the tables
+    created with stat_inf_mode="id" (getMetaInfo is called with the lang of
+    the first such table).
+    """
+    id_mode_resources = []
+    for resource in resources:
+        if getattr(resource, "_stat_inf_mode", "struct") == "id":
+            id_mode_resources.append(resource)
+        yield resource
+        if getattr(resource, "_star_schema", False):
+            yield estat_dimensions(
+                stats_data_id=resource._stats_data_id,  # type: ignore[attr-defined]
+                app_id=app_id,
+                table_name=resource.name,
+                timeout=timeout,
+                cache=cache,
+                share_connections=True,
+                rate_limiter=rate_limiter,
+                adaptive_concurrency=adaptive_concurrency,
+                **{
+                    key: value
+                    for key, value in getattr(resource, "_api_params", {}).items()
+                    if key in ("lang", "explanationGetFlg")
+                },
+            )
+    if id_mode_resources:
+        lang = getattr(id_mode_resources[0], "_api_params", {}).get("lang", "J")
+        yield estat_table_info(
+            stats_data_ids=[
+                r._stats_data_id  # type: ignore[attr-defined]
+                for r in id_mode_resources
+            ],
+            app_id=app_id,
+            timeout=timeout,
+            cache=cache,
+            share_connections=True,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=adaptive_concurrency,
+            lang=lang,
+        )
+
+
 @dlt.source(name="estat")
 def estat_source(
     stats_data_ids: Union[str, List[str], Dict[str, str], None] = None,
@@ -55,6 +129,20 @@ def estat_source(
     limit: int = 100000,
     maximum_offset: Optional[int] = None,
     timeout: int = 60,
+    reuse_metadata: bool = False,
+    cache: Optional[ResponseCache] = None,
+    skip_unchanged: bool = False,
+    stream_chunk_size: Optional[int] = None,
+    json_decoder: str = "json",
+    keep_value_symbols: bool = False,
+    stat_inf_mode: str = "struct",
+    star_schema: bool = False,
+    batch_size: Optional[int] = None,
+    prefetch_pages: int = 0,
+    parse_workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
     **api_params: Any,
 ) -> Iterable[DltResource]:
     """Create a DLT source for e-Stat API statistical data.
@@ -65,6 +153,12 @@ def estat_source(
     - tables: Pass pre-configured estat_table resources directly for
       per-resource control.
 
+    Resources created by the source (tables of stats_data_ids mode,
+    estat_table_info and estat_dimensions) borrow their HTTP connections
+    from the process-wide client registry (see get_client_registry), so
+    keep-alive connections are reused across tables instead of opening a
+    new connection pool per table.
+
     Args:
         stats_data_ids: Statistical table ID(s) to fetch. Accepts:
             - str: single ID (resource name: "estat_{id}")
@@ -88,6 +182,62 @@ def estat_source(
         limit: Maximum records per API request (pagination size).
         maximum_offset: Maximum total records to fetch. None for unlimited.
         timeout: API request timeout in seconds.
+        reuse_metadata: Fetch CLASS_INF only once per table and request
+            later pages with metaGetFlg=N.
+            Applied to all resources when using stats_data_ids mode.
+        cache: Optional on-disk response cache shared by all resources.
+            Applied to all resources when using stats_data_ids mode.
+        skip_unchanged: Compare each table's UPDATED_DATE (getMetaInfo) with
+            the value recorded by the previous successful run when the
+            resource is extracted, and load nothing for unchanged tables
+            (see estat_table). Applied to all resources
+            when using stats_data_ids mode; in tables mode, the
+            skip_unchanged setting of each estat_table is honored.
+        stream_chunk_size: Decode responses incrementally from the HTTP
+            stream and yield tables of at most this many rows (requires
+            ijson). Applied to all resources when using stats_data_ids mode.
+        json_decoder: JSON decoder backend for API responses ("json",
+            "orjson" or "msgspec"). Applied to all resources when using
+            stats_data_ids mode.
+        keep_value_symbols: Add a value_symbol column holding the original
+            string of values that are not numbers. Applied to all resources
+            when using stats_data_ids mode.
+        stat_inf_mode: "struct" attaches the stat_inf struct to every row;
+            "id" keeps only a stat_inf_id column and adds an
+            estat_table_info resource with one row per table. Applied to
+            all resources when using stats_data_ids mode; in tables mode,
+            estat_table_info is added for the tables created with
+            stat_inf_mode="id".
+        star_schema: Load rows with dimension codes only and add an
+            estat_dimensions resource per table writing one table per
+            dimension ("{resource_name}_{dimension}"). Applied to all
+            resources when using stats_data_ids mode; in tables mode, the
+            star_schema setting of each estat_table is honored.
+        batch_size: Yield each page as Arrow record batches of at most this
+            many rows. Applied to all resources when using stats_data_ids
+            mode.
+        prefetch_pages: Download up to this many pages ahead of parsing on
+            a fetcher thread. Applied to all resources when using
+            stats_data_ids mode.
+        parse_workers: Decode and convert pages on this many worker
+            processes. Applied to all resources when using stats_data_ids
+            mode.
+        max_concurrency: Extract up to this many tables at the same time.
+            The table resources are parallelized on dlt's extract worker
+            pool and share one cap, so that at most max_concurrency of them
+            fetch pages at once. dlt runs at most ``[extract] workers``
+            (default 5) parallelized resources at a time; raise it as well
+            for a higher cap. Pages of each table stay in order. Applies in
+            both modes.
+        rate_limiter: Token bucket shared by all resources, limiting the
+            request rate of the appId (see get_rate_limiter). With a
+            state_file, parallel pipelines on the host share it too.
+            Applied to all resources when using stats_data_ids mode.
+        adaptive_concurrency: Controller shared by all resources, adapting
+            the number of requests in flight to the latency and throttling
+            of the API (AIMD). Its max_limit should not exceed
+            max_concurrency. Applied to all resources when using
+            stats_data_ids mode.
         **api_params: Additional e-Stat API parameters passed directly to the
             API request (e.g., lang, lvTab, cdTab, cdTime, cdArea, cdTimeFrom,
             cdTimeTo, metaGetFlg, cntGetFlg, replaceSpChars, cat01, etc.).
@@ -97,10 +247,15 @@ def estat_source(
         (the @dlt.source decorator wraps the generator into a DltSource).
 
     Raises:
-        ValueError: If both stats_data_ids and tables are provided,
+        ValueError: If max_concurrency is not positive,
+            if both stats_data_ids and tables are provided,
             if neither is provided, if tables is an empty list,
             or if tables is used with write_disposition/primary_key/
-            incremental/api_params arguments.
+            incremental/reuse_metadata/cache/rate_limiter/
+            adaptive_concurrency/skip_unchanged/
+            stream_chunk_size/json_decoder/keep_value_symbols/
+            stat_inf_mode/star_schema/batch_size/prefetch_pages/
+            parse_workers/api_params arguments.
 
     Example:
         ```python
@@ -132,6 +287,8 @@ def estat_source(
         pipeline.run(source)
         ```
     """
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
     if tables is not None and stats_data_ids is not None:
         raise ValueError(
             "Cannot specify both stats_data_ids and tables. Use one or the other."
@@ -141,12 +298,29 @@ def estat_source(
     if tables is not None and not tables:
         raise ValueError("tables must not be empty")
 
+    limiter: Optional[threading.BoundedSemaphore] = None
+    if max_concurrency is not None:
+        limiter = threading.BoundedSemaphore(max_concurrency)
+
     if tables is not None:
         conflicting = {
             # True if non-default value is specified
             "write_disposition": write_disposition != "replace",
             "primary_key": primary_key is not None,
             "incremental": incremental is not None,
+            "reuse_metadata": reuse_metadata,
+            "cache": cache is not None,
+            "rate_limiter": rate_limiter is not None,
+            "adaptive_concurrency": adaptive_concurrency is not None,
+            "skip_unchanged": skip_unchanged,
+            "stream_chunk_size": stream_chunk_size is not None,
+            "json_decoder": json_decoder != "json",
+            "keep_value_symbols": keep_value_symbols,
+            "stat_inf_mode": stat_inf_mode != "struct",
+            "star_schema": star_schema,
+            "batch_size": batch_size is not None,
+            "prefetch_pages": prefetch_pages != 0,
+            "parse_workers": parse_workers is not None,
             "api_params": bool(api_params),  # True if not empty
         }
         found = [k for k, v in conflicting.items() if v]
@@ -166,14 +340,27 @@ def estat_source(
                 bind_kwargs["maximum_offset"] = maximum_offset
             if "timeout" not in table_explicit:
                 bind_kwargs["timeout"] = timeout
+            if limiter is not None and getattr(
+                table, "_supports_max_concurrency", False
+            ):
+                bind_kwargs["concurrency_limiter"] = limiter
             table.bind(**bind_kwargs)
-            yield table
+            table_args = getattr(table, "_table_args", None)
+            if table_args is not None:
+                table_args.update(
+                    (key, value)
+                    for key, value in bind_kwargs.items()
+                    if key in table_args
+                )
+        if limiter is not None:
+            tables = _parallelize(tables)
+        yield from _with_metadata_resources(tables, app_id, timeout)
         return
 
     assert stats_data_ids is not None  # guaranteed by validation above
     id_map = _normalize_stats_data_ids(stats_data_ids)
-    for resource_name, stats_data_id in id_map.items():
-        yield estat_table(
+    resources = [
+        estat_table(
             stats_data_id=stats_data_id,
             app_id=app_id,
             table_name=resource_name,
@@ -183,5 +370,33 @@ def estat_source(
             limit=limit,
             maximum_offset=maximum_offset,
             timeout=timeout,
+            reuse_metadata=reuse_metadata,
+            cache=cache,
+            skip_unchanged=skip_unchanged,
+            stream_chunk_size=stream_chunk_size,
+            json_decoder=json_decoder,
+            keep_value_symbols=keep_value_symbols,
+            stat_inf_mode=stat_inf_mode,
+            star_schema=star_schema,
+            batch_size=batch_size,
+            prefetch_pages=prefetch_pages,
+            parse_workers=parse_workers,
+            share_connections=True,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=adaptive_concurrency,
             **api_params,
         )
+        for resource_name, stats_data_id in id_map.items()
+    ]
+    if limiter is not None:
+        for resource in resources:
+            resource.bind(concurrency_limiter=limiter)
+        resources = _parallelize(resources)
+    yield from _with_metadata_resources(
+        resources,
+        app_id,
+        timeout,
+        cache,
+        rate_limiter,
+        adaptive_concurrency,
+    )
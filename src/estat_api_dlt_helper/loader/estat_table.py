@@ -1,14 +1,43 @@
 """DLT resource for a single e-Stat statistical table."""
 
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import dlt
 import pyarrow as pa
 from dlt.extract.resource import DltResource
 from dlt.sources import incremental as dlt_incremental
 
-from ..api.client import EstatApiClient
-from .dlt_resource import _fetch_estat_data
+from ..api.async_client import AsyncEstatApiClient
+from ..api.cache import ResponseCache
+from ..api.client import AdaptiveConcurrency, EstatApiClient
+from ..api.client_registry import get_client_registry
+from ..api.rate_limiter import RateLimiter
+from ..parser import table_info_to_arrow
+from ..utils.concurrency import Limiter, limit_concurrency
+from ..utils.logging import get_logger
+from .checkpoint import checkpoint_dir
+from .dlt_resource import (
+    PageCallback,
+    _dimension_rows,
+    _fetch_estat_data,
+    _fetch_estat_data_async,
+    _fetch_table_metadata,
+    _fetch_with_checkpoints,
+    _get_updated_date,
+)
+
+logger = get_logger(__name__)
 
 _UNSET: Any = object()
 
@@ -27,6 +56,64 @@ def _build_api_params(**params: Any) -> Dict[str, Any]:
     return {k: v for k, v in params.items() if v is not None}
 
 
+def _resolve_table_args(
+    limit: Any, maximum_offset: Any, timeout: Any
+) -> Tuple[Set[str], int, Optional[int], int]:
+    """Resolve sentinel defaults and record which arguments were explicit."""
+    _table_explicit_args: Set[str] = set()
+    if limit is not _UNSET:
+        _table_explicit_args.add("limit")
+    else:
+        limit = 100000
+    if maximum_offset is not _UNSET:
+        _table_explicit_args.add("maximum_offset")
+    else:
+        maximum_offset = None
+    if timeout is not _UNSET:
+        _table_explicit_args.add("timeout")
+    else:
+        timeout = 60
+    return _table_explicit_args, limit, maximum_offset, timeout
+
+
+def _prepare_table(
+    stats_data_id: str,
+    table_name: Optional[str],
+    write_disposition: str,
+    primary_key: Optional[Union[str, List[str]]],
+    api_params: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Validate the table arguments and build resource config and API params."""
+    if not stats_data_id or not stats_data_id.strip():
+        raise ValueError("stats_data_id must not be empty")
+
+    resource_name = table_name or f"estat_{stats_data_id}"
+
+    merged_params = {**_DEFAULT_API_PARAMS, **api_params}
+    params = _build_api_params(**merged_params)
+
+    resource_config: Dict[str, Any] = {
+        "name": resource_name,
+        "write_disposition": write_disposition,
+        "schema_contract": {
+            "tables": "evolve",
+            "columns": "evolve",
+            "data_type": "freeze",
+        },
+    }
+    if primary_key is not None:
+        resource_config["primary_key"] = primary_key
+
+    return resource_config, params
+
+
+def _make_client(share_connections: bool, **client_kwargs: Any) -> EstatApiClient:
+    """Create an API client, borrowing the shared connection pool if requested."""
+    if share_connections:
+        return get_client_registry().client(**client_kwargs)
+    return EstatApiClient(**client_kwargs)
+
+
 def estat_table(
     stats_data_id: str,
     app_id: str = dlt.secrets.value,
@@ -37,6 +124,24 @@ def estat_table(
     limit: int = _UNSET,  # type: ignore[assignment]  # sentinel to detect explicit args
     maximum_offset: Optional[int] = _UNSET,  # type: ignore[assignment]  # sentinel to detect explicit args
     timeout: int = _UNSET,  # type: ignore[assignment]  # sentinel to detect explicit args
+    reuse_metadata: bool = False,
+    cache: Optional[ResponseCache] = None,
+    skip_unchanged: bool = False,
+    stream_chunk_size: Optional[int] = None,
+    json_decoder: str = "json",
+    keep_value_symbols: bool = False,
+    stat_inf_mode: str = "struct",
+    star_schema: bool = False,
+    batch_size: Optional[int] = None,
+    prefetch_pages: int = 0,
+    parse_workers: Optional[int] = None,
+    share_connections: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+    partition_by: Optional[str] = None,
+    partition_workers: int = 4,
+    resumable: bool = False,
+    full_reload: bool = False,
     **api_params: Any,
 ) -> DltResource:
     """Create a DLT resource for a single e-Stat statistical table.
@@ -62,12 +167,85 @@ def estat_table(
         limit: Maximum records per API request (pagination size).
         maximum_offset: Maximum total records to fetch. None for unlimited.
         timeout: API request timeout in seconds.
+        reuse_metadata: Fetch CLASS_INF only with the first page (or via
+            getMetaInfo when metaGetFlg="N") and request later pages with
+            metaGetFlg=N, parsing them with the cached metadata.
+        cache: Optional on-disk response cache. Repeated requests for the
+            same pages are served from local disk instead of the API.
+        skip_unchanged: Check the table's UPDATED_DATE through getMetaInfo
+            (with the lang of the request) when the resource is extracted,
+            and skip the data fetch when it equals the value recorded in
+            the source state by the previous successful run. With
+            write_disposition="replace" the skipped run is loaded in append
+            mode so that the table is not truncated.
+        stream_chunk_size: Decode each response incrementally from the
+            HTTP stream and yield tables of at most this many rows instead
+            of loading whole pages into memory. Requires ijson. Streamed
+            responses bypass the response cache.
+        json_decoder: JSON decoder backend for API responses ("json",
+            "orjson" or "msgspec"). orjson and msgspec must be installed.
+        keep_value_symbols: Add a dictionary-encoded value_symbol column
+            holding the original string of values that are not numbers.
+            Special symbols such as "-" or "x" are only returned by the
+            API with replaceSpChars="0".
+        stat_inf_mode: "struct" attaches the full stat_inf struct to every
+            row. "id" replaces it with a stat_inf_id column; the table
+            information is then loaded once per table by estat_table_info
+            (estat_source adds it automatically).
+        star_schema: Leave out the <dimension>_metadata struct columns so
+            that rows carry only the dimension codes and value. The
+            metadata of each code is loaded once per table by
+            estat_dimensions (estat_source adds it automatically).
+        batch_size: Convert each page into Arrow record batches of at most
+            this many rows instead of one table per page, so that memory
+            scales with the batch size and dlt can start writing earlier.
+        prefetch_pages: Download up to this many pages ahead while the
+            current page is parsed and yielded, so that network and
+            parsing overlap; more than one are fetched concurrently
+            (0: no prefetch).
+        parse_workers: Decode and convert pages on this many worker
+            processes, which return Arrow IPC streams to the resource.
+            Useful when JSON decoding is the bottleneck (large limit,
+            fast network). Ignored with stream_chunk_size.
+        share_connections: Borrow the HTTP connection pool of the
+            process-wide client registry (see get_client_registry) instead
+            of opening new connections for this resource. estat_source
+            enables it for the resources it creates.
+        rate_limiter: Token bucket limiting the request rate of the
+            resource. Share one limiter (e.g. get_rate_limiter(app_id, ...))
+            between resources of the same appId.
+        adaptive_concurrency: Controller adapting the number of requests
+            in flight to the latency and throttling of the API. Share one
+            controller between the resources extracted concurrently.
+        partition_by: Split the table into code ranges of a dimension
+            ("time", "area", "cat01", ... or "auto" for the unfiltered one
+            with the most codes) instead of paginating it with offsets
+            only. The ranges are planned from CLASS_INF and cntGetFlg=Y
+            probes to hold about limit rows each and fetched in parallel;
+            a range whose request times out is split again. Not supported
+            with maximum_offset.
+        partition_workers: Number of code ranges fetched at the same time
+            when partition_by is set.
+        resumable: Spool the pages fetched so far to the working
+            directory of the pipeline. A page that fails after retries
+            is raised, failing the extract, and the next run with the
+            same request loads the spooled pages and fetches from the
+            next record. Not supported with partition_by or incremental.
+        full_reload: With resumable, ignore the checkpoint and fetch the
+            table from the first record.
         **api_params: Additional e-Stat API parameters (e.g., lang, cdTab,
             cdArea, cdTime, cdTimeFrom, cdTimeTo, cat01, etc.).
 
     Returns:
         DLT resource yielding PyArrow tables.
 
+    Raises:
+        ValueError: If stats_data_id is empty, stat_inf_mode is not
+            "struct" or "id", batch_size, parse_workers or
+            partition_workers is not positive, prefetch_pages is
+            negative, or resumable is combined with partition_by or
+            incremental.
+
     Example:
         ```python
         import dlt
@@ -86,63 +264,394 @@ def estat_table(
         pipeline.run(resource)
         ```
     """
-    _table_explicit_args: set[str] = set()
-    if limit is not _UNSET:
-        _table_explicit_args.add("limit")
-    else:
-        limit = 100000
-    if maximum_offset is not _UNSET:
-        _table_explicit_args.add("maximum_offset")
-    else:
-        maximum_offset = None
-    if timeout is not _UNSET:
-        _table_explicit_args.add("timeout")
-    else:
-        timeout = 60
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if prefetch_pages < 0:
+        raise ValueError("prefetch_pages must not be negative")
+    if parse_workers is not None and parse_workers < 1:
+        raise ValueError("parse_workers must be at least 1")
+    if partition_workers < 1:
+        raise ValueError("partition_workers must be at least 1")
+    if resumable and partition_by is not None:
+        raise ValueError("resumable cannot be combined with partition_by")
+    if resumable and incremental is not None:
+        # cdTimeFrom follows the cursor and is part of the fingerprint
+        raise ValueError("resumable cannot be combined with incremental")
+    if stat_inf_mode not in ("struct", "id"):
+        raise ValueError(
+            f"stat_inf_mode must be 'struct' or 'id', got {stat_inf_mode!r}"
+        )
+    _table_explicit_args, limit, maximum_offset, timeout = _resolve_table_args(
+        limit, maximum_offset, timeout
+    )
+    resource_config, params = _prepare_table(
+        stats_data_id, table_name, write_disposition, primary_key, api_params
+    )
+
+    @dlt.resource(**resource_config)  # type: ignore[arg-type]
+    def _estat_data(
+        app_id: str = app_id,
+        time_incremental: Optional[dlt_incremental[str]] = incremental,
+        limit: int = limit,
+        maximum_offset: Optional[int] = maximum_offset,
+        timeout: int = timeout,
+        concurrency_limiter: Optional[Limiter] = None,
+    ) -> Generator[Union[pa.Table, pa.RecordBatch], None, None]:
+        request_params = dict(params)
+        if time_incremental is not None and time_incremental.start_value is not None:
+            request_params["cdTimeFrom"] = time_incremental.start_value
 
+        client = _make_client(
+            share_connections,
+            app_id=app_id,
+            timeout=timeout,
+            cache=cache,
+            json_decoder=json_decoder,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=adaptive_concurrency,
+        )
+        try:
+            updated_date: Optional[str] = None
+            if skip_unchanged:
+                updated_date = _get_updated_date(client, stats_data_id, request_params)
+                # dlt resets the resource state of replace resources before
+                # extracting them, so the dates are kept in the source state
+                recorded = (
+                    dlt.current.source_state()
+                    .get("updated_dates", {})
+                    .get(dlt.current.resource_name())
+                )
+                if updated_date is not None and recorded == updated_date:
+                    logger.info(
+                        f"Skipping stats_data_id {stats_data_id}: "
+                        f"unchanged since {updated_date}"
+                    )
+                    if write_disposition == "replace":
+                        # An empty replace would truncate the table; load
+                        # nothing in append mode for this run instead
+                        yield dlt.mark.with_hints(
+                            [], dlt.mark.make_hints(write_disposition="append")
+                        )
+                    return
+
+            def fetch(
+                start_position: int = 1, on_page: Optional[PageCallback] = None
+            ) -> Iterable[Union[pa.Table, pa.RecordBatch]]:
+                return _fetch_estat_data(
+                    client=client,
+                    stats_data_id=stats_data_id,
+                    params=request_params,
+                    limit=limit,
+                    maximum_offset=maximum_offset,
+                    reuse_metadata=reuse_metadata,
+                    stream_chunk_size=stream_chunk_size,
+                    keep_value_symbols=keep_value_symbols,
+                    stat_inf_mode="id" if stat_inf_mode == "id" else "struct",
+                    embed_metadata=not star_schema,
+                    batch_size=batch_size,
+                    prefetch_pages=prefetch_pages,
+                    parse_workers=parse_workers,
+                    partition_by=partition_by,
+                    partition_workers=partition_workers,
+                    start_position=start_position,
+                    on_page=on_page,
+                )
+
+            items: Iterable[Union[pa.Table, pa.RecordBatch]]
+            if resumable:
+                items = _fetch_with_checkpoints(
+                    fetch,
+                    checkpoint_dir(),
+                    stats_data_id,
+                    request_params,
+                    full_reload=full_reload,
+                )
+            else:
+                items = fetch()
+            if concurrency_limiter is not None:
+                # Bound by estat_source(max_concurrency=...)
+                items = limit_concurrency(items, concurrency_limiter)
+            yield from items
+
+            if updated_date is not None:
+                dlt.current.source_state().setdefault("updated_dates", {})[
+                    dlt.current.resource_name()
+                ] = updated_date
+        finally:
+            client.close()
+
+    _estat_data._table_explicit_args = _table_explicit_args  # type: ignore[attr-defined]
+    _estat_data._stats_data_id = stats_data_id  # type: ignore[attr-defined]
+    _estat_data._skip_unchanged = skip_unchanged  # type: ignore[attr-defined]
+    _estat_data._stat_inf_mode = stat_inf_mode  # type: ignore[attr-defined]
+    _estat_data._star_schema = star_schema  # type: ignore[attr-defined]
+    _estat_data._api_params = params  # type: ignore[attr-defined]
+    _estat_data._supports_max_concurrency = True  # type: ignore[attr-defined]
+    # Pagination settings read by explain_load (updated by estat_source)
+    _estat_data._table_args = {  # type: ignore[attr-defined]
+        "app_id": app_id,
+        "limit": limit,
+        "maximum_offset": maximum_offset,
+        "timeout": timeout,
+        "reuse_metadata": reuse_metadata,
+    }
+    return _estat_data
+
+
+def estat_table_info(
+    stats_data_ids: List[str],
+    app_id: str = dlt.secrets.value,
+    timeout: int = 60,
+    cache: Optional[ResponseCache] = None,
+    share_connections: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+    **api_params: Any,
+) -> DltResource:
+    """Create a DLT resource with the TABLE_INF of e-Stat statistical tables.
+
+    Yields one row per table with the fields of the stat_inf struct
+    (id, stat_name, title, survey_date, updated_date, ...), fetched through
+    getMetaInfo. Tables loaded with stat_inf_mode="id" carry only a
+    stat_inf_id column, which joins to the id column of this table.
+    Rows are merged on id, so repeated runs update the table information
+    in place.
+
+    Args:
+        stats_data_ids: Statistical table IDs to describe.
+        app_id: e-Stat API application ID.
+        timeout: API request timeout in seconds.
+        cache: Optional on-disk response cache.
+        share_connections: Borrow the HTTP connection pool of the
+            process-wide client registry.
+        rate_limiter: Token bucket limiting the request rate.
+        adaptive_concurrency: Controller of the requests in flight.
+        **api_params: Additional getMetaInfo parameters (lang,
+            explanationGetFlg).
+
+    Returns:
+        DLT resource named "estat_table_info" yielding PyArrow tables.
+
+    Example:
+        ```python
+        import dlt
+        from estat_api_dlt_helper import estat_table, estat_table_info
+
+        pipeline = dlt.pipeline(destination="duckdb", dataset_name="estat_data")
+        pipeline.run([
+            estat_table(stats_data_id="0000020201", stat_inf_mode="id"),
+            estat_table_info(stats_data_ids=["0000020201"]),
+        ])
+        ```
+    """
+    if not stats_data_ids:
+        raise ValueError("stats_data_ids must not be empty")
+
+    params = {**_DEFAULT_API_PARAMS, **api_params}
+
+    @dlt.resource(
+        name="estat_table_info",
+        write_disposition="merge",
+        primary_key="id",
+    )
+    def _estat_table_info(
+        app_id: str = app_id,
+        timeout: int = timeout,
+    ) -> Generator[pa.Table, None, None]:
+        client = _make_client(
+            share_connections,
+            app_id=app_id,
+            timeout=timeout,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=adaptive_concurrency,
+        )
+        try:
+            for stats_data_id in stats_data_ids:
+                metadata = _fetch_table_metadata(client, stats_data_id, params)
+                yield table_info_to_arrow(metadata)
+        finally:
+            client.close()
+
+    return _estat_table_info
+
+
+def estat_dimensions(
+    stats_data_id: str,
+    app_id: str = dlt.secrets.value,
+    table_name: Optional[str] = None,
+    timeout: int = 60,
+    cache: Optional[ResponseCache] = None,
+    share_connections: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+    adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+    **api_params: Any,
+) -> DltResource:
+    """Create a DLT resource with the dimension tables of an e-Stat table.
+
+    Fetches CLASS_INF through getMetaInfo and writes one table per
+    CLASS_OBJ (tab, cat01, ..., area, time) named
+    "{table_name}_{dimension}", with one row per code and the fields of the
+    <dimension>_metadata struct (code, name, level, unit, ...). Rows are
+    keyed by stats_data_id and code, like the dimension tables of
+    create_estat_resource(star_schema=True). Tables loaded with
+    star_schema=True join to them on ``<dimension> = code``.
+
+    Args:
+        stats_data_id: Statistical table ID.
+        app_id: e-Stat API application ID.
+        table_name: Name of the fact table. Defaults to
+            "estat_{stats_data_id}".
+        timeout: API request timeout in seconds.
+        cache: Optional on-disk response cache.
+        share_connections: Borrow the HTTP connection pool of the
+            process-wide client registry.
+        rate_limiter: Token bucket limiting the request rate.
+        adaptive_concurrency: Controller of the requests in flight.
+        **api_params: Additional getMetaInfo parameters (lang,
+            explanationGetFlg).
+
+    Returns:
+        DLT resource named "{table_name}_dimensions" yielding PyArrow tables.
+
+    Example:
+        ```python
+        import dlt
+        from estat_api_dlt_helper import estat_dimensions, estat_table
+
+        pipeline = dlt.pipeline(destination="duckdb", dataset_name="estat_data")
+        pipeline.run([
+            estat_table(stats_data_id="0000020201", star_schema=True),
+            estat_dimensions(stats_data_id="0000020201"),
+        ])
+        ```
+    """
     if not stats_data_id or not stats_data_id.strip():
         raise ValueError("stats_data_id must not be empty")
 
-    resource_name = table_name or f"estat_{stats_data_id}"
+    fact_table = table_name or f"estat_{stats_data_id}"
+    params = {**_DEFAULT_API_PARAMS, **api_params}
 
-    merged_params = {**_DEFAULT_API_PARAMS, **api_params}
-    params = _build_api_params(**merged_params)
+    @dlt.resource(name=f"{fact_table}_dimensions", write_disposition="replace")
+    def _estat_dimensions(
+        app_id: str = app_id,
+        timeout: int = timeout,
+    ) -> Generator[Any, None, None]:
+        client = _make_client(
+            share_connections,
+            app_id=app_id,
+            timeout=timeout,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            adaptive_concurrency=adaptive_concurrency,
+        )
+        try:
+            metadata = _fetch_table_metadata(client, stats_data_id, params)
+        finally:
+            client.close()
+        for dimension, table in _dimension_rows(stats_data_id, metadata):
+            yield dlt.mark.with_hints(
+                table,
+                dlt.mark.make_hints(
+                    table_name=f"{fact_table}_{dimension}",
+                    primary_key=["stats_data_id", "code"],
+                ),
+                create_table_variant=True,
+            )
 
-    resource_config: Dict[str, Any] = {
-        "name": resource_name,
-        "write_disposition": write_disposition,
-        "schema_contract": {
-            "tables": "evolve",
-            "columns": "evolve",
-            "data_type": "freeze",
-        },
-    }
-    if primary_key is not None:
-        resource_config["primary_key"] = primary_key
+    return _estat_dimensions
+
+
+def async_estat_table(
+    stats_data_id: str,
+    app_id: str = dlt.secrets.value,
+    table_name: Optional[str] = None,
+    write_disposition: str = "replace",
+    primary_key: Optional[Union[str, List[str]]] = None,
+    incremental: Optional[dlt_incremental[str]] = None,
+    limit: int = _UNSET,  # type: ignore[assignment]  # sentinel to detect explicit args
+    maximum_offset: Optional[int] = _UNSET,  # type: ignore[assignment]  # sentinel to detect explicit args
+    timeout: int = _UNSET,  # type: ignore[assignment]  # sentinel to detect explicit args
+    rate_limiter: Optional[RateLimiter] = None,
+    **api_params: Any,
+) -> DltResource:
+    """Create an async DLT resource for a single e-Stat statistical table.
+
+    Same as estat_table, but the resource is an async generator backed by
+    AsyncEstatApiClient. dlt runs async resources on its event loop, so
+    many tables can keep requests in flight from a single thread instead
+    of occupying one thread per blocking resource.
+
+    Pages are converted to Arrow on a worker thread. Responses are not
+    cached: estat_table's cache option has no async counterpart.
+
+    Requires the optional ``httpx`` dependency
+    (``pip install estat-api-dlt-helper[async]``).
+
+    Args:
+        stats_data_id: Statistical table ID to fetch.
+        app_id: e-Stat API application ID.
+        table_name: Resource/table name. Defaults to "estat_{stats_data_id}".
+        write_disposition: How to write data to destination.
+        primary_key: Primary key column(s) for merge disposition.
+        incremental: Optional incremental loading configuration
+            (see estat_table).
+        limit: Maximum records per API request (pagination size).
+        maximum_offset: Maximum total records to fetch. None for unlimited.
+        timeout: API request timeout in seconds.
+        rate_limiter: Token bucket limiting the request rate of the
+            resource. Share one limiter (e.g. get_rate_limiter(app_id, ...))
+            between resources of the same appId.
+        **api_params: Additional e-Stat API parameters.
+
+    Returns:
+        DLT resource yielding PyArrow tables.
+
+    Example:
+        ```python
+        import dlt
+        from estat_api_dlt_helper import async_estat_table, estat_source
+
+        source = estat_source(
+            tables=[
+                async_estat_table(stats_data_id="0000020201"),
+                async_estat_table(stats_data_id="0004028584"),
+            ],
+        )
+        pipeline = dlt.pipeline(destination="duckdb", dataset_name="estat_data")
+        pipeline.run(source)
+        ```
+    """
+    _table_explicit_args, limit, maximum_offset, timeout = _resolve_table_args(
+        limit, maximum_offset, timeout
+    )
+    resource_config, params = _prepare_table(
+        stats_data_id, table_name, write_disposition, primary_key, api_params
+    )
 
     @dlt.resource(**resource_config)  # type: ignore[arg-type]
-    def _estat_data(
+    async def _estat_data(
         app_id: str = app_id,
         time_incremental: Optional[dlt_incremental[str]] = incremental,
         limit: int = limit,
         maximum_offset: Optional[int] = maximum_offset,
         timeout: int = timeout,
-    ) -> Generator[pa.Table, None, None]:
+    ) -> AsyncGenerator[pa.Table, None]:
         request_params = dict(params)
         if time_incremental is not None and time_incremental.start_value is not None:
             request_params["cdTimeFrom"] = time_incremental.start_value
 
-        client = EstatApiClient(app_id=app_id, timeout=timeout)
-        try:
-            yield from _fetch_estat_data(
+        async with AsyncEstatApiClient(
+            app_id=app_id, timeout=timeout, rate_limiter=rate_limiter
+        ) as client:
+            async for table in _fetch_estat_data_async(
                 client=client,
                 stats_data_id=stats_data_id,
                 params=request_params,
                 limit=limit,
                 maximum_offset=maximum_offset,
-            )
-        finally:
-            client.close()
+            ):
+                yield table
 
     _estat_data._table_explicit_args = _table_explicit_args  # type: ignore[attr-defined]
     return _estat_data
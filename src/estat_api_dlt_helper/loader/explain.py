@@ -0,0 +1,272 @@
+"""Count-first planning of the requests a load will send (dry run)."""
+
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from dlt.extract.resource import DltResource
+from dlt.extract.source import DltSource
+
+from ..api.client import EstatApiClient, _get_result_info, _page_limit
+from ..config.models import EstatDltConfig
+from ..utils.logging import get_logger
+from .dlt_resource import _count_rows, _create_api_params
+
+logger = get_logger(__name__)
+
+ExplainTarget = Union[EstatDltConfig, DltResource, DltSource]
+
+
+class TablePlan(NamedTuple):
+    """Requests, rows and payload a table will cost.
+
+    Attributes:
+        stats_data_id: Statistical table ID.
+        total_rows: Rows matching the request (TOTAL_NUMBER).
+        rows: Rows that will be fetched, capped by maximum_offset.
+        page_limits: ``limit`` of each getStatsData request, in order.
+        bytes_per_row: Response bytes per row, measured on a sample page.
+        metadata_bytes: Bytes of TABLE_INF and CLASS_INF in a response.
+        metadata_pages: Number of pages requested with metaGetFlg=Y.
+    """
+
+    stats_data_id: str
+    total_rows: int
+    rows: int
+    page_limits: List[int]
+    bytes_per_row: float = 0.0
+    metadata_bytes: int = 0
+    metadata_pages: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Number of getStatsData requests."""
+        return len(self.page_limits)
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Estimated size of all response bodies."""
+        return round(
+            self.rows * self.bytes_per_row + self.metadata_pages * self.metadata_bytes
+        )
+
+
+class LoadPlan(NamedTuple):
+    """Plan of a load, one TablePlan per table.
+
+    Attributes:
+        tables: Plans of the tables, in load order.
+    """
+
+    tables: List[TablePlan]
+
+    @property
+    def requests(self) -> int:
+        """Number of getStatsData requests of all tables."""
+        return sum(table.requests for table in self.tables)
+
+    @property
+    def rows(self) -> int:
+        """Number of rows fetched from all tables."""
+        return sum(table.rows for table in self.tables)
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Estimated size of all response bodies."""
+        return sum(table.estimated_bytes for table in self.tables)
+
+    def summary(self) -> str:
+        """Describe the plan, one line per table and a total line."""
+        lines = [
+            f"{table.stats_data_id}: {table.rows} of {table.total_rows} rows, "
+            f"{table.requests} requests, ~{table.estimated_bytes} bytes"
+            for table in self.tables
+        ]
+        lines.append(
+            f"Total: {self.rows} rows, {self.requests} requests, "
+            f"~{self.estimated_bytes} bytes"
+        )
+        return "\n".join(lines)
+
+
+def plan_pages(
+    total_rows: int, limit: int, maximum_offset: Optional[int] = None
+) -> List[int]:
+    """Compute the ``limit`` of every page of a table.
+
+    The last page is trimmed so that no rows beyond maximum_offset are
+    requested, the same way the loaders paginate.
+
+    Args:
+        total_rows: Rows matching the request (TOTAL_NUMBER)
+        limit: Number of records per request
+        maximum_offset: Maximum total records to fetch (None: unlimited)
+
+    Returns:
+        limit of each request, in order (empty when there are no rows)
+    """
+    rows = min(total_rows, maximum_offset) if maximum_offset else total_rows
+    return [_page_limit(start, limit, rows) for start in range(1, rows + 1, limit)]
+
+
+def explain_table(
+    client: EstatApiClient,
+    stats_data_id: str,
+    params: Dict[str, Any],
+    limit: int = 100000,
+    maximum_offset: Optional[int] = None,
+    reuse_metadata: bool = False,
+    sample_rows: int = 100,
+) -> TablePlan:
+    """Plan the requests of a table without downloading its data.
+
+    Rows are counted with a cntGetFlg=Y probe. The response size per row
+    is measured on a sample page of sample_rows rows requested without
+    metadata, and the size of the metadata on getMetaInfo.
+
+    Args:
+        client: API client
+        stats_data_id: Statistical table ID
+        params: getStatsData parameters of the load
+        limit: Number of records per request
+        maximum_offset: Maximum total records to fetch
+        reuse_metadata: Whether only the first page carries metadata
+        sample_rows: Rows of the sample page (0: do not sample)
+
+    Returns:
+        TablePlan of the table
+    """
+    total_rows = _count_rows(client, stats_data_id, params)
+    page_limits = plan_pages(total_rows, limit, maximum_offset)
+    plan = TablePlan(
+        stats_data_id=stats_data_id,
+        total_rows=total_rows,
+        rows=sum(page_limits),
+        page_limits=page_limits,
+    )
+    if not page_limits:
+        return plan
+
+    if sample_rows > 0:
+        body = client.get_stats_data_raw(
+            stats_data_id=stats_data_id,
+            **{
+                **params,
+                "metaGetFlg": "N",
+                "cntGetFlg": "N",
+                "limit": min(sample_rows, page_limits[0]),
+            },
+        )
+        _, from_number, to_number = _get_result_info(json.loads(body))
+        sampled = to_number - from_number + 1 if to_number else 0
+        if sampled > 0:
+            plan = plan._replace(bytes_per_row=len(body) / sampled)
+
+    if params.get("metaGetFlg", "Y") == "Y":
+        meta_params = {
+            key: params[key] for key in ("lang", "explanationGetFlg") if key in params
+        }
+        section = client.get_meta_info(stats_data_id, **meta_params)["GET_META_INFO"][
+            "METADATA_INF"
+        ]
+        plan = plan._replace(
+            metadata_bytes=len(json.dumps(section, ensure_ascii=False).encode()),
+            metadata_pages=1 if reuse_metadata else len(page_limits),
+        )
+    return plan
+
+
+def _explain_resource(
+    resource: DltResource, app_id: Optional[str], sample_rows: int
+) -> TablePlan:
+    """Plan the requests of an estat_table resource."""
+    table_args: Dict[str, Any] = resource._table_args  # type: ignore[attr-defined]
+    resource_app_id = table_args["app_id"]
+    app_id = app_id or (resource_app_id if isinstance(resource_app_id, str) else None)
+    if app_id is None:
+        raise ValueError(f"app_id is required to explain resource {resource.name!r}")
+
+    client = EstatApiClient(app_id=app_id, timeout=table_args["timeout"])
+    try:
+        return explain_table(
+            client,
+            resource._stats_data_id,  # type: ignore[attr-defined]
+            resource._api_params,  # type: ignore[attr-defined]
+            limit=table_args["limit"],
+            maximum_offset=table_args["maximum_offset"],
+            reuse_metadata=table_args["reuse_metadata"],
+            sample_rows=sample_rows,
+        )
+    finally:
+        client.close()
+
+
+def explain_load(
+    target: ExplainTarget, app_id: Optional[str] = None, sample_rows: int = 100
+) -> LoadPlan:
+    """Plan the requests, rows and bytes of a load without loading (dry run).
+
+    Only cntGetFlg=Y probes, one sample page per table and getMetaInfo
+    are requested. The plan follows the pagination of the loaders
+    (``limit`` and ``maximum_offset``); the filters added by incremental
+    loading and by partition_by are not taken into account.
+
+    Args:
+        target: EstatDltConfig, an estat_table resource or an estat_source
+            source (its estat_table_info and estat_dimensions resources
+            are left out)
+        app_id: e-Stat API application ID, overriding the one of the
+            resources (required for estat_table resources whose app_id is
+            resolved from secrets at run time)
+        sample_rows: Rows of the sample page of each table (0: do not
+            estimate the payload)
+
+    Returns:
+        LoadPlan with one TablePlan per table
+
+    Raises:
+        ValueError: If no app_id is available for a resource
+
+    Example:
+        ```python
+        from estat_api_dlt_helper import estat_source, explain_load
+
+        plan = explain_load(estat_source(["0000020201"], app_id="YOUR_APP_ID"))
+        print(plan.summary())
+        ```
+    """
+    if isinstance(target, EstatDltConfig):
+        stats_data_ids = target.source.statsDataId
+        if isinstance(stats_data_ids, str):
+            stats_data_ids = [stats_data_ids]
+        params = _create_api_params(target)
+        client_kwargs: Dict[str, Any] = {"app_id": app_id or target.source.app_id}
+        if target.timeout is not None:
+            client_kwargs["timeout"] = target.timeout
+        client = EstatApiClient(**client_kwargs)
+        try:
+            tables = [
+                explain_table(
+                    client,
+                    stats_data_id,
+                    params,
+                    limit=target.source.limit,
+                    maximum_offset=target.source.maximum_offset,
+                    reuse_metadata=target.reuse_metadata,
+                    sample_rows=sample_rows,
+                )
+                for stats_data_id in stats_data_ids
+            ]
+        finally:
+            client.close()
+    elif isinstance(target, DltSource):
+        tables = [
+            _explain_resource(resource, app_id, sample_rows)
+            for resource in target.resources.values()
+            if hasattr(resource, "_table_args")
+        ]
+    else:
+        tables = [_explain_resource(target, app_id, sample_rows)]
+
+    plan = LoadPlan(tables)
+    logger.info(f"Load plan:\n{plan.summary()}")
+    return plan
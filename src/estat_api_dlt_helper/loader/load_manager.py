@@ -6,6 +6,7 @@ from ..config.models import EstatDltConfig
 from ..utils.logging import get_logger
 from .dlt_pipeline import create_estat_pipeline
 from .dlt_resource import create_estat_resource
+from .explain import explain_load
 
 logger = get_logger(__name__)
 
@@ -14,8 +15,9 @@ def load_estat_data(
     config: EstatDltConfig,
     *,
     credentials: Optional[Dict[str, Any]] = None,
+    dry_run: bool = False,
     **kwargs: Any,
-) -> Any:  # dlt.common.pipeline.LoadInfo
+) -> Any:  # dlt.common.pipeline.LoadInfo or LoadPlan
     """
     Load e-Stat API data to the specified destination using DLT.
 
@@ -25,10 +27,13 @@ def load_estat_data(
     Args:
         config: Configuration for e-Stat API source and DLT destination
         credentials: Optional credentials to override destination credentials
+        dry_run: Do not load; count the rows of each table and return the
+            planned requests, rows and bytes (see explain_load)
         **kwargs: Additional arguments passed to pipeline.run()
 
     Returns:
-        LoadInfo object containing information about the load operation
+        LoadInfo object containing information about the load operation,
+        or the LoadPlan with dry_run
 
     Example:
         ```python
@@ -54,6 +59,9 @@ def load_estat_data(
         print(info)
         ```
     """
+    if dry_run:
+        return explain_load(config)
+
     logger.info("Starting e-Stat data load process")
 
     try:
@@ -0,0 +1,185 @@
+"""Partitioning of large statistical tables along a dimension."""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from requests import Timeout
+
+from ..parser import PreparedMetadata
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Value of partition_by choosing the dimension with the most codes
+AUTO = "auto"
+
+
+def partition_param(dimension: str) -> str:
+    """Name of the getStatsData parameter filtering a dimension by code.
+
+    Args:
+        dimension: CLASS_OBJ id, e.g. "time", "area", "tab" or "cat01"
+
+    Returns:
+        Parameter name, e.g. "cdTime", "cdArea", "cdTab" or "cdCat01"
+    """
+    return f"cd{dimension[0].upper()}{dimension[1:]}"
+
+
+class Partition(NamedTuple):
+    """Contiguous range of codes of a dimension, fetched as one request set.
+
+    Attributes:
+        dimension: CLASS_OBJ id the table is split along.
+        codes: Codes of the range, in CLASS_OBJ order.
+        rows: Number of rows counted by the planner, if known.
+    """
+
+    dimension: str
+    codes: Tuple[str, ...]
+    rows: Optional[int] = None
+
+    @property
+    def params(self) -> Dict[str, str]:
+        """getStatsData parameters restricting a request to the range."""
+        param = partition_param(self.dimension)
+        if len(self.codes) == 1:
+            return {param: self.codes[0]}
+        return {f"{param}From": self.codes[0], f"{param}To": self.codes[-1]}
+
+    def split(self) -> Optional[Tuple["Partition", "Partition"]]:
+        """Split the range into two halves, or None for a single code."""
+        if len(self.codes) < 2:
+            return None
+        middle = len(self.codes) // 2
+        return (
+            Partition(self.dimension, self.codes[:middle]),
+            Partition(self.dimension, self.codes[middle:]),
+        )
+
+
+def choose_partition_dimension(
+    metadata: PreparedMetadata, params: Dict[str, Any]
+) -> Optional[str]:
+    """Choose the dimension to split a table along.
+
+    Time, area and catNN dimensions that the request does not filter yet
+    are candidates; the one with the most codes gives the finest split.
+
+    Args:
+        metadata: Prepared metadata of the table (e.g. from getMetaInfo)
+        params: getStatsData parameters of the request
+
+    Returns:
+        CLASS_OBJ id, or None if no dimension has at least two codes
+    """
+    candidates = [
+        dimension
+        for dimension in metadata.mappings
+        if (dimension in ("time", "area") or dimension.startswith("cat"))
+        and not any(key.startswith(partition_param(dimension)) for key in params)
+    ]
+    candidates = [d for d in candidates if len(metadata.mappings[d]) > 1]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda dimension: len(metadata.mappings[dimension]))
+
+
+def plan_partitions(
+    count: Callable[[Dict[str, str]], int],
+    dimension: str,
+    codes: Iterable[str],
+    max_rows: int,
+) -> List[Partition]:
+    """Split the codes of a dimension into ranges of at most max_rows rows.
+
+    Starting from the whole range, a range whose row count (probed with
+    cntGetFlg=Y through ``count``) exceeds max_rows is halved until every
+    range fits or holds a single code. Empty ranges are left out. Single
+    codes with more rows than max_rows are paginated when fetched.
+
+    Codes are kept in the order given, which should be the CLASS_OBJ order
+    e-Stat applies to ``cdXxxFrom``/``cdXxxTo`` ranges; sorting them as
+    strings need not match it.
+
+    Args:
+        count: Number of rows of a request with the given extra parameters
+        dimension: CLASS_OBJ id to split along
+        codes: Codes of the dimension, in CLASS_OBJ order
+        max_rows: Target number of rows per partition, e.g. the page size
+
+    Returns:
+        Partitions in CLASS_OBJ order, with their row counts
+
+    Raises:
+        ValueError: If codes is empty or max_rows is not positive
+    """
+    if max_rows < 1:
+        raise ValueError("max_rows must be at least 1")
+    ordered = tuple(codes)
+    if not ordered:
+        raise ValueError(f"Dimension {dimension!r} has no codes")
+
+    partitions: List[Partition] = []
+    pending = [Partition(dimension, ordered)]
+    while pending:
+        partition = pending.pop(0)
+        rows = count(partition.params)
+        if rows == 0:
+            continue
+        halves = partition.split()
+        if rows <= max_rows or halves is None:
+            partitions.append(partition._replace(rows=rows))
+        else:
+            pending[0:0] = halves
+
+    logger.info(
+        f"Planned {len(partitions)} partitions along {dimension} "
+        f"({sum(p.rows or 0 for p in partitions)} rows)"
+    )
+    return partitions
+
+
+def fetch_partition(
+    fetch: Callable[[Dict[str, str]], Iterable[T]], partition: Partition
+) -> Generator[T, None, None]:
+    """Fetch a partition, splitting it again when a request times out.
+
+    A range that times out before yielding anything is halved and both
+    halves are fetched in turn (recursively). Once items of the range were
+    yielded, or when the range is a single code, the timeout is raised.
+
+    Args:
+        fetch: Items of a request with the given extra parameters
+        partition: Range to fetch
+
+    Yields:
+        Items of the partition, in order
+    """
+    yielded = False
+    try:
+        for item in fetch(partition.params):
+            yielded = True
+            yield item
+    except Timeout:
+        halves = partition.split()
+        if yielded or halves is None:
+            raise
+        logger.warning(
+            f"Request for {partition.dimension} {partition.codes[0]}.."
+            f"{partition.codes[-1]} timed out; splitting it"
+        )
+        for half in halves:
+            yield from fetch_partition(fetch, half)
@@ -0,0 +1,138 @@
+"""Superset schema of several statistical tables, planned before loading."""
+
+from typing import Dict, Iterable, List, TypeVar, Union
+
+import pyarrow as pa
+
+from ..parser import PreparedMetadata, StatInfMode
+from ..utils.arrow_utils import cast_to_type
+
+ArrowData = TypeVar("ArrowData", pa.Table, pa.RecordBatch)
+
+# Struct fields every metadata struct starts with (see MetadataProcessor)
+_LEADING_FIELDS = ("code", "name")
+
+
+def _union_struct_types(struct_types: List[pa.StructType]) -> pa.StructType:
+    """Union of the fields of struct types, in MetadataProcessor order."""
+    fields: Dict[str, pa.Field] = {}
+    for struct_type in struct_types:
+        for field in struct_type:
+            fields.setdefault(field.name, field)
+    leading = [fields[name] for name in _LEADING_FIELDS if name in fields]
+    others = [fields[name] for name in sorted(fields) if name not in _LEADING_FIELDS]
+    return pa.struct(leading + others)
+
+
+def plan_superset_schema(
+    metadata: Iterable[PreparedMetadata],
+    embed_metadata: bool = True,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+) -> pa.Schema:
+    """Plan the schema covering the rows of several statistical tables.
+
+    When one resource loads several tables, a later table may bring a
+    dimension or a metadata field (e.g. ``parent_code`` in
+    ``time_metadata``) that the earlier ones did not have, and dlt then
+    migrates the destination schema in the middle of the load. Planning
+    the union of all dimensions and metadata struct fields from the
+    CLASS_INF of every table up front lets the first batch carry the final
+    schema (see conform_to_schema).
+
+    The ``unit`` column is not described by CLASS_INF and is not planned.
+
+    Args:
+        metadata: Prepared metadata of every table (e.g. from getMetaInfo)
+        embed_metadata: Plan the ``<dimension>_metadata`` struct columns
+        keep_value_symbols: Plan the value_symbol column
+        stat_inf_mode: "struct" plans the stat_inf column, "id" the
+            stat_inf_id column
+
+    Returns:
+        Schema with the dimension code columns, value (and value_symbol),
+        the metadata struct columns and the table information column
+
+    Raises:
+        ValueError: If metadata is empty
+    """
+    struct_types: Dict[str, List[pa.StructType]] = {}
+    stat_inf_type = None
+    for table_metadata in metadata:
+        if stat_inf_type is None:
+            stat_inf_type = table_metadata.stat_inf_type
+        for dimension, struct_type in table_metadata.struct_types.items():
+            struct_types.setdefault(dimension, []).append(struct_type)
+    if stat_inf_type is None:
+        raise ValueError("metadata must not be empty")
+
+    fields: List[pa.Field] = [
+        pa.field(dimension, pa.string()) for dimension in struct_types
+    ]
+    fields.append(pa.field("value", pa.float64()))
+    if keep_value_symbols:
+        fields.append(pa.field("value_symbol", pa.dictionary(pa.int32(), pa.string())))
+    if embed_metadata:
+        fields.extend(
+            pa.field(f"{dimension}_metadata", _union_struct_types(types))
+            for dimension, types in struct_types.items()
+        )
+    if stat_inf_mode == "id":
+        fields.append(pa.field("stat_inf_id", pa.string()))
+    else:
+        fields.append(pa.field("stat_inf", stat_inf_type))
+    return pa.schema(fields)
+
+
+def _conform_column(
+    column: Union[pa.Array, pa.ChunkedArray], target: pa.DataType
+) -> Union[pa.Array, pa.ChunkedArray]:
+    if isinstance(column, pa.ChunkedArray):
+        return pa.chunked_array(
+            [cast_to_type(chunk, target) for chunk in column.chunks], type=target
+        )
+    return cast_to_type(column, target)
+
+
+def conform_to_schema(data: ArrowData, schema: pa.Schema) -> ArrowData:
+    """Give a table or record batch the columns of a planned schema.
+
+    Planned columns are in schema order: columns missing from the data are
+    filled with nulls and struct columns get the planned fields (missing
+    fields as nulls). Columns the plan does not have (e.g. unit) are kept
+    unchanged, before value if they came before it in the data.
+
+    Args:
+        data: Parsed rows of one table
+        schema: Schema from plan_superset_schema
+
+    Returns:
+        Data of the same kind with the planned columns
+    """
+    value_index = data.schema.get_field_index("value")
+    unplanned = [
+        index
+        for index, field in enumerate(data.schema)
+        if schema.get_field_index(field.name) < 0
+    ]
+
+    fields: List[pa.Field] = []
+    columns: List[Union[pa.Array, pa.ChunkedArray]] = []
+
+    def add_unplanned(before_value: bool) -> None:
+        for index in unplanned:
+            if (index < value_index) is before_value:
+                fields.append(data.schema.field(index))
+                columns.append(data.column(index))
+
+    for field in schema:
+        if field.name == "value":
+            add_unplanned(before_value=True)
+        index = data.schema.get_field_index(field.name)
+        if index >= 0:
+            columns.append(_conform_column(data.column(index), field.type))
+        else:
+            columns.append(pa.nulls(data.num_rows, field.type))
+        fields.append(field)
+    add_unplanned(before_value=False)
+    return type(data).from_arrays(columns, schema=pa.schema(fields))
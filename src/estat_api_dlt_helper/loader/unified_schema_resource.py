@@ -11,16 +11,16 @@ Background:
     causes PyArrow to fail when concatenating tables due to schema mismatches.
 
 Solution:
-    This module implements a unified schema approach using Pydantic models
-    that define the superset of all possible fields. Missing fields are
-    automatically set to None, ensuring consistent schema across all datasets.
+    This module derives a canonical Arrow schema from the unified Pydantic
+    models, which define the superset of all possible fields. Each parsed
+    page is cast to it column by column: missing columns and struct fields
+    are filled with nulls, ensuring consistent schema across all datasets.
 
 Key Features:
     - Unified Pydantic models for all metadata types
     - Automatic handling of missing fields
-    - Efficient PyArrow-native processing (no pandas dependency)
-    - Batch processing for optimal memory usage
-    - Support for unknown fields via extra_dimensions and extra_metadata
+    - Arrow tables all the way to dlt (no per-row conversion)
+    - Unknown dimension columns are kept as they are
 
 Example:
     >>> from estat_api_dlt_helper import EstatDltConfig
@@ -36,142 +36,109 @@ Example:
     >>> pipeline.run(resource)  # No schema errors!
 """
 
-from collections import OrderedDict
-from typing import Any, Callable, Dict, Generator, Optional
+from functools import cache
+from typing import Any, Callable, Dict, Generator, Iterable, Optional
 
 import dlt
 import pyarrow as pa
-from pydantic import ValidationError
 
-from ..api.client import EstatApiClient
+from ..api.client import AdaptiveConcurrency, EstatApiClient
+from ..api.client_registry import get_client_registry
+from ..api.rate_limiter import get_rate_limiter
 from ..config.models import EstatDltConfig
-from ..models.unified_schema import (
-    UnifiedAreaMetadata,
-    UnifiedCategoryMetadata,
-    UnifiedEstatRecord,
-    UnifiedStatInf,
-    UnifiedTabMetadata,
-    UnifiedTimeMetadata,
-)
+from ..models import TableInf
+from ..models.unified_schema import UnifiedEstatRecord
+from ..utils.arrow_utils import cast_to_type, create_arrow_struct_type
 from ..utils.logging import get_logger
+from ..utils.prefetch import prefetch, prefetch_each
+from .schema_planner import conform_to_schema
 
 logger = get_logger(__name__)
 
+# Model fields holding unknown values; the Arrow path keeps unknown
+# dimension columns as they are and drops unknown metadata attributes
+_EXTRA_FIELDS = ("extra_dimensions", "extra_metadata", "extra_attributes")
+
+# Shape of metadata columns of dimensions the unified models do not name
+_GENERIC_METADATA_COLUMN = "cat01_metadata"
 
-def _convert_to_unified_metadata(
-    field_name: str, metadata_dict: Dict[str, Any]
-) -> Optional[Any]:
-    """Convert metadata dictionary to unified metadata model."""
-    if not metadata_dict:
-        return None
-
-    try:
-        if field_name == "time":
-            return UnifiedTimeMetadata(**metadata_dict)
-        elif field_name == "area":
-            return UnifiedAreaMetadata(**metadata_dict)
-        elif field_name == "tab":
-            return UnifiedTabMetadata(**metadata_dict)
-        elif field_name.startswith("cat"):
-            return UnifiedCategoryMetadata(**metadata_dict)
-        else:
-            # Generic category metadata for unknown field types
-            return UnifiedCategoryMetadata(**metadata_dict)
-    except ValidationError as e:
-        logger.warning(f"Failed to convert {field_name} metadata: {e}")
-        return None
 
+@cache
+def unified_arrow_schema() -> pa.Schema:
+    """Canonical Arrow schema of the unified resource.
 
-def _convert_arrow_to_unified_records(
-    arrow_table: pa.Table,
-) -> Generator[Dict[str, Any], None, None]:
-    """Convert Arrow table to unified records using native PyArrow operations.
+    Derived once from UnifiedEstatRecord: dimension codes are strings,
+    value is float64 and every ``<dimension>_metadata`` column is a struct
+    with all the fields of its unified metadata model. stat_inf has the
+    type the parser derives from TableInf.
 
-    This optimized version avoids pandas conversion and uses efficient
-    batch processing for better performance with large datasets.
-    Returns dictionaries with preserved column order.
+    Returns:
+        Superset schema of all known columns
     """
+    fields = []
+    for field in create_arrow_struct_type(UnifiedEstatRecord):
+        if field.name in _EXTRA_FIELDS:
+            continue
+        if field.name == "stat_inf":
+            field = pa.field("stat_inf", create_arrow_struct_type(TableInf))
+        elif pa.types.is_struct(field.type):
+            field = pa.field(
+                field.name,
+                pa.struct([f for f in field.type if f.name not in _EXTRA_FIELDS]),
+            )
+        fields.append(field)
+    return pa.schema(fields)
 
-    # Pre-analyze column types once to avoid repeated checks
-    # IMPORTANT: Preserve the original column order from arrow_table
-    metadata_columns = {}
-    dimension_columns = []
-    known_columns = set(UnifiedEstatRecord.model_fields.keys())
-    extra_dimension_columns = []
-
-    # Store original column order for preserving sequence
-    original_column_order = list(arrow_table.column_names)
-
-    for col_name in original_column_order:  # Use original order
-        if col_name.endswith("_metadata"):
-            field_name = col_name.replace("_metadata", "")
-            metadata_columns[col_name] = field_name
-        elif col_name in known_columns:
-            dimension_columns.append(col_name)
-        elif col_name != "stat_inf" and not col_name.endswith("_metadata"):
-            extra_dimension_columns.append(col_name)
-
-    # Process in batches for better memory efficiency
-    batch_size = 1000
-    num_rows = len(arrow_table)
-
-    for batch_start in range(0, num_rows, batch_size):
-        batch_end = min(batch_start + batch_size, num_rows)
-        batch_table = arrow_table.slice(batch_start, batch_end - batch_start)
-
-        # Convert batch to dictionaries using pyarrow (much faster than pandas)
-        batch_dicts = batch_table.to_pylist()
-
-        for row_dict in batch_dicts:
-            # Use OrderedDict to preserve column order
-            record_data = OrderedDict()
-            extra_dimensions = OrderedDict()
-            extra_metadata = OrderedDict()
-
-            # Process columns in their original order
-            for col_name in original_column_order:
-                if col_name not in row_dict or row_dict[col_name] is None:
-                    continue
-
-                value = row_dict[col_name]
-
-                # Handle different column types
-                if col_name == "stat_inf":
-                    try:
-                        record_data[col_name] = UnifiedStatInf(**value)
-                    except (ValidationError, TypeError) as e:
-                        logger.warning(f"Failed to convert stat_inf: {e}")
-                        continue
-                elif col_name.endswith("_metadata"):
-                    field_name = metadata_columns.get(col_name)
-                    if isinstance(value, dict) and field_name:
-                        unified_metadata = _convert_to_unified_metadata(
-                            field_name, value
-                        )
-                        if unified_metadata is not None:
-                            record_data[col_name] = unified_metadata
-                        else:
-                            extra_metadata[col_name] = value
-                    else:
-                        extra_metadata[col_name] = value
-                elif col_name in known_columns:
-                    record_data[col_name] = value
-                else:
-                    extra_dimensions[col_name] = value
 
-            # Add extra fields if any
-            if extra_dimensions:
-                record_data["extra_dimensions"] = extra_dimensions
-            if extra_metadata:
-                record_data["extra_metadata"] = extra_metadata
+def _unified_field(field: pa.Field) -> pa.Field:
+    """Field of a parsed column with its type in the unified schema."""
+    schema = unified_arrow_schema()
+    index = schema.get_field_index(field.name)
+    if index >= 0:
+        return schema.field(index)
+    if field.name.endswith("_metadata"):
+        return pa.field(field.name, schema.field(_GENERIC_METADATA_COLUMN).type)
+    return field
+
+
+def _cast_column(column: pa.ChunkedArray, target_type: pa.DataType) -> pa.ChunkedArray:
+    """Cast every chunk of a column to a unified type."""
+    return pa.chunked_array(
+        [cast_to_type(chunk, target_type) for chunk in column.chunks],
+        type=target_type,
+    )
+
 
-            try:
-                # Validate with UnifiedEstatRecord but yield the ordered dict
-                UnifiedEstatRecord(**record_data)  # Validate only
-                yield dict(record_data)  # Convert OrderedDict to dict for DLT
-            except ValidationError as e:
-                logger.warning(f"Failed to create unified record: {e}")
-                continue
+def _to_unified_table(table: pa.Table) -> pa.Table:
+    """Cast the columns of a parsed table to the unified schema.
+
+    Every column of the unified schema is present, in schema order, with
+    its canonical type: columns absent from the table are added as nulls,
+    missing struct fields are filled with nulls and extra struct fields are
+    dropped. Columns the models do not know follow in their original order:
+    dimension codes as they are, metadata with the shape of category
+    metadata.
+
+    Args:
+        table: Table parsed by parse_response
+
+    Returns:
+        Table whose columns match the unified schema
+    """
+    schema = unified_arrow_schema()
+    fields = list(schema)
+    columns = [
+        _cast_column(table.column(field.name), field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    for field, column in zip(table.schema, table.columns, strict=True):
+        if schema.get_field_index(field.name) < 0:
+            field = _unified_field(field)
+            fields.append(field)
+            columns.append(_cast_column(column, field.type))
+    return pa.Table.from_arrays(columns, schema=pa.schema(fields))
 
 
 def _fetch_unified_estat_data(
@@ -180,24 +147,49 @@ def _fetch_unified_estat_data(
     params: Dict[str, Any],
     limit: int = 100000,
     maximum_offset: Optional[int] = None,
-) -> Generator[Dict[str, Any], None, None]:
-    """Fetch data from e-Stat API and convert to unified records."""
+    reuse_metadata: bool = False,
+    prefetch_pages: int = 0,
+) -> Generator[pa.Table, None, None]:
+    """Fetch data from e-Stat API and cast each page to the unified schema.
+
+    With prefetch_pages, a fetcher thread downloads up to that many pages
+    ahead while the current page is converted.
+    """
     logger.info(f"Fetching unified data for stats_data_id: {stats_data_id}")
 
     # Import here to avoid circular import
-    from ..parser import parse_response
+    from ..parser import ParserSession, PreparedMetadata, prepare_metadata
+    from .dlt_resource import _fetch_table_metadata
+
+    metadata: Optional[PreparedMetadata] = None
+    if reuse_metadata and params.get("metaGetFlg") == "N":
+        metadata = _fetch_table_metadata(client, stats_data_id, params)
+
+    # Pages of the table share CLASS_INF; prepare it once
+    session = ParserSession()
 
     # Use generator for pagination
-    for response in client.get_stats_data_generator(
-        stats_data_id=stats_data_id, limit_per_request=limit, **params
-    ):
+    pages: Iterable[Dict[str, Any]] = client.get_stats_data_generator(
+        stats_data_id=stats_data_id,
+        limit_per_request=limit,
+        meta_first_page_only=reuse_metadata,
+        max_rows=maximum_offset,
+        **params,
+    )
+    if prefetch_pages:
+        # Download the next pages while this one is converted and yielded
+        pages = prefetch(pages, prefetch_pages)
+
+    for response in pages:
         try:
+            if reuse_metadata and metadata is None:
+                metadata = prepare_metadata(response)
+
             # Parse response to Arrow table first
-            arrow_table = parse_response(response)
+            arrow_table = session.parse_response(response, metadata)
 
             if arrow_table is not None and len(arrow_table) > 0:
-                # Convert Arrow table to unified records
-                yield from _convert_arrow_to_unified_records(arrow_table)
+                yield _to_unified_table(arrow_table)
 
                 # Check if we've reached the maximum offset
                 if maximum_offset:
@@ -241,9 +233,13 @@ def create_unified_estat_resource(
     prevents PyArrow "Schema at index X was different" errors when loading
     multiple statsDataIds.
 
-    The unified schema includes all possible fields from all datasets, with
-    missing fields automatically set to None. Column order from the original
-    data is preserved.
+    Each page is yielded as an Arrow table cast to the unified schema (see
+    unified_arrow_schema): every known column is present in schema order and
+    metadata structs have all possible fields from all datasets, with
+    missing columns and fields set to null. stat_inf and the
+    ``<dimension>_metadata`` columns are struct columns, which dlt loads as
+    JSON columns rather than flattening them into ``<column>__<field>``
+    columns as earlier versions did.
 
     Args:
         config: Configuration for e-Stat API source and destination
@@ -301,7 +297,11 @@ def create_unified_estat_resource(
     """
 
     # Prepare API parameters
-    from ..loader.dlt_resource import _create_api_params
+    from ..loader.dlt_resource import (
+        _create_api_params,
+        _log_concurrency_metrics,
+        _plan_schema,
+    )
 
     api_params = _create_api_params(config)
 
@@ -354,28 +354,72 @@ def create_unified_estat_resource(
     resource_config.update(resource_kwargs)
 
     @dlt.resource(**resource_config)
-    def unified_estat_data() -> Generator[Dict[str, Any], None, None]:
+    def unified_estat_data() -> Generator[pa.Table, None, None]:
         """Generator function for unified e-Stat data."""
         client_kwargs: Dict[str, Any] = {"app_id": config.source.app_id}
         if config.timeout is not None:
             client_kwargs["timeout"] = config.timeout
-        client = EstatApiClient(**client_kwargs)
+        if config.json_decoder != "json":
+            client_kwargs["json_decoder"] = config.json_decoder
+        if config.requests_per_second is not None:
+            client_kwargs["rate_limiter"] = get_rate_limiter(
+                config.source.app_id,
+                config.requests_per_second,
+                config.rate_burst,
+                config.rate_limit_state_file,
+            )
+        controller: Optional[AdaptiveConcurrency] = None
+        if config.adaptive_concurrency:
+            controller = AdaptiveConcurrency(max_limit=config.max_concurrency or 1)
+            client_kwargs["adaptive_concurrency"] = controller
+        if config.share_connections:
+            client = get_client_registry().client(**client_kwargs)
+        else:
+            client = EstatApiClient(**client_kwargs)
+
+        tables: Generator[Iterable[pa.Table], None, None] = (
+            _fetch_unified_estat_data(
+                client=client,
+                stats_data_id=stats_data_id,
+                params=api_params,
+                limit=config.source.limit,
+                maximum_offset=config.source.maximum_offset,
+                reuse_metadata=config.reuse_metadata,
+                prefetch_pages=config.prefetch_pages,
+            )
+            for stats_data_id in stats_data_ids
+        )
+        if config.max_concurrency is not None and config.max_concurrency > 1:
+            # Fetch the next tables on the shared client while the current
+            # one is yielded
+            tables = prefetch_each(
+                tables, config.max_concurrency, max(config.prefetch_pages, 1)
+            )
 
         try:
             logger.info(
                 f"Processing {len(stats_data_ids)} stats data IDs with unified schema"
             )
 
-            # Process each stats data ID
-            for stats_data_id in stats_data_ids:
-                yield from _fetch_unified_estat_data(
-                    client=client,
-                    stats_data_id=stats_data_id,
-                    params=api_params,
-                    limit=config.source.limit,
-                    maximum_offset=config.source.maximum_offset,
+            schema: Optional[pa.Schema] = None
+            if config.plan_schema:
+                # Before the first table is fetched
+                schema = pa.schema(
+                    _unified_field(field)
+                    for field in _plan_schema(client, stats_data_ids, api_params)
                 )
+
+            # Process each stats data ID
+            for pages in tables:
+                if schema is None:
+                    yield from pages
+                else:
+                    for page in pages:
+                        yield conform_to_schema(page, schema)
         finally:
+            tables.close()
             client.close()
+            if controller is not None:
+                _log_concurrency_metrics(controller)
 
     return unified_estat_data()
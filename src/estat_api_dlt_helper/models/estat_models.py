@@ -35,7 +35,8 @@ class ClassAttributes(BaseMetadataModel):
         }
 
         if extra_attrs:
-            values["extra_attributes"] = extra_attrs
+            # Copy so that the raw response is not modified
+            values = {**values, "extra_attributes": extra_attrs}
         return values
 
 
@@ -49,7 +50,7 @@ class ClassModel(BaseMetadataModel):
     def construct_attributes(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """Construct ClassAttributes from dict."""
         if isinstance(values, dict) and "@code" in values:
-            values["attributes"] = ClassAttributes.model_validate(values)
+            values = {**values, "attributes": ClassAttributes.model_validate(values)}
         return values
 
 
@@ -66,7 +67,7 @@ class ClassObjModel(BaseMetadataModel):
         """Ensure CLASS is always treated as a list."""
         if isinstance(values, dict) and "CLASS" in values:
             if not isinstance(values["CLASS"], list):
-                values["CLASS"] = [values["CLASS"]]
+                values = {**values, "CLASS": [values["CLASS"]]}
         return values
 
 
@@ -169,7 +170,7 @@ class TableInf(BaseMetadataModel):
             desc = values["DESCRIPTION"]
             # If DESCRIPTION is an empty string, create an empty Description object
             if desc == "":
-                values["DESCRIPTION"] = {}
+                values = {**values, "DESCRIPTION": {}}
             # If DESCRIPTION is a dict but doesn't follow expected structure, keep it as is
             # The Description model will handle missing fields with Optional
         return values
@@ -1,3 +1,25 @@
-from .response_parser import parse_response
+from .arrow_converter import PreparedMetadata, StatInfMode
+from .process_parser import ProcessPoolParser
+from .response_parser import (
+    dimensions_to_arrow,
+    iter_record_batches,
+    parse_response,
+    prepare_metadata,
+    table_info_to_arrow,
+)
+from .session import ParserSession, metadata_fingerprint
+from .stream_parser import StreamingResponseParser
 
-__all__ = ["parse_response"]
+__all__ = [
+    "parse_response",
+    "iter_record_batches",
+    "prepare_metadata",
+    "table_info_to_arrow",
+    "dimensions_to_arrow",
+    "PreparedMetadata",
+    "StatInfMode",
+    "StreamingResponseParser",
+    "ParserSession",
+    "metadata_fingerprint",
+    "ProcessPoolParser",
+]
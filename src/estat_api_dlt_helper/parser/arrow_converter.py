@@ -1,11 +1,35 @@
-from typing import Any, Dict, List, Optional
+# pyarrow.compute kernels are generated at import time, unknown to pyright
+# pyright: reportAttributeAccessIssue=false
+from typing import Any, Dict, Generator, List, Literal, NamedTuple, Optional, Tuple
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..models import ClassInfModel, TableInf
 from ..utils import create_arrow_struct_type, model_to_arrow_dict
 from .metadata_processor import MetadataProcessor
 
+# Plain decimal or exponent notation, after commas and whitespace are removed
+_NUMERIC_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+# How the table information is attached to the rows:
+# - "struct": full stat_inf struct on every row
+# - "run_end": stat_inf as a run-end encoded column with a single run
+# - "dictionary": stat_inf as a dictionary-encoded column with one entry
+# - "id": only the statistical table ID in a stat_inf_id column
+StatInfMode = Literal["struct", "run_end", "dictionary", "id"]
+STAT_INF_MODES = ("struct", "run_end", "dictionary", "id")
+
+
+class PreparedMetadata(NamedTuple):
+    """Processed CLASS_INF and TABLE_INF, reusable across pages of a table."""
+
+    struct_types: Dict[str, pa.DataType]
+    mappings: Dict[str, Dict[str, Dict[str, str]]]
+    stat_inf_type: pa.DataType
+    stat_inf_data: Dict[str, Any]
+    lookups: Dict[str, Tuple[pa.Array, pa.Array]]
+
 
 class ArrowConverter:
     """Convert JSON data to Arrow format in a type-safe manner."""
@@ -68,36 +92,236 @@ class ArrowConverter:
         except (ValueError, AttributeError):
             return None
 
-    def convert_to_arrow(self, stat_data: Dict[str, Any]) -> pa.Table:
+    def _parse_numeric_values(self, raw: pa.Array) -> Tuple[pa.Array, pa.Array]:
+        """
+        Parse the raw `$` strings of all rows into numbers.
+
+        Commas (common in Japanese number formatting) and surrounding
+        whitespace are removed before casting. Values that are not numbers,
+        such as the e-Stat special symbols ("-", "…", "x", "***"), become
+        null.
+
+        Args:
+            raw: String array of the `$` field
+
+        Returns:
+            Tuple of:
+            - float64 array of parsed values
+            - Dictionary-encoded array holding the original string of each
+              non-empty value that could not be parsed, null elsewhere
+        """
+        null_string = pa.scalar(None, type=pa.string())
+        cleaned = pc.utf8_trim_whitespace(pc.replace_substring(raw, ",", ""))
+        is_numeric = pc.match_substring_regex(cleaned, _NUMERIC_PATTERN)
+
+        numeric = pc.if_else(is_numeric, cleaned, null_string).cast(pa.float64())
+        is_symbol = pc.and_(pc.invert(is_numeric), pc.not_equal(cleaned, ""))
+        symbols = pc.if_else(is_symbol, raw, null_string).dictionary_encode()
+        return numeric, symbols
+
+    def prepare_metadata(
+        self, stat_data: Dict[str, Any], validate: bool = False
+    ) -> PreparedMetadata:
+        """
+        Process CLASS_INF and TABLE_INF.
+
+        Args:
+            stat_data: Section containing CLASS_INF and TABLE_INF
+                (STATISTICAL_DATA or METADATA_INF)
+            validate: Validate CLASS_INF with the pydantic models. By
+                default the raw entries are trusted and read directly,
+                which is much faster for large code lists.
+
+        Returns:
+            PreparedMetadata: Struct types, code mappings and table information
+        """
+        if validate:
+            class_inf = ClassInfModel.model_validate(stat_data["CLASS_INF"])
+            struct_types, mappings = self.metadata_processor.process_metadata(class_inf)
+        else:
+            struct_types, mappings = self.metadata_processor.process_raw_metadata(
+                stat_data["CLASS_INF"]
+            )
+
+        # Process TABLE_INF (table information)
+        table_inf = TableInf.model_validate(stat_data["TABLE_INF"])
+
+        lookups = {
+            field_name: self.metadata_processor.create_metadata_lookup(
+                struct_type, mappings[field_name]
+            )
+            for field_name, struct_type in struct_types.items()
+        }
+
+        return PreparedMetadata(
+            struct_types=struct_types,
+            mappings=mappings,
+            stat_inf_type=create_arrow_struct_type(TableInf),
+            stat_inf_data=model_to_arrow_dict(table_inf),
+            lookups=lookups,
+        )
+
+    def _take_metadata(
+        self, codes: pa.Array, lookup: Tuple[pa.Array, pa.Array]
+    ) -> pa.Array:
+        """
+        Gather the metadata struct of each row by its code.
+
+        The code column is dictionary-encoded so that only its distinct
+        values are matched against the lookup codes; the rows are then
+        gathered with take.
+
+        Args:
+            codes: Code column of the rows
+            lookup: Code and struct arrays from create_metadata_lookup
+
+        Returns:
+            Struct array with the metadata of each row (all fields null for
+            codes without metadata)
+        """
+        lookup_codes, entries = lookup
+        encoded = codes.dictionary_encode()
+        positions = pc.index_in(encoded.dictionary, value_set=lookup_codes)
+        positions = pc.fill_null(positions, len(lookup_codes))
+        return pc.take(entries, pc.take(positions, encoded.indices))
+
+    def _stat_inf_column(
+        self, metadata: PreparedMetadata, num_rows: int, stat_inf_mode: str
+    ) -> Tuple[str, pa.Array]:
+        """
+        Build the table information column without converting it per row.
+
+        Args:
+            metadata: Prepared metadata of the table
+            num_rows: Number of rows of the table
+            stat_inf_mode: One of STAT_INF_MODES
+
+        Returns:
+            Tuple of the column name and the column array
+
+        Raises:
+            ValueError: If stat_inf_mode is unknown
+        """
+        if stat_inf_mode not in STAT_INF_MODES:
+            raise ValueError(
+                f"Unknown stat_inf_mode: {stat_inf_mode!r}. "
+                f"Choose one of: {', '.join(STAT_INF_MODES)}"
+            )
+
+        if stat_inf_mode == "id":
+            stats_data_id = pa.scalar(metadata.stat_inf_data["id"], type=pa.string())
+            return "stat_inf_id", pa.repeat(stats_data_id, num_rows)
+
+        stat_inf = pa.scalar(metadata.stat_inf_data, type=metadata.stat_inf_type)
+        if stat_inf_mode == "struct":
+            return "stat_inf", pa.repeat(stat_inf, num_rows)
+
+        single = pa.array([stat_inf], type=metadata.stat_inf_type)
+        if stat_inf_mode == "run_end":
+            run_ends = pa.array([num_rows] if num_rows else [], type=pa.int32())
+            values = single if num_rows else single.slice(0, 0)
+            return "stat_inf", pa.RunEndEncodedArray.from_arrays(run_ends, values)
+
+        indices = pa.repeat(pa.scalar(0, type=pa.int32()), num_rows)
+        return "stat_inf", pa.DictionaryArray.from_arrays(indices, single)
+
+    def table_info_to_arrow(self, metadata: PreparedMetadata) -> pa.Table:
+        """
+        Convert the table information to a single-row Arrow table.
+
+        Used together with stat_inf_mode="id" to store TABLE_INF once per
+        table instead of once per row.
+
+        Args:
+            metadata: Prepared metadata of the table
+
+        Returns:
+            pa.Table: One row with a column per TABLE_INF field
+        """
+        # id identifies the table, like a primary key it is never null
+        schema = pa.schema(
+            [
+                field.with_nullable(False) if field.name == "id" else field
+                for field in metadata.stat_inf_type
+            ]
+        )
+        return pa.Table.from_pylist([metadata.stat_inf_data], schema=schema)
+
+    def dimensions_to_arrow(self, metadata: PreparedMetadata) -> Dict[str, pa.Table]:
+        """
+        Convert the CLASS_INF of a table to one Arrow table per CLASS_OBJ.
+
+        Used together with embed_metadata=False to store the metadata of
+        each code once (star schema) instead of once per row.
+
+        Args:
+            metadata: Prepared metadata of the table
+
+        Returns:
+            Dict mapping CLASS_OBJ ids to tables with one row per code and
+            the columns of the metadata struct (code, name, level, ...)
+        """
+        dimensions: Dict[str, pa.Table] = {}
+        for field_name, struct_type in metadata.struct_types.items():
+            schema = pa.schema(
+                [
+                    field.with_nullable(False) if field.name == "code" else field
+                    for field in struct_type
+                ]
+            )
+            dimensions[field_name] = pa.Table.from_pylist(
+                list(metadata.mappings[field_name].values()), schema=schema
+            )
+        return dimensions
+
+    def convert_to_arrow(
+        self,
+        stat_data: Dict[str, Any],
+        metadata: Optional[PreparedMetadata] = None,
+        keep_value_symbols: bool = False,
+        stat_inf_mode: StatInfMode = "struct",
+        embed_metadata: bool = True,
+    ) -> pa.Table:
         """
         Convert statistical data to Arrow Table.
 
         Args:
             stat_data: STATISTICAL_DATA section from the API response
+            metadata: Previously prepared metadata of the same table. When
+                given, CLASS_INF and TABLE_INF of stat_data are not used.
+            keep_value_symbols: Add a dictionary-encoded ``value_symbol``
+                column holding the original `$` string of values that are
+                not numbers (e.g. special symbols such as "-" or "x")
+            stat_inf_mode: How the table information is attached to the
+                rows (see StatInfMode)
+            embed_metadata: Add a ``<dimension>_metadata`` struct column per
+                CLASS_OBJ. When False, rows carry only the dimension codes
+                (see dimensions_to_arrow)
 
         Returns:
             pa.Table: Converted Arrow table with data and metadata
+
+        Raises:
+            ValueError: If stat_inf_mode is unknown
         """
-        # Parse and validate metadata
-        class_inf = ClassInfModel.model_validate(stat_data["CLASS_INF"])
-        struct_types, mappings = self.metadata_processor.process_metadata(class_inf)
+        if metadata is None:
+            metadata = self.prepare_metadata(stat_data)
+        struct_types = metadata.struct_types if embed_metadata else {}
 
         # Extract value data
         values = stat_data["DATA_INF"]["VALUE"]
+        if isinstance(values, dict):
+            values = [values]
         value_columns = self._extract_value_columns(values)
 
         # Prepare data dictionary for Arrow table
         data_dict: Dict[str, pa.Array] = {}
 
-        # Process TABLE_INF (table information)
-        table_inf = TableInf.model_validate(stat_data["TABLE_INF"])
-        stat_inf_type = create_arrow_struct_type(TableInf)
-        stat_inf_data = model_to_arrow_dict(table_inf)
-
-        # Create array with same table info for all rows
-        data_dict["stat_inf"] = pa.array(
-            [stat_inf_data] * len(values), type=stat_inf_type
+        # Attach the same table info to all rows
+        stat_inf_name, stat_inf_column = self._stat_inf_column(
+            metadata, len(values), stat_inf_mode
         )
+        data_dict[stat_inf_name] = stat_inf_column
 
         # Handle empty data case
         if not values:
@@ -109,15 +333,22 @@ class ArrowConverter:
                     data_dict[col] = pa.array([], type=pa.float64())
                 else:
                     data_dict[col] = pa.array([], type=pa.string())
+            if keep_value_symbols:
+                data_dict["value_symbol"] = pa.array(
+                    [], type=pa.dictionary(pa.int32(), pa.string())
+                )
         else:
             # Process value columns normally
             for col in value_columns:
                 if col == "value":
                     # Handle numeric value column ($ field)
-                    numeric_values = [
-                        self._parse_numeric_value(v.get("$")) for v in values
-                    ]
-                    data_dict[col] = pa.array(numeric_values, type=pa.float64())
+                    raw_values = pa.array(
+                        [v.get("$") for v in values], type=pa.string()
+                    )
+                    numeric, symbols = self._parse_numeric_values(raw_values)
+                    data_dict[col] = numeric
+                    if keep_value_symbols:
+                        data_dict["value_symbol"] = symbols
                 else:
                     # Handle string columns (@ prefixed fields)
                     original_key = f"@{col}"
@@ -125,28 +356,75 @@ class ArrowConverter:
                     data_dict[col] = pa.array(string_values, type=pa.string())
 
         # Add metadata structures
-        for field_name, struct_type in struct_types.items():
-            original_field = f"@{field_name}"
-
-            # Build metadata array for each row
-            metadata_array = []
-            for v in values:
-                code = v.get(original_field, "")
-                # Get metadata for this code
-                if code in mappings[field_name]:
-                    metadata = mappings[field_name][code]
-                else:
-                    # Create empty metadata with None values for all fields
-                    metadata = {field.name: None for field in struct_type}
-                metadata_array.append(metadata)
+        for field_name in struct_types:
+            if field_name in data_dict:
+                codes = data_dict[field_name]
+            else:
+                original_field = f"@{field_name}"
+                codes = pa.array(
+                    [v.get(original_field, "") for v in values], type=pa.string()
+                )
 
-            data_dict[f"{field_name}_metadata"] = pa.array(
-                metadata_array, type=struct_type
+            data_dict[f"{field_name}_metadata"] = self._take_metadata(
+                codes, metadata.lookups[field_name]
             )
 
         # Create schema and build table
         schema = self.metadata_processor.create_arrow_schema(
-            value_columns, struct_types, stat_inf_type
+            value_columns,
+            struct_types,
+            stat_inf_column.type,
+            keep_value_symbols,
+            stat_inf_name,
         )
 
         return pa.Table.from_pydict(data_dict, schema=schema)
+
+    def iter_record_batches(
+        self,
+        stat_data: Dict[str, Any],
+        batch_size: int,
+        metadata: Optional[PreparedMetadata] = None,
+        keep_value_symbols: bool = False,
+        stat_inf_mode: StatInfMode = "struct",
+        embed_metadata: bool = True,
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Convert statistical data to Arrow record batches of bounded size.
+
+        The VALUE rows are converted batch_size rows at a time, so the
+        Arrow buffers and intermediate lists held at once scale with the
+        batch size instead of the page size.
+
+        Args:
+            stat_data: STATISTICAL_DATA section from the API response
+            batch_size: Maximum number of rows per record batch
+            metadata: Previously prepared metadata of the same table
+            keep_value_symbols: Add the value_symbol column
+            stat_inf_mode: How the table information is attached to the rows
+            embed_metadata: Add the <dimension>_metadata struct columns
+
+        Yields:
+            pa.RecordBatch: Converted rows, in response order
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if metadata is None:
+            metadata = self.prepare_metadata(stat_data)
+
+        values = stat_data["DATA_INF"]["VALUE"]
+        if isinstance(values, dict):
+            values = [values]
+
+        for start in range(0, len(values), batch_size):
+            table = self.convert_to_arrow(
+                {"DATA_INF": {"VALUE": values[start : start + batch_size]}},
+                metadata,
+                keep_value_symbols,
+                stat_inf_mode,
+                embed_metadata,
+            )
+            yield from table.to_batches()
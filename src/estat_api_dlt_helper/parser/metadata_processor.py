@@ -1,9 +1,18 @@
-from typing import Dict, List, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple
 
 import pyarrow as pa
 
 from ..models import ClassInfModel, ClassObjModel
 
+# CLASS attributes with a dedicated field in ClassAttributes
+_REQUIRED_ATTRIBUTES = ("@code", "@name")
+_REQUIRED_FIELDS = ("code", "name")
+_STANDARD_ATTRIBUTES = {
+    "@level": "level",
+    "@unit": "unit",
+    "@parentCode": "parent_code",
+}
+
 
 class MetadataProcessor:
     """Process metadata and generate Arrow schemas in a type-safe manner."""
@@ -91,6 +100,27 @@ class MetadataProcessor:
 
         return mapping
 
+    def create_metadata_lookup(
+        self, struct_type: pa.DataType, mapping: Dict[str, Dict[str, str]]
+    ) -> Tuple[pa.Array, pa.Array]:
+        """
+        Create columnar lookup arrays for the metadata of one CLASS_OBJ.
+
+        The struct array holds one entry per code in the order of the code
+        array, followed by one entry with every field set to null that is
+        used for codes without metadata.
+
+        Args:
+            struct_type: Arrow struct type of the metadata
+            mapping: Code-to-metadata mapping of the CLASS_OBJ
+
+        Returns:
+            Tuple of the code array and the metadata struct array
+        """
+        codes = pa.array(list(mapping.keys()), type=pa.string())
+        entries = pa.array([*mapping.values(), {}], type=struct_type)
+        return codes, entries
+
     def process_metadata(
         self, class_inf: ClassInfModel
     ) -> Tuple[Dict[str, pa.DataType], Dict[str, Dict[str, Dict[str, str]]]]:
@@ -115,11 +145,85 @@ class MetadataProcessor:
 
         return struct_types, mappings
 
+    def process_raw_metadata(
+        self, class_inf: Dict[str, Any]
+    ) -> Tuple[Dict[str, pa.DataType], Dict[str, Dict[str, Dict[str, str]]]]:
+        """
+        Process raw CLASS_INF without pydantic validation.
+
+        Trusted fast path of process_metadata: CLASS entries are read
+        straight from the response dicts into the code mappings, without
+        building ClassInfModel / ClassModel / ClassAttributes objects. The
+        result is the same as process_metadata for well-formed responses.
+
+        Args:
+            class_inf: Raw CLASS_INF section of the response
+
+        Returns:
+            Tuple of:
+            - Dict mapping field names to their Arrow struct types
+            - Dict mapping field names to their code-to-metadata mappings
+
+        Raises:
+            KeyError: If a CLASS_OBJ or CLASS entry lacks a required key
+        """
+        struct_types: Dict[str, pa.DataType] = {}
+        mappings: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+        class_objs = class_inf["CLASS_OBJ"]
+        if isinstance(class_objs, dict):
+            class_objs = [class_objs]
+
+        for class_obj in class_objs:
+            classes = class_obj["CLASS"]
+            if isinstance(classes, dict):
+                classes = [classes]
+
+            mapping: Dict[str, Dict[str, str]] = {}
+            extra_fields: Set[str] = set()
+            for cls in classes:
+                code = str(cls["@code"])
+                metadata: Dict[str, str] = {"code": code, "name": str(cls["@name"])}
+                extras: Dict[str, str] = {}
+                for key, value in cls.items():
+                    if key in _REQUIRED_ATTRIBUTES or not key.startswith("@"):
+                        continue
+                    if key in _STANDARD_ATTRIBUTES:
+                        metadata[_STANDARD_ATTRIBUTES[key]] = value
+                    else:
+                        extras[key[1:]] = value
+                # Same key order as _create_metadata_mapping
+                metadata = {
+                    "code": metadata["code"],
+                    "name": metadata["name"],
+                    **{
+                        name: metadata[name]
+                        for name in _STANDARD_ATTRIBUTES.values()
+                        if name in metadata
+                    },
+                    **extras,
+                }
+                extra_fields.update(
+                    key for key in metadata if key not in _REQUIRED_FIELDS
+                )
+                mapping[code] = metadata
+
+            field_name = class_obj["@id"]
+            struct_types[field_name] = pa.struct(
+                [("code", pa.string()), ("name", pa.string())]
+                + [(name, pa.string()) for name in sorted(extra_fields)]
+            )
+            mappings[field_name] = mapping
+
+        return struct_types, mappings
+
     def create_arrow_schema(
         self,
         value_columns: List[str],
         struct_types: Dict[str, pa.DataType],
         stat_inf_type: pa.DataType,
+        value_symbol: bool = False,
+        stat_inf_name: str = "stat_inf",
     ) -> pa.Schema:
         """
         Create complete Arrow schema for the table.
@@ -128,6 +232,9 @@ class MetadataProcessor:
             value_columns: List of value column names
             struct_types: Dict of metadata struct types
             stat_inf_type: Struct type for table information
+            value_symbol: Whether to include the dictionary-encoded
+                value_symbol column
+            stat_inf_name: Name of the table information column
 
         Returns:
             pa.Schema: Complete Arrow schema for the table
@@ -139,12 +246,14 @@ class MetadataProcessor:
 
         # Add numeric value column
         fields.append(("value", pa.float64()))
+        if value_symbol:
+            fields.append(("value_symbol", pa.dictionary(pa.int32(), pa.string())))
 
         # Add metadata struct fields
         for field_name, struct_type in struct_types.items():
             fields.append((f"{field_name}_metadata", struct_type))
 
         # Add table information field
-        fields.append(("stat_inf", stat_inf_type))
+        fields.append((stat_inf_name, stat_inf_type))
 
         return pa.schema(fields)
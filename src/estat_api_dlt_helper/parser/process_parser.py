@@ -0,0 +1,194 @@
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Self, Tuple, Type, Union
+
+import pyarrow as pa
+
+from ..api.json_decoder import JsonDecoder, get_json_decoder
+from .arrow_converter import StatInfMode
+from .response_parser import _get_statistical_data
+from .session import ParserSession
+
+# Parser state of a worker process, set once by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    json_decoder: Union[str, JsonDecoder],
+    metadata_section: Optional[Dict[str, Any]],
+    options: Dict[str, Any],
+) -> None:
+    """Set up the parser state of a worker process."""
+    if isinstance(json_decoder, str):
+        json_decoder = get_json_decoder(json_decoder, stats_data=True)
+    session = ParserSession()
+    _worker_state.update(
+        decoder=json_decoder,
+        session=session,
+        metadata=(
+            session.prepare_metadata(metadata_section)
+            if metadata_section is not None
+            else None
+        ),
+        options=options,
+    )
+
+
+def _parse_page(body: bytes) -> Tuple[pa.Buffer, Dict[str, Any]]:
+    """Decode and convert one page in a worker process.
+
+    Returns:
+        Tuple of the Arrow IPC stream of the rows and the RESULT_INF section
+    """
+    data = _worker_state["decoder"](body)
+    metadata = _worker_state["metadata"]
+    session: ParserSession = _worker_state["session"]
+    options = _worker_state["options"]
+    batch_size: Optional[int] = options["batch_size"]
+
+    result_inf = _get_statistical_data(data, require_metadata=metadata is None).get(
+        "RESULT_INF", {}
+    )
+
+    convert_options = {
+        "metadata": metadata,
+        "keep_value_symbols": options["keep_value_symbols"],
+        "stat_inf_mode": options["stat_inf_mode"],
+        "embed_metadata": options["embed_metadata"],
+    }
+    if batch_size is not None:
+        batches = list(session.iter_record_batches(data, batch_size, **convert_options))
+    else:
+        batches = session.parse_response(data, **convert_options).to_batches()
+
+    sink = pa.BufferOutputStream()
+    if batches:
+        with pa.ipc.new_stream(sink, batches[0].schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+    return sink.getvalue(), result_inf
+
+
+class ProcessPoolParser:
+    """Parse getStatsData response bodies on a pool of worker processes.
+
+    Decoding JSON and converting it to Arrow is CPU-bound and holds the
+    GIL, so threads cannot parallelize it. Each worker decodes a raw
+    response body, converts it with its own ParserSession and sends the
+    result back as an Arrow IPC stream, which the parent opens without
+    copying the column buffers.
+
+    Workers are started with the "spawn" method: forking a process that
+    runs other threads (as dlt pipelines do) may deadlock the child.
+
+    Attributes:
+        max_workers: Number of worker processes.
+        batch_size: Maximum number of rows per record batch, if any.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        metadata_section: Optional[Dict[str, Any]] = None,
+        json_decoder: Union[str, JsonDecoder] = "json",
+        keep_value_symbols: bool = False,
+        stat_inf_mode: StatInfMode = "struct",
+        embed_metadata: bool = True,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Initialize process pool parser.
+
+        Args:
+            max_workers: Number of worker processes
+            metadata_section: Section with TABLE_INF and CLASS_INF of the
+                table (METADATA_INF of a getMetaInfo response). When given,
+                the bodies may come from requests with metaGetFlg=N.
+            json_decoder: JSON decoder backend ("json", "orjson" or
+                "msgspec") or a picklable callable decoding a body
+            keep_value_symbols: Add the value_symbol column (see
+                parse_response)
+            stat_inf_mode: How TABLE_INF is attached to the rows (see
+                parse_response)
+            embed_metadata: Add the ``<dimension>_metadata`` struct columns
+                (see parse_response)
+            batch_size: Split each page into record batches of at most this
+                many rows
+
+        Raises:
+            ValueError: If max_workers or batch_size is not positive, or
+                the decoder backend is unknown
+            ImportError: If the decoder backend is not installed
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if isinstance(json_decoder, str):
+            # Fail here rather than in every worker
+            get_json_decoder(json_decoder, stats_data=True)
+
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                json_decoder,
+                metadata_section,
+                {
+                    "keep_value_symbols": keep_value_symbols,
+                    "stat_inf_mode": stat_inf_mode,
+                    "embed_metadata": embed_metadata,
+                    "batch_size": batch_size,
+                },
+            ),
+        )
+
+    def submit(self, body: bytes) -> "Future[Tuple[pa.Buffer, Dict[str, Any]]]":
+        """
+        Schedule the parsing of a response body.
+
+        Args:
+            body: Raw getStatsData response body
+
+        Returns:
+            Future of the Arrow IPC stream and the RESULT_INF section;
+            pass its result to read
+        """
+        return self._executor.submit(_parse_page, body)
+
+    def read(self, buffer: pa.Buffer) -> List[Union[pa.Table, pa.RecordBatch]]:
+        """
+        Open the Arrow IPC stream returned by a worker.
+
+        Args:
+            buffer: Arrow IPC stream from submit
+
+        Returns:
+            The record batches of the page when batch_size is set, otherwise
+            a single table (empty when the page has no rows)
+        """
+        if buffer.size == 0:
+            return []
+        reader = pa.ipc.open_stream(buffer)
+        if self.batch_size is not None:
+            return list(reader)
+        return [reader.read_all()]
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
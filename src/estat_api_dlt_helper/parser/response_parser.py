@@ -1,28 +1,26 @@
-from typing import Any, Dict
+from typing import Any, Dict, Generator, Optional
 
 import pyarrow as pa
 
-from .arrow_converter import ArrowConverter
+from .arrow_converter import ArrowConverter, PreparedMetadata, StatInfMode
 from .metadata_processor import MetadataProcessor
 
 
-def parse_response(data: Dict[str, Any]) -> pa.Table:
+def _get_statistical_data(
+    data: Dict[str, Any], require_metadata: bool = True
+) -> Dict[str, Any]:
     """
-    Parse e-Stat API response data and convert to Arrow table.
-
-    This is the main entry point for parsing e-Stat API responses.
-    Takes the JSON response and returns a structured Arrow table with
-    data values and associated metadata.
+    Validate a getStatsData response and return its STATISTICAL_DATA section.
 
     Args:
         data: The complete JSON response from e-Stat API
+        require_metadata: Whether TABLE_INF and CLASS_INF must be present
 
     Returns:
-        pa.Table: Arrow table containing the parsed data with metadata
+        The STATISTICAL_DATA section
 
     Raises:
         ValueError: If required data sections are missing
-        KeyError: If expected keys are not found in the response
     """
     # Validate response structure
     if "GET_STATS_DATA" not in data:
@@ -36,7 +34,9 @@ def parse_response(data: Dict[str, Any]) -> pa.Table:
     statistical_data = stats_data["STATISTICAL_DATA"]
 
     # Check for required sections
-    required_sections = ["TABLE_INF", "CLASS_INF", "DATA_INF"]
+    required_sections = ["DATA_INF"]
+    if require_metadata:
+        required_sections = ["TABLE_INF", "CLASS_INF", "DATA_INF"]
     missing_sections = [
         section for section in required_sections if section not in statistical_data
     ]
@@ -50,9 +50,173 @@ def parse_response(data: Dict[str, Any]) -> pa.Table:
     if "VALUE" not in statistical_data["DATA_INF"]:
         raise ValueError("Invalid response: DATA_INF missing VALUE section")
 
+    return statistical_data
+
+
+def prepare_metadata(data: Dict[str, Any], validate: bool = False) -> PreparedMetadata:
+    """
+    Process the metadata of a table once so it can be reused across pages.
+
+    Accepts either a getStatsData response fetched with metaGetFlg=Y or a
+    getMetaInfo response.
+
+    Args:
+        data: The complete JSON response from e-Stat API
+        validate: Validate CLASS_INF with the pydantic models instead of
+            reading the raw entries directly (debug mode)
+
+    Returns:
+        PreparedMetadata: Metadata to pass to parse_response
+
+    Raises:
+        ValueError: If TABLE_INF or CLASS_INF is missing
+    """
+    if "GET_META_INFO" in data:
+        section = data["GET_META_INFO"].get("METADATA_INF", {})
+    else:
+        section = data.get("GET_STATS_DATA", {}).get("STATISTICAL_DATA", {})
+
+    missing_sections = [
+        name for name in ("TABLE_INF", "CLASS_INF") if name not in section
+    ]
+    if missing_sections:
+        raise ValueError(
+            f"Invalid response: missing required sections: {', '.join(missing_sections)}"
+        )
+
+    return ArrowConverter(MetadataProcessor()).prepare_metadata(section, validate)
+
+
+def parse_response(
+    data: Dict[str, Any],
+    metadata: Optional[PreparedMetadata] = None,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+    embed_metadata: bool = True,
+    validate_metadata: bool = False,
+) -> pa.Table:
+    """
+    Parse e-Stat API response data and convert to Arrow table.
+
+    This is the main entry point for parsing e-Stat API responses.
+    Takes the JSON response and returns a structured Arrow table with
+    data values and associated metadata.
+
+    Args:
+        data: The complete JSON response from e-Stat API
+        metadata: Metadata prepared by prepare_metadata from another page of
+            the same table. Allows parsing pages fetched with metaGetFlg=N.
+        keep_value_symbols: Add a dictionary-encoded ``value_symbol`` column
+            keeping the original string of values that are not numbers
+            (e-Stat special symbols such as "-", "…", "x" or "***")
+        stat_inf_mode: How TABLE_INF is attached to the rows: "struct"
+            (full struct per row, default), "run_end" or "dictionary"
+            (encoded column holding the struct once) or "id" (only a
+            stat_inf_id column; see table_info_to_arrow)
+        embed_metadata: Add the ``<dimension>_metadata`` struct columns.
+            When False, rows carry only the dimension codes and the
+            metadata is stored once per table (see dimensions_to_arrow)
+        validate_metadata: Validate CLASS_INF with the pydantic models
+            (debug mode). By default the raw CLASS entries are trusted and
+            read directly into the metadata mappings.
+
+    Returns:
+        pa.Table: Arrow table containing the parsed data with metadata
+
+    Raises:
+        ValueError: If required data sections are missing or
+            stat_inf_mode is unknown
+        KeyError: If expected keys are not found in the response
+    """
+    statistical_data = _get_statistical_data(data, require_metadata=metadata is None)
+
     # Create processors
     metadata_processor = MetadataProcessor()
     arrow_converter = ArrowConverter(metadata_processor)
 
+    if metadata is None:
+        metadata = arrow_converter.prepare_metadata(statistical_data, validate_metadata)
+
     # Convert to Arrow table
-    return arrow_converter.convert_to_arrow(statistical_data)
+    return arrow_converter.convert_to_arrow(
+        statistical_data, metadata, keep_value_symbols, stat_inf_mode, embed_metadata
+    )
+
+
+def iter_record_batches(
+    data: Dict[str, Any],
+    batch_size: int = 10000,
+    metadata: Optional[PreparedMetadata] = None,
+    keep_value_symbols: bool = False,
+    stat_inf_mode: StatInfMode = "struct",
+    embed_metadata: bool = True,
+) -> Generator[pa.RecordBatch, None, None]:
+    """
+    Parse e-Stat API response data into Arrow record batches.
+
+    Same as parse_response, but yields record batches of at most
+    batch_size rows instead of one table for the whole page, so that peak
+    memory of the conversion scales with the batch size.
+
+    Args:
+        data: The complete JSON response from e-Stat API
+        batch_size: Maximum number of rows per record batch
+        metadata: Metadata prepared by prepare_metadata from another page of
+            the same table
+        keep_value_symbols: Add the value_symbol column (see parse_response)
+        stat_inf_mode: How TABLE_INF is attached to the rows (see
+            parse_response)
+        embed_metadata: Add the ``<dimension>_metadata`` struct columns
+            (see parse_response)
+
+    Yields:
+        pa.RecordBatch: Parsed rows with metadata, in response order
+
+    Raises:
+        ValueError: If required data sections are missing or batch_size is
+            not positive
+    """
+    statistical_data = _get_statistical_data(data, require_metadata=metadata is None)
+
+    yield from ArrowConverter(MetadataProcessor()).iter_record_batches(
+        statistical_data,
+        batch_size,
+        metadata,
+        keep_value_symbols,
+        stat_inf_mode,
+        embed_metadata,
+    )
+
+
+def table_info_to_arrow(metadata: PreparedMetadata) -> pa.Table:
+    """
+    Convert the TABLE_INF of a table to a single-row Arrow table.
+
+    Pairs with parse_response(stat_inf_mode="id"): the table information is
+    stored once per table and joined to the rows on ``id = stat_inf_id``.
+
+    Args:
+        metadata: Metadata prepared by prepare_metadata
+
+    Returns:
+        pa.Table: One row with a column per TABLE_INF field
+    """
+    return ArrowConverter(MetadataProcessor()).table_info_to_arrow(metadata)
+
+
+def dimensions_to_arrow(metadata: PreparedMetadata) -> Dict[str, pa.Table]:
+    """
+    Convert the CLASS_INF of a table to one Arrow table per dimension.
+
+    Pairs with parse_response(embed_metadata=False): each dimension table
+    holds the metadata of every code once and is joined to the rows on
+    ``<dimension> = code``.
+
+    Args:
+        metadata: Metadata prepared by prepare_metadata
+
+    Returns:
+        Dict mapping CLASS_OBJ ids (tab, cat01, area, time, ...) to tables
+        with one row per code
+    """
+    return ArrowConverter(MetadataProcessor()).dimensions_to_arrow(metadata)
@@ -0,0 +1,221 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Generator, Hashable, List, Optional, Tuple
+
+import pyarrow as pa
+
+from .arrow_converter import ArrowConverter, PreparedMetadata, StatInfMode
+from .metadata_processor import MetadataProcessor
+from .response_parser import _get_statistical_data
+
+
+def metadata_fingerprint(section: Dict[str, Any]) -> Hashable:
+    """
+    Compute a cheap fingerprint of the raw TABLE_INF and CLASS_INF.
+
+    TABLE_INF is small and serialized as a whole. For CLASS_INF, only the
+    id, name and number of classes of each CLASS_OBJ and its first and last
+    CLASS entries are used, so the cost does not grow with the number of
+    codes. Pages of the same table (same language and options) always get
+    the same fingerprint.
+
+    Args:
+        section: Section containing TABLE_INF and CLASS_INF
+            (STATISTICAL_DATA or METADATA_INF)
+
+    Returns:
+        Hashable fingerprint
+    """
+    table_inf = json.dumps(section["TABLE_INF"], sort_keys=True, ensure_ascii=False)
+
+    class_objs = section["CLASS_INF"].get("CLASS_OBJ", [])
+    if isinstance(class_objs, dict):
+        class_objs = [class_objs]
+
+    class_inf: List[Tuple[Any, ...]] = []
+    for class_obj in class_objs:
+        classes = class_obj.get("CLASS", [])
+        if isinstance(classes, dict):
+            classes = [classes]
+        ends = (classes[0], classes[-1]) if classes else ()
+        class_inf.append(
+            (
+                class_obj.get("@id"),
+                class_obj.get("@name"),
+                len(classes),
+                json.dumps(ends, sort_keys=True, ensure_ascii=False),
+            )
+        )
+
+    return table_inf, tuple(class_inf)
+
+
+class ParserSession:
+    """Parse pages of e-Stat responses, reusing processed metadata.
+
+    ``parse_response`` processes CLASS_INF and TABLE_INF and builds the
+    metadata structs, mappings and lookups on every call. A session keeps
+    the prepared metadata in an LRU cache keyed by metadata_fingerprint,
+    so that pages 2..N of a table skip validation and mapping entirely.
+
+    The session is safe to share between threads.
+
+    Attributes:
+        max_entries: Maximum number of tables kept in the cache.
+        hits: Number of pages whose metadata was found in the cache.
+        misses: Number of pages whose metadata had to be prepared.
+    """
+
+    def __init__(self, max_entries: int = 32, validate: bool = False):
+        """
+        Initialize parser session.
+
+        Args:
+            max_entries: Maximum number of tables kept in the cache
+            validate: Validate CLASS_INF with the pydantic models on a
+                cache miss (debug mode, see prepare_metadata)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.validate = validate
+        self.hits = 0
+        self.misses = 0
+        self._converter = ArrowConverter(MetadataProcessor())
+        self._cache: OrderedDict[Hashable, PreparedMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of metadata lookups served from the cache (0.0 if none)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def prepare_metadata(self, section: Dict[str, Any]) -> PreparedMetadata:
+        """
+        Get the prepared metadata of a section, from the cache if possible.
+
+        Args:
+            section: Section containing TABLE_INF and CLASS_INF
+                (STATISTICAL_DATA or METADATA_INF)
+
+        Returns:
+            PreparedMetadata: Struct types, code mappings and table information
+        """
+        key = metadata_fingerprint(section)
+        with self._lock:
+            metadata = self._cache.get(key)
+            if metadata is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return metadata
+            self.misses += 1
+
+        metadata = self._converter.prepare_metadata(section, self.validate)
+
+        with self._lock:
+            self._cache[key] = metadata
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return metadata
+
+    def parse_response(
+        self,
+        data: Dict[str, Any],
+        metadata: Optional[PreparedMetadata] = None,
+        keep_value_symbols: bool = False,
+        stat_inf_mode: StatInfMode = "struct",
+        embed_metadata: bool = True,
+    ) -> pa.Table:
+        """
+        Parse e-Stat API response data and convert to Arrow table.
+
+        Same as the module-level parse_response, except that the metadata
+        of the page is looked up in the session cache.
+
+        Args:
+            data: The complete JSON response from e-Stat API
+            metadata: Previously prepared metadata of the same table. When
+                given, the cache is not used.
+            keep_value_symbols: Add the value_symbol column
+            stat_inf_mode: How TABLE_INF is attached to the rows
+            embed_metadata: Add the <dimension>_metadata struct columns
+
+        Returns:
+            pa.Table: Arrow table containing the parsed data with metadata
+
+        Raises:
+            ValueError: If required data sections are missing
+        """
+        statistical_data = _get_statistical_data(
+            data, require_metadata=metadata is None
+        )
+        if metadata is None:
+            metadata = self.prepare_metadata(statistical_data)
+
+        return self._converter.convert_to_arrow(
+            statistical_data,
+            metadata,
+            keep_value_symbols,
+            stat_inf_mode,
+            embed_metadata,
+        )
+
+    def iter_record_batches(
+        self,
+        data: Dict[str, Any],
+        batch_size: int = 10000,
+        metadata: Optional[PreparedMetadata] = None,
+        keep_value_symbols: bool = False,
+        stat_inf_mode: StatInfMode = "struct",
+        embed_metadata: bool = True,
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Parse e-Stat API response data into Arrow record batches.
+
+        Same as the module-level iter_record_batches, except that the
+        metadata of the page is looked up in the session cache.
+
+        Args:
+            data: The complete JSON response from e-Stat API
+            batch_size: Maximum number of rows per record batch
+            metadata: Previously prepared metadata of the same table. When
+                given, the cache is not used.
+            keep_value_symbols: Add the value_symbol column
+            stat_inf_mode: How TABLE_INF is attached to the rows
+            embed_metadata: Add the <dimension>_metadata struct columns
+
+        Yields:
+            pa.RecordBatch: Parsed rows with metadata, in response order
+
+        Raises:
+            ValueError: If required data sections are missing or
+                batch_size is not positive
+        """
+        statistical_data = _get_statistical_data(
+            data, require_metadata=metadata is None
+        )
+        if metadata is None:
+            metadata = self.prepare_metadata(statistical_data)
+
+        yield from self._converter.iter_record_batches(
+            statistical_data,
+            batch_size,
+            metadata,
+            keep_value_symbols,
+            stat_inf_mode,
+            embed_metadata,
+        )
+
+    def clear(self) -> None:
+        """Remove all cached metadata and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,173 @@
+from typing import IO, Any, Dict, Generator, List, Optional
+
+import pyarrow as pa
+
+from .arrow_converter import ArrowConverter, PreparedMetadata, StatInfMode
+from .metadata_processor import MetadataProcessor
+from .session import ParserSession
+
+_PREFIX = "GET_STATS_DATA.STATISTICAL_DATA"
+_SECTIONS = {
+    f"{_PREFIX}.RESULT_INF": "RESULT_INF",
+    f"{_PREFIX}.TABLE_INF": "TABLE_INF",
+    f"{_PREFIX}.CLASS_INF": "CLASS_INF",
+}
+_VALUE = f"{_PREFIX}.DATA_INF.VALUE"
+_VALUE_ITEM = f"{_VALUE}.item"
+
+
+class StreamingResponseParser:
+    """Parse a getStatsData response incrementally from a byte stream.
+
+    RESULT_INF, TABLE_INF and CLASS_INF are built as small objects, while
+    DATA_INF.VALUE rows are decoded one by one and converted to Arrow in
+    chunks of ``chunk_size`` rows. Peak memory is therefore bounded by the
+    chunk size instead of by the JSON object graph of the whole page.
+
+    Requires the optional ``ijson`` dependency
+    (``pip install estat-api-dlt-helper[stream]``).
+
+    Attributes:
+        chunk_size: Number of VALUE rows per yielded Arrow table.
+        metadata: Prepared metadata, either given or built from CLASS_INF.
+        result_inf: RESULT_INF section, available once it has been parsed.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 10000,
+        metadata: Optional[PreparedMetadata] = None,
+        keep_value_symbols: bool = False,
+        stat_inf_mode: StatInfMode = "struct",
+        embed_metadata: bool = True,
+        session: Optional[ParserSession] = None,
+    ):
+        """
+        Initialize streaming parser.
+
+        Args:
+            chunk_size: Number of VALUE rows per yielded Arrow table
+            metadata: Metadata of the table prepared from another page. When
+                given, the stream may come from a request with metaGetFlg=N.
+            keep_value_symbols: Add the value_symbol column (see
+                parse_response)
+            stat_inf_mode: How TABLE_INF is attached to the rows (see
+                parse_response)
+            embed_metadata: Add the ``<dimension>_metadata`` struct columns
+                (see parse_response)
+            session: Parser session whose metadata cache is used when
+                metadata is not given
+
+        Raises:
+            ImportError: If ijson is not installed
+            ValueError: If chunk_size is not positive
+        """
+        try:
+            import ijson  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "StreamingResponseParser requires ijson. "
+                "Install it with: pip install estat-api-dlt-helper[stream]"
+            ) from e
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.chunk_size = chunk_size
+        self.metadata = metadata
+        self.keep_value_symbols = keep_value_symbols
+        self.stat_inf_mode: StatInfMode = stat_inf_mode
+        self.embed_metadata = embed_metadata
+        self.session = session
+        self.result_inf: Dict[str, Any] = {}
+        self._converter = ArrowConverter(MetadataProcessor())
+
+    def _convert(
+        self, sections: Dict[str, Any], values: List[Dict[str, Any]]
+    ) -> pa.Table:
+        if self.metadata is None:
+            missing_sections = [
+                name for name in ("TABLE_INF", "CLASS_INF") if name not in sections
+            ]
+            if missing_sections:
+                raise ValueError(
+                    "Invalid response: missing required sections: "
+                    f"{', '.join(missing_sections)}"
+                )
+            if self.session is not None:
+                self.metadata = self.session.prepare_metadata(sections)
+            else:
+                self.metadata = self._converter.prepare_metadata(sections)
+
+        return self._converter.convert_to_arrow(
+            {"DATA_INF": {"VALUE": values}},
+            self.metadata,
+            self.keep_value_symbols,
+            self.stat_inf_mode,
+            self.embed_metadata,
+        )
+
+    def iter_tables(self, stream: IO[bytes]) -> Generator[pa.Table, None, None]:
+        """
+        Parse the stream and yield Arrow tables of at most chunk_size rows.
+
+        Args:
+            stream: Binary file-like object with the JSON response body
+
+        Yields:
+            pa.Table: Parsed rows with metadata, in response order
+
+        Raises:
+            ValueError: If required data sections are missing
+        """
+        import ijson
+
+        sections: Dict[str, Any] = {}
+        builder: Optional[Any] = None
+        builder_prefix: Optional[str] = None
+        values: List[Dict[str, Any]] = []
+        seen_statistical_data = False
+        seen_value = False
+        depth = 0
+
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                if depth == 0:
+                    if builder_prefix == _VALUE_ITEM:
+                        values.append(builder.value)
+                        if len(values) >= self.chunk_size:
+                            yield self._convert(sections, values)
+                            values = []
+                    else:
+                        sections[_SECTIONS[builder_prefix]] = builder.value  # type: ignore[index]
+                        if builder_prefix == f"{_PREFIX}.RESULT_INF":
+                            self.result_inf = builder.value
+                    builder = None
+                continue
+
+            if prefix == _PREFIX and event == "start_map":
+                seen_statistical_data = True
+            elif prefix == _VALUE and event in ("start_array", "start_map"):
+                seen_value = True
+
+            if event == "start_map" and (
+                prefix in _SECTIONS or prefix in (_VALUE, _VALUE_ITEM)
+            ):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                # A single data point is an object instead of a list
+                builder_prefix = _VALUE_ITEM if prefix == _VALUE else prefix
+                depth = 1
+
+        if not seen_statistical_data:
+            raise ValueError("Invalid response: missing STATISTICAL_DATA section")
+        if not seen_value:
+            raise ValueError("Invalid response: DATA_INF missing VALUE section")
+
+        if values:
+            yield self._convert(sections, values)
@@ -1,8 +1,14 @@
-from .arrow_utils import create_arrow_struct_type, model_to_arrow_dict
+from .arrow_utils import cast_to_type, create_arrow_struct_type, model_to_arrow_dict
+from .concurrency import limit_concurrency
 from .logging import get_logger
+from .prefetch import prefetch, prefetch_each
 
 __all__ = [
     "create_arrow_struct_type",
     "model_to_arrow_dict",
+    "cast_to_type",
     "get_logger",
+    "prefetch",
+    "prefetch_each",
+    "limit_concurrency",
 ]
@@ -99,3 +99,39 @@ def model_to_arrow_dict(model: BaseModel) -> Dict[str, Any]:
         result[field_name] = processed_value
 
     return result
+
+
+def cast_to_type(array: pa.Array, target: pa.DataType) -> pa.Array:
+    """Cast an array to a type, reconciling struct fields by name.
+
+    Struct fields missing from the array are filled with nulls and fields
+    the target does not have are dropped, recursively, so that arrays of
+    structs with different field sets can be cast to a common superset.
+    Other types are cast with Array.cast.
+
+    Args:
+        array: Array to cast
+        target: Type to cast to
+
+    Returns:
+        Array of the target type
+    """
+    if array.type == target:
+        return array
+    if not pa.types.is_struct(target) or not pa.types.is_struct(array.type):
+        return array.cast(target)
+
+    children = {
+        field.name: child
+        for field, child in zip(array.type, array.flatten(), strict=True)
+    }
+    return pa.StructArray.from_arrays(
+        [
+            cast_to_type(children[field.name], field.type)
+            if field.name in children
+            else pa.nulls(len(array), field.type)
+            for field in target
+        ],
+        fields=list(target),
+        mask=array.is_null(),
+    )
@@ -0,0 +1,40 @@
+import threading
+from typing import Generator, Iterable, TypeVar, Union
+
+T = TypeVar("T")
+
+Limiter = Union[threading.Semaphore, threading.BoundedSemaphore]
+
+_DONE = object()
+
+
+def limit_concurrency(
+    iterable: Iterable[T], limiter: Limiter
+) -> Generator[T, None, None]:
+    """Produce the items of an iterable while holding a slot of a limiter.
+
+    The slot is held while the next item is produced (e.g. a page is
+    fetched and parsed) and released before the item is yielded, so a
+    consumer that is slow or suspended never blocks other iterables
+    sharing the limiter. Sharing one limiter between the resources of a
+    source caps how many of them talk to the API at the same time.
+
+    Args:
+        iterable: Source of items, typically a page generator
+        limiter: Semaphore shared by all iterables under the same cap
+
+    Yields:
+        Items of the iterable, in order
+    """
+    iterator = iter(iterable)
+    try:
+        while True:
+            with limiter:
+                item = next(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item  # type: ignore[misc]
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,152 @@
+import queue
+import threading
+from collections import deque
+from typing import Any, Deque, Generator, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_ITEM = "item"
+_ERROR = "error"
+_DONE = "done"
+
+# Interval at which a blocked producer checks whether the consumer stopped
+_PUT_TIMEOUT = 0.1
+
+
+class _Prefetcher:
+    """Fetcher thread feeding the items of an iterable into a bounded queue."""
+
+    def __init__(self, iterable: Iterable[Any], max_queued: int):
+        self._iterable = iterable
+        self._items: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=max_queued)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, name="estat-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, entry: Tuple[str, Any]) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._items.put(entry, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        iterator = iter(self._iterable)
+        try:
+            for item in iterator:
+                if not self._put((_ITEM, item)):
+                    return
+            self._put((_DONE, None))
+        except Exception as e:  # noqa: BLE001  # re-raised by the consumer
+            self._put((_ERROR, e))
+        except BaseException as e:
+            # KeyboardInterrupt, SystemExit: wake the consumer, then let the
+            # exception end the thread
+            self._put((_ERROR, e))
+            raise
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def items(self) -> Generator[Any, None, None]:
+        """Yield the fetched items in order, stopping the fetcher at the end."""
+        try:
+            while True:
+                kind, value = self._items.get()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise value
+                yield value
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the fetcher after its current item and wait for it."""
+        self._stop.set()
+        self._thread.join()
+
+
+def prefetch(iterable: Iterable[T], max_queued: int) -> Generator[T, None, None]:
+    """Iterate over an iterable on a background thread, ahead of the consumer.
+
+    A fetcher thread pulls items from ``iterable`` and keeps up to
+    ``max_queued`` of them in a bounded queue while the caller processes
+    the previous ones, so that fetching (network) and processing (CPU)
+    overlap. When the queue is full the fetcher waits, which bounds memory
+    and slows fetching down to the pace of the consumer (backpressure).
+
+    Items are yielded in order. An exception raised by the iterable is
+    re-raised in the consumer. When the consumer stops early, the fetcher
+    is stopped after its current item and the iterable is closed.
+
+    Args:
+        iterable: Source of items, typically a page generator
+        max_queued: Maximum number of fetched items waiting in the queue
+
+    Yields:
+        Items of the iterable, in order
+
+    Raises:
+        ValueError: If max_queued is not positive
+    """
+    if max_queued < 1:
+        raise ValueError("max_queued must be at least 1")
+
+    yield from _Prefetcher(iterable, max_queued).items()
+
+
+def prefetch_each(
+    iterables: Iterable[Iterable[T]], max_active: int, max_queued: int
+) -> Generator[Iterator[T], None, None]:
+    """Prefetch several iterables concurrently, keeping each one in order.
+
+    Up to ``max_active`` iterables are consumed at the same time, each by
+    its own fetcher thread (see prefetch). The iterables are yielded one
+    after the other, in order, as iterators over their items, so the
+    combined output is the same as chaining them. When an iterable is
+    done, the fetcher of the next waiting one is started.
+
+    Each yielded iterator must be consumed (or abandoned) before the next
+    one is requested; the items it did not consume are discarded.
+
+    Args:
+        iterables: Sources of items, typically one page generator per table
+        max_active: Maximum number of iterables fetched concurrently
+        max_queued: Maximum number of fetched items waiting per iterable
+
+    Yields:
+        Iterator over the items of each iterable, in order
+
+    Raises:
+        ValueError: If max_active or max_queued is not positive
+    """
+    if max_active < 1:
+        raise ValueError("max_active must be at least 1")
+    if max_queued < 1:
+        raise ValueError("max_queued must be at least 1")
+
+    pending = iter(iterables)
+    active: Deque[_Prefetcher] = deque()
+    try:
+        while True:
+            while len(active) < max_active:
+                iterable = next(pending, None)
+                if iterable is None:
+                    break
+                active.append(_Prefetcher(iterable, max_queued))
+            if not active:
+                return
+            current = active.popleft()
+            try:
+                yield current.items()
+            finally:
+                current.close()
+    finally:
+        for prefetcher in active:
+            prefetcher.close()
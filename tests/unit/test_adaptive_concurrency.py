@@ -0,0 +1,221 @@
+"""Tests for the AIMD adaptive concurrency controller."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from requests import HTTPError, Response, Timeout
+
+from estat_api_dlt_helper.api.client import AdaptiveConcurrency, EstatApiClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("estat_api_dlt_helper.api.client.time.monotonic", fake):
+        yield fake
+
+
+def _request(controller: AdaptiveConcurrency, clock: FakeClock, latency: float):
+    started = controller.acquire()
+    clock.now += latency
+    controller.release(started)
+
+
+def _http_error(status_code: int) -> HTTPError:
+    response = Response()
+    response.status_code = status_code
+    return HTTPError(response=response)
+
+
+class TestAdaptiveConcurrency:
+    """Test cases for AdaptiveConcurrency"""
+
+    def test_additive_increase_while_latency_flat(self, clock):
+        controller = AdaptiveConcurrency(initial_limit=2, max_limit=4)
+
+        for _ in range(2):
+            _request(controller, clock, 1.0)
+        assert controller.limit == 3
+
+        for _ in range(3):
+            _request(controller, clock, 1.0)
+        assert controller.limit == 4
+
+        for _ in range(10):
+            _request(controller, clock, 1.0)
+        assert controller.limit == 4
+        assert controller.increases == 2
+
+    def test_rising_latency_holds_limit(self, clock):
+        controller = AdaptiveConcurrency(initial_limit=2, latency_tolerance=1.5)
+
+        _request(controller, clock, 1.0)
+        for _ in range(5):
+            _request(controller, clock, 2.0)
+
+        assert controller.limit == 2
+
+    def test_multiplicative_decrease(self, clock):
+        controller = AdaptiveConcurrency(initial_limit=8, min_limit=2)
+
+        controller.release(controller.acquire(), overloaded=True)
+        assert controller.limit == 4
+        clock.now += 1
+        controller.release(controller.acquire(), overloaded=True)
+        assert controller.limit == 2
+        clock.now += 1
+        controller.release(controller.acquire(), overloaded=True)
+        assert controller.limit == 2
+        assert controller.decreases == 3
+
+    def test_requests_in_flight_cut_once(self, clock):
+        controller = AdaptiveConcurrency(initial_limit=8)
+        started = [controller.acquire() for _ in range(4)]
+        clock.now += 1
+
+        for request in started:
+            controller.release(request, overloaded=True)
+
+        assert controller.limit == 4
+        assert controller.decreases == 1
+        assert controller.in_flight == 0
+
+    def test_acquire_waits_for_slot(self):
+        controller = AdaptiveConcurrency(initial_limit=1, max_limit=1)
+        started = controller.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            controller.release(controller.acquire())
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        controller.release(started)
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_peak_in_flight_bounded_by_limit(self):
+        controller = AdaptiveConcurrency(initial_limit=2, max_limit=2)
+        peak = 0
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal peak
+            for _ in range(5):
+                with controller.slot():
+                    with lock:
+                        peak = max(peak, controller.in_flight)
+                    time.sleep(0.001)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+
+    @pytest.mark.parametrize(
+        ("error", "decreased"),
+        [
+            (Timeout(), True),
+            (_http_error(429), True),
+            (_http_error(503), True),
+            (_http_error(404), False),
+            (ValueError(), False),
+        ],
+    )
+    def test_slot_errors(self, error, decreased):
+        controller = AdaptiveConcurrency(initial_limit=4)
+
+        with pytest.raises(type(error)), controller.slot():
+            raise error
+
+        assert (controller.limit == 2) is decreased
+        assert controller.in_flight == 0
+
+    def test_metrics_history(self, clock):
+        controller = AdaptiveConcurrency(initial_limit=2)
+        for _ in range(2):
+            _request(controller, clock, 1.0)
+        controller.release(controller.acquire(), overloaded=True)
+
+        metrics = controller.metrics()
+
+        assert metrics["limit"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["increases"] == 1
+        assert metrics["decreases"] == 1
+        assert [limit for _, limit in metrics["history"]] == [2, 3, 1]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_limit": 0},
+            {"min_limit": 4, "max_limit": 2},
+            {"decrease_factor": 1.0},
+            {"latency_tolerance": 0.5},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(**kwargs)
+
+
+class TestEstatApiClientAdaptiveConcurrency:
+    """Test cases for EstatApiClient with an adaptive concurrency controller"""
+
+    @pytest.fixture
+    def mock_http(self):
+        with patch("estat_api_dlt_helper.api.client.Client") as mock_cls:
+            yield mock_cls.return_value
+
+    def test_error_status_decreases(self, mock_http):
+        mock_http.get.return_value = Mock(
+            content=b'{"GET_META_INFO": {"RESULT": {"STATUS": 100}}}'
+        )
+        controller = AdaptiveConcurrency(initial_limit=4)
+        client = EstatApiClient(app_id="test", adaptive_concurrency=controller)
+
+        client.get_meta_info(stats_data_id="0000020201")
+
+        assert controller.limit == 2
+        assert controller.in_flight == 0
+
+    def test_success_status_keeps_limit(self, mock_http):
+        mock_http.get.return_value = Mock(
+            content=b'{"GET_META_INFO": {"RESULT": {"STATUS": 0}}}'
+        )
+        controller = AdaptiveConcurrency(initial_limit=4)
+        client = EstatApiClient(app_id="test", adaptive_concurrency=controller)
+
+        client.get_meta_info(stats_data_id="0000020201")
+
+        assert controller.limit == 4
+        assert controller.decreases == 0
+
+    def test_retried_throttling_decreases(self, mock_http):
+        def get(url, hooks, **kwargs):
+            # A 429 attempt retried by the HTTP client before succeeding
+            hooks["response"](Mock(status_code=429))
+            return Mock(content=b'{"GET_META_INFO": {"RESULT": {"STATUS": 0}}}')
+
+        mock_http.get.side_effect = get
+        controller = AdaptiveConcurrency(initial_limit=4)
+        client = EstatApiClient(app_id="test", adaptive_concurrency=controller)
+
+        client.get_meta_info(stats_data_id="0000020201")
+
+        assert controller.limit == 2
@@ -171,6 +171,188 @@ class TestEstatApiClient:
         assert pages[1] == second_response_data
         assert self.mock_client.get.call_count == 2
 
+    def test_get_stats_data_generator_concurrent(self):
+        """Test concurrent prefetch yields every page in order"""
+
+        def fake_get(url, params, headers, **kwargs):
+            start = params["startPosition"]
+            response = Mock()
+            response.json.return_value = {
+                "GET_STATS_DATA": {
+                    "STATISTICAL_DATA": {
+                        "RESULT_INF": {
+                            "TOTAL_NUMBER": "450",
+                            "FROM_NUMBER": str(start),
+                            "TO_NUMBER": str(min(start + 99, 450)),
+                        }
+                    }
+                }
+            }
+            return response
+
+        self.mock_client.get.side_effect = fake_get
+
+        client = EstatApiClient(app_id="test_app_id")
+        pages = list(
+            client.get_stats_data_generator(
+                stats_data_id="0000020202", limit_per_request=100, max_workers=3
+            )
+        )
+
+        from_numbers = [
+            int(p["GET_STATS_DATA"]["STATISTICAL_DATA"]["RESULT_INF"]["FROM_NUMBER"])
+            for p in pages
+        ]
+        assert from_numbers == [1, 101, 201, 301, 401]
+        assert self.mock_client.get.call_count == 5
+
+    def _capped_get(self, cap, short_at=None):
+        """Fake get returning at most cap records per page."""
+
+        def fake_get(url, params, headers, **kwargs):
+            start = params["startPosition"]
+            size = min(params["limit"], cap)
+            if start == short_at:
+                size -= 1
+            response = Mock()
+            response.json.return_value = {
+                "GET_STATS_DATA": {
+                    "STATISTICAL_DATA": {
+                        "RESULT_INF": {
+                            "TOTAL_NUMBER": "450",
+                            "FROM_NUMBER": str(start),
+                            "TO_NUMBER": str(min(start + size - 1, 450)),
+                        }
+                    }
+                }
+            }
+            return response
+
+        return fake_get
+
+    def test_get_stats_data_generator_concurrent_capped_pages(self):
+        """Test concurrent pages step by the records the API returns"""
+        self.mock_client.get.side_effect = self._capped_get(cap=150)
+
+        client = EstatApiClient(app_id="test_app_id")
+        pages = list(
+            client.get_stats_data_generator(
+                stats_data_id="0000020202", limit_per_request=200, max_workers=3
+            )
+        )
+
+        from_numbers = [
+            int(p["GET_STATS_DATA"]["STATISTICAL_DATA"]["RESULT_INF"]["FROM_NUMBER"])
+            for p in pages
+        ]
+        assert from_numbers == [1, 151, 301]
+
+    def test_get_stats_data_generator_concurrent_short_page(self):
+        """Test a concurrent page missing records is raised"""
+        self.mock_client.get.side_effect = self._capped_get(cap=100, short_at=201)
+
+        client = EstatApiClient(app_id="test_app_id")
+        with pytest.raises(ValueError, match="startPosition 201"):
+            list(
+                client.get_stats_data_generator(
+                    stats_data_id="0000020202", limit_per_request=100, max_workers=3
+                )
+            )
+
+    def test_get_stats_data_generator_meta_first_page_only(self):
+        """Test later pages are requested without metadata"""
+
+        def fake_get(url, params, headers, **kwargs):
+            start = params["startPosition"]
+            response = Mock()
+            response.json.return_value = {
+                "GET_STATS_DATA": {
+                    "STATISTICAL_DATA": {
+                        "RESULT_INF": {
+                            "TOTAL_NUMBER": "250",
+                            "FROM_NUMBER": str(start),
+                            "TO_NUMBER": str(min(start + 99, 250)),
+                        }
+                    }
+                }
+            }
+            return response
+
+        self.mock_client.get.side_effect = fake_get
+
+        client = EstatApiClient(app_id="test_app_id")
+        list(
+            client.get_stats_data_generator(
+                stats_data_id="0000020202",
+                limit_per_request=100,
+                meta_first_page_only=True,
+                metaGetFlg="Y",
+            )
+        )
+
+        flags = [
+            c[1]["params"]["metaGetFlg"] for c in self.mock_client.get.call_args_list
+        ]
+        assert flags == ["Y", "N", "N"]
+
+    def test_get_stats_data_generator_max_rows(self):
+        """Test the last page is trimmed to max_rows"""
+
+        def fake_get(url, params, headers, **kwargs):
+            start = params["startPosition"]
+            response = Mock()
+            response.json.return_value = {
+                "GET_STATS_DATA": {
+                    "STATISTICAL_DATA": {
+                        "RESULT_INF": {
+                            "TOTAL_NUMBER": "450",
+                            "FROM_NUMBER": str(start),
+                            "TO_NUMBER": str(min(start + params["limit"] - 1, 450)),
+                        }
+                    }
+                }
+            }
+            return response
+
+        self.mock_client.get.side_effect = fake_get
+
+        client = EstatApiClient(app_id="test_app_id")
+        for max_workers in (1, 3):
+            self.mock_client.get.reset_mock()
+            list(
+                client.get_stats_data_generator(
+                    stats_data_id="0000020202",
+                    limit_per_request=100,
+                    max_workers=max_workers,
+                    max_rows=250,
+                )
+            )
+
+            limits = [
+                c[1]["params"]["limit"] for c in self.mock_client.get.call_args_list
+            ]
+            assert limits == [100, 100, 50]
+
+    def test_get_meta_info(self):
+        """Test metadata retrieval"""
+        mock_response = Mock()
+        mock_response.json.return_value = {"GET_META_INFO": {}}
+        self.mock_client.get.return_value = mock_response
+
+        client = EstatApiClient(app_id="test_app_id")
+        result = client.get_meta_info(stats_data_id="0000020202")
+
+        assert result == {"GET_META_INFO": {}}
+        call_args = self.mock_client.get.call_args
+        assert call_args[0][0].endswith(ESTAT_ENDPOINTS["meta_info"])
+        assert call_args[1]["params"]["statsDataId"] == "0000020202"
+
+    def test_get_stats_data_generator_invalid_workers(self):
+        """Test max_workers must be positive"""
+        client = EstatApiClient(app_id="test_app_id")
+        with pytest.raises(ValueError, match="max_workers"):
+            list(client.get_stats_data_generator("0000020202", max_workers=0))
+
     def test_get_stats_list(self):
         """Test statistics list retrieval"""
         mock_response_data = {
@@ -0,0 +1,150 @@
+"""Tests for AsyncEstatApiClient and async_estat_table."""
+
+import asyncio
+
+import httpx
+import pytest
+from dlt.extract.resource import DltResource
+
+from estat_api_dlt_helper.api.async_client import AsyncEstatApiClient
+from estat_api_dlt_helper.loader.estat_table import async_estat_table
+
+
+def _page(total: int, start: int, size: int) -> dict:
+    return {
+        "GET_STATS_DATA": {
+            "STATISTICAL_DATA": {
+                "RESULT_INF": {
+                    "TOTAL_NUMBER": str(total),
+                    "FROM_NUMBER": str(start),
+                    "TO_NUMBER": str(min(start + size - 1, total)),
+                }
+            }
+        }
+    }
+
+
+def _make_client(handler) -> AsyncEstatApiClient:
+    client = AsyncEstatApiClient(app_id="test_app_id", backoff_factor=0)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncEstatApiClient:
+    """Test cases for AsyncEstatApiClient"""
+
+    def test_get_stats_data_params(self):
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.update(request.url.params)
+            return httpx.Response(200, json={"test": "data"})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.get_stats_data("0000020202", limit=10)
+
+        assert asyncio.run(run()) == {"test": "data"}
+        assert seen["appId"] == "test_app_id"
+        assert seen["statsDataId"] == "0000020202"
+        assert seen["limit"] == "10"
+        assert seen["metaGetFlg"] == "Y"
+
+    def test_get_stats_data_generator(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params["startPosition"])
+            return httpx.Response(200, json=_page(150, start, 100))
+
+        async def run():
+            async with _make_client(handler) as client:
+                return [
+                    page
+                    async for page in client.get_stats_data_generator(
+                        "0000020202", limit_per_request=100
+                    )
+                ]
+
+        pages = asyncio.run(run())
+        assert len(pages) == 2
+        assert pages[1] == _page(150, 101, 100)
+
+    def test_retries_on_server_error(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with _make_client(handler) as client:
+                return await client.get_stats_list(search_word="人口")
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert len(calls) == 3
+        assert calls[-1].url.params["searchWord"] == "人口"
+
+    def test_raises_after_max_attempts(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        async def run():
+            async with _make_client(handler) as client:
+                client.max_attempts = 2
+                await client.get_stats_data("0000020202")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_rate_limiter_acquired_per_attempt(self):
+        class CountingLimiter:
+            acquired = 0
+
+            def acquire(self) -> float:
+                self.acquired += 1
+                return 0.0
+
+        limiter = CountingLimiter()
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) < 2:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with _make_client(handler) as client:
+                client.rate_limiter = limiter  # type: ignore[assignment]
+                return await client.get_stats_data("0000020202")
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert limiter.acquired == 2
+
+
+class TestAsyncEstatTable:
+    """Tests for async_estat_table function."""
+
+    def test_returns_dlt_resource(self):
+        resource = async_estat_table(stats_data_id="0000020201", app_id="test")
+        assert isinstance(resource, DltResource)
+        assert resource.name == "estat_0000020201"
+
+    def test_empty_stats_data_id_raises(self):
+        with pytest.raises(ValueError, match="stats_data_id must not be empty"):
+            async_estat_table(stats_data_id="", app_id="test_app_id")
+
+    def test_yields_parsed_tables(self, monkeypatch, sample_response_data):
+        async def fake_generator(self, stats_data_id, limit_per_request, **kwargs):
+            yield sample_response_data
+
+        monkeypatch.setattr(
+            AsyncEstatApiClient, "get_stats_data_generator", fake_generator
+        )
+
+        resource = async_estat_table(stats_data_id="0000020201", app_id="test")
+        tables = list(resource)
+
+        assert len(tables) == 1
+        assert "value" in tables[0].column_names
@@ -0,0 +1,110 @@
+"""Tests for the process-wide client registry."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import dlt
+import pytest
+
+from estat_api_dlt_helper.api.client import EstatApiClient
+from estat_api_dlt_helper.api.client_registry import (
+    ClientRegistry,
+    get_client_registry,
+)
+from estat_api_dlt_helper.loader.estat_source import estat_source
+
+
+class TestClientRegistry:
+    """Test cases for ClientRegistry"""
+
+    def test_same_key_shares_http_client(self):
+        registry = ClientRegistry()
+
+        first = registry.get_http_client("app")
+        second = registry.get_http_client(
+            "app", "https://api.e-stat.go.jp/rest/3.0/app/json/"
+        )
+
+        assert first is second
+        assert registry.get_http_client("other_app") is not first
+        assert registry.get_http_client("app", "https://example.com/") is not first
+        assert len(registry) == 3
+
+    def test_thread_safe(self):
+        registry = ClientRegistry()
+        barrier = threading.Barrier(8)
+
+        def get(_):
+            barrier.wait()
+            return registry.get_http_client("app")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(get, range(8)))
+
+        assert all(client is clients[0] for client in clients)
+
+    @patch("estat_api_dlt_helper.api.client_registry.Client")
+    def test_pool_size(self, mock_client_cls):
+        registry = ClientRegistry(pool_size=4)
+        registry.get_http_client("app")
+        registry.pool_size = 16
+        registry.clear()
+        registry.get_http_client("app")
+
+        assert [c.kwargs for c in mock_client_cls.call_args_list] == [
+            {"max_connections": 4},
+            {"max_connections": 16},
+        ]
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError, match="pool_size"):
+            ClientRegistry(pool_size=0)
+
+    def test_borrowed_client(self):
+        http_client = Mock()
+        http_client.get.return_value = Mock(ok=True)
+        registry = ClientRegistry()
+
+        with patch.object(registry, "get_http_client", return_value=http_client):
+            client = registry.client("app", timeout=30, json_decoder="json")
+
+        assert client.shared
+        client._make_request("getStatsData", {})
+        assert http_client.get.call_args.kwargs["timeout"] == 30
+
+        client.close()
+        http_client.session.close.assert_not_called()
+
+    def test_default_registry(self):
+        assert get_client_registry() is get_client_registry()
+
+
+class TestEstatSourceSharedConnections:
+    """Test that estat_source resources borrow the shared HTTP client."""
+
+    def test_resources_borrow_registry_client(
+        self, monkeypatch, sample_response_data, tmp_path
+    ):
+        http_clients = []
+
+        def fake_generator(self, stats_data_id, limit_per_request, **kwargs):
+            http_clients.append(self.client)
+            yield sample_response_data
+
+        monkeypatch.setattr(EstatApiClient, "get_stats_data_generator", fake_generator)
+        pipeline = dlt.pipeline(
+            pipeline_name="shared_connections",
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / "shared.duckdb")),
+            dataset_name="estat",
+        )
+
+        pipeline.run(
+            estat_source(
+                stats_data_ids=["0000020201", "0000020202"], app_id="registry_app"
+            )
+        )
+
+        shared = get_client_registry().get_http_client("registry_app")
+        assert http_clients == [shared, shared]
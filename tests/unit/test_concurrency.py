@@ -0,0 +1,67 @@
+"""Tests for the concurrency limiting helper."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from estat_api_dlt_helper.utils import limit_concurrency
+
+
+class TestLimitConcurrency:
+    """Test cases for limit_concurrency"""
+
+    def test_yields_in_order(self):
+        limiter = threading.BoundedSemaphore(1)
+
+        assert list(limit_concurrency(range(5), limiter)) == list(range(5))
+
+    def test_caps_concurrent_producers(self):
+        limiter = threading.BoundedSemaphore(2)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def source():
+            nonlocal active, peak
+            for i in range(3):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+                yield i
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(
+                executor.map(
+                    lambda _: list(limit_concurrency(source(), limiter)), range(5)
+                )
+            )
+
+        assert results == [[0, 1, 2]] * 5
+        assert peak == 2
+
+    def test_slot_released_while_consumer_holds_item(self):
+        limiter = threading.BoundedSemaphore(1)
+        first = limit_concurrency(range(3), limiter)
+        second = limit_concurrency(range(3), limiter)
+
+        assert next(first) == 0
+        assert next(second) == 0
+
+    def test_close_closes_source(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.set()
+
+        items = limit_concurrency(source(), threading.BoundedSemaphore(1))
+        next(items)
+        items.close()
+
+        assert closed.is_set()
@@ -0,0 +1,526 @@
+"""Tests for the page fetching helpers of dlt_resource."""
+
+import copy
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import dlt
+import pyarrow as pa
+import pytest
+from dlt.pipeline.exceptions import PipelineStepFailed
+from requests import ConnectionError as RequestsConnectionError
+
+from estat_api_dlt_helper.config import EstatDltConfig
+from estat_api_dlt_helper.loader.checkpoint import TableCheckpoint
+from estat_api_dlt_helper.loader.dlt_resource import (
+    _fetch_estat_data,
+    _fetch_with_checkpoints,
+    create_estat_resource,
+)
+
+
+def _page(sample_response_data, with_metadata=True):
+    page = copy.deepcopy(sample_response_data)
+    statistical_data = page["GET_STATS_DATA"]["STATISTICAL_DATA"]
+    if not with_metadata:
+        del statistical_data["CLASS_INF"]
+        del statistical_data["TABLE_INF"]
+    return page
+
+
+class TestFetchEstatDataReuseMetadata:
+    """Tests for fetching CLASS_INF once per table."""
+
+    def test_metadata_from_first_page(self, sample_response_data):
+        client = MagicMock()
+        client.get_stats_data_generator.return_value = iter(
+            [
+                _page(sample_response_data),
+                _page(sample_response_data, with_metadata=False),
+            ]
+        )
+
+        tables = list(
+            _fetch_estat_data(
+                client, "0000020201", {"metaGetFlg": "Y"}, reuse_metadata=True
+            )
+        )
+
+        assert len(tables) == 2
+        assert tables[0].schema == tables[1].schema
+        kwargs = client.get_stats_data_generator.call_args.kwargs
+        assert kwargs["meta_first_page_only"] is True
+        client.get_meta_info.assert_not_called()
+
+    def test_metadata_from_meta_info(self, sample_response_data):
+        statistical_data = sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        client = MagicMock()
+        client.get_meta_info.return_value = {
+            "GET_META_INFO": {
+                "METADATA_INF": {
+                    "TABLE_INF": statistical_data["TABLE_INF"],
+                    "CLASS_INF": statistical_data["CLASS_INF"],
+                }
+            }
+        }
+        client.get_stats_data_generator.return_value = iter(
+            [_page(sample_response_data, with_metadata=False)]
+        )
+
+        tables = list(
+            _fetch_estat_data(
+                client,
+                "0000020201",
+                {"metaGetFlg": "N", "lang": "J"},
+                reuse_metadata=True,
+            )
+        )
+
+        assert len(tables) == 1
+        assert "area_metadata" in tables[0].column_names
+        client.get_meta_info.assert_called_once_with("0000020201", lang="J")
+
+
+class TestFetchEstatDataBatchSize:
+    """Tests for yielding bounded record batches."""
+
+    def test_yields_record_batches(self, sample_response_data):
+        client = MagicMock()
+        client.get_stats_data_generator.return_value = iter(
+            [_page(sample_response_data), _page(sample_response_data)]
+        )
+
+        items = list(_fetch_estat_data(client, "0000020201", {}, batch_size=1))
+
+        assert len(items) == 4
+        assert all(isinstance(item, pa.RecordBatch) for item in items)
+        assert all(item.num_rows == 1 for item in items)
+
+    def test_stops_at_maximum_offset(self, sample_response_data):
+        page = _page(sample_response_data)
+        page["GET_STATS_DATA"]["STATISTICAL_DATA"]["RESULT_INF"] = {
+            "TOTAL_NUMBER": 4,
+            "FROM_NUMBER": 1,
+            "TO_NUMBER": 2,
+        }
+        client = MagicMock()
+        client.get_stats_data_generator.return_value = iter([page, page])
+
+        items = list(
+            _fetch_estat_data(client, "0000020201", {}, maximum_offset=2, batch_size=1)
+        )
+
+        assert len(items) == 2
+
+
+class TestFetchEstatDataPrefetch:
+    """Tests for fetching pages ahead on a fetcher thread."""
+
+    def test_prefetched_pages_match(self, sample_response_data):
+        client = MagicMock()
+        client.get_stats_data_generator.side_effect = lambda **kwargs: iter(
+            [_page(sample_response_data) for _ in range(3)]
+        )
+
+        expected = list(_fetch_estat_data(client, "0000020201", {}))
+        tables = list(_fetch_estat_data(client, "0000020201", {}, prefetch_pages=2))
+
+        assert len(tables) == 3
+        assert all(t.equals(e) for t, e in zip(tables, expected, strict=True))
+
+
+def _raw_pages(sample_response_data, total, limit, with_metadata=True):
+    """Build page bodies keyed by start position, each value tagged by page."""
+    bodies = {}
+    for start in range(1, total + 1, limit):
+        page = _page(sample_response_data, with_metadata)
+        statistical_data = page["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        statistical_data["RESULT_INF"] = {
+            "TOTAL_NUMBER": total,
+            "FROM_NUMBER": start,
+            "TO_NUMBER": min(start + limit - 1, total),
+        }
+        for value in statistical_data["DATA_INF"]["VALUE"]:
+            value["$"] = str(start)
+        bodies[start] = json.dumps(page, ensure_ascii=False).encode("utf-8")
+    return bodies
+
+
+class TestFetchEstatDataParseWorkers:
+    """Tests for parsing pages on worker processes."""
+
+    def _client(self, bodies):
+        client = MagicMock()
+        client.json_decoder = "json"
+        client.get_stats_data_raw.side_effect = (
+            lambda stats_data_id, start_position, limit, **params: bodies[
+                start_position
+            ]
+        )
+        return client
+
+    def test_pages_yielded_in_order(self, sample_response_data):
+        bodies = _raw_pages(sample_response_data, total=10, limit=2)
+        client = self._client(bodies)
+
+        tables = list(
+            _fetch_estat_data(client, "0000020201", {}, limit=2, parse_workers=2)
+        )
+
+        assert [t["value"][0].as_py() for t in tables] == [1, 3, 5, 7, 9]
+        expected = _fetch_estat_data(
+            MagicMock(
+                get_stats_data_generator=MagicMock(
+                    return_value=iter([json.loads(bodies[1])])
+                )
+            ),
+            "0000020201",
+            {},
+        )
+        assert tables[0].equals(next(expected))
+
+    def test_maximum_offset_and_batch_size(self, sample_response_data):
+        client = self._client(_raw_pages(sample_response_data, total=10, limit=2))
+
+        items = list(
+            _fetch_estat_data(
+                client,
+                "0000020201",
+                {},
+                limit=2,
+                maximum_offset=3,
+                batch_size=1,
+                parse_workers=1,
+            )
+        )
+
+        assert len(items) == 4
+        assert all(isinstance(item, pa.RecordBatch) for item in items)
+        positions = [
+            call.kwargs["start_position"]
+            for call in client.get_stats_data_raw.call_args_list
+        ]
+        assert positions == [1, 3]
+
+    def test_pages_capped_by_the_api(self, sample_response_data):
+        # The API returns 3 records per page although 5 were requested
+        client = self._client(_raw_pages(sample_response_data, total=9, limit=3))
+
+        tables = list(
+            _fetch_estat_data(client, "0000020201", {}, limit=5, parse_workers=2)
+        )
+
+        assert [t["value"][0].as_py() for t in tables] == [1, 4, 7]
+
+    def test_short_page_raises(self, sample_response_data):
+        bodies = _raw_pages(sample_response_data, total=10, limit=2)
+        bodies[5] = bodies[5].replace(b'"TO_NUMBER": 6', b'"TO_NUMBER": 5')
+        client = self._client(bodies)
+
+        with pytest.raises(ValueError, match="startPosition 5"):
+            list(_fetch_estat_data(client, "0000020201", {}, limit=2, parse_workers=2))
+
+    def test_reuse_metadata_from_meta_info(self, sample_response_data):
+        statistical_data = sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        client = self._client(
+            _raw_pages(sample_response_data, total=4, limit=2, with_metadata=False)
+        )
+        client.get_meta_info.return_value = {
+            "GET_META_INFO": {
+                "METADATA_INF": {
+                    "TABLE_INF": statistical_data["TABLE_INF"],
+                    "CLASS_INF": statistical_data["CLASS_INF"],
+                }
+            }
+        }
+
+        tables = list(
+            _fetch_estat_data(
+                client,
+                "0000020201",
+                {},
+                limit=2,
+                reuse_metadata=True,
+                parse_workers=2,
+            )
+        )
+
+        assert len(tables) == 2
+        assert "area_metadata" in tables[0].column_names
+        for call in client.get_stats_data_raw.call_args_list:
+            assert call.kwargs["metaGetFlg"] == "N"
+
+
+class TestCreateEstatResourceStarSchema:
+    """Tests for create_estat_resource with star_schema."""
+
+    @patch("estat_api_dlt_helper.loader.dlt_resource.EstatApiClient")
+    def test_dimension_rows_per_table(
+        self, mock_client_cls, sample_response_data, tmp_path
+    ):
+        def generator(stats_data_id, **kwargs):
+            page = _page(sample_response_data)
+            class_inf = page["GET_STATS_DATA"]["STATISTICAL_DATA"]["CLASS_INF"]
+            for class_obj in class_inf["CLASS_OBJ"]:
+                if class_obj["@id"] == "area":
+                    # Same code, different label in each table
+                    class_obj["CLASS"][0]["@name"] = f"label {stats_data_id}"
+            return iter([page])
+
+        client = mock_client_cls.return_value
+        client.get_stats_data_generator.side_effect = generator
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": ["0000020201", "0000020202"]},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "pop",
+                "write_disposition": "replace",
+            },
+            star_schema=True,
+        )
+        pipeline = dlt.pipeline(
+            pipeline_name="star_resource",
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / "star.duckdb")),
+            dataset_name="estat",
+        )
+
+        pipeline.run(create_estat_resource(config))
+
+        with pipeline.sql_client() as client:
+            fact_count = client.execute_sql("SELECT COUNT(*) FROM pop")
+            duplicates = client.execute_sql(
+                "SELECT stats_data_id, code FROM pop_area"
+                " GROUP BY stats_data_id, code HAVING COUNT(*) > 1"
+            )
+            labels = client.execute_sql(
+                "SELECT stats_data_id, name FROM pop_area"
+                " WHERE code = '01100' ORDER BY stats_data_id"
+            )
+        assert fact_count[0][0] == 4
+        assert duplicates == []
+        assert labels == [
+            ("0000020201", "label 0000020201"),
+            ("0000020202", "label 0000020202"),
+        ]
+        assert "pop_tab" in pipeline.default_schema.tables
+        # Dimensions come from the CLASS_INF of the pages
+        mock_client_cls.return_value.get_meta_info.assert_not_called()
+
+
+class TestCreateEstatResourceMaxConcurrency:
+    """Tests for fetching several tables at the same time."""
+
+    @patch("estat_api_dlt_helper.loader.dlt_resource.EstatApiClient")
+    def test_tables_yielded_in_order(self, mock_client_cls, sample_response_data):
+        def generator(stats_data_id, **kwargs):
+            page = _page(sample_response_data)
+            for value in page["GET_STATS_DATA"]["STATISTICAL_DATA"]["DATA_INF"][
+                "VALUE"
+            ]:
+                value["$"] = stats_data_id[-1]
+            return iter([page, page])
+
+        client = mock_client_cls.return_value
+        client.get_stats_data_generator.side_effect = generator
+        ids = ["0000020201", "0000020202", "0000020203"]
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": ids},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "pop",
+            },
+            max_concurrency=2,
+        )
+
+        tables = list(create_estat_resource(config))
+
+        assert [t["value"][0].as_py() for t in tables] == [1, 1, 2, 2, 3, 3]
+        assert mock_client_cls.call_count == 1
+        client.close.assert_called_once()
+
+    @patch("estat_api_dlt_helper.loader.dlt_resource.EstatApiClient")
+    def test_adaptive_concurrency(self, mock_client_cls, sample_response_data):
+        client = mock_client_cls.return_value
+        client.get_stats_data_generator.return_value = iter(
+            [_page(sample_response_data)]
+        )
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": "0000020201"},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "pop",
+            },
+            max_concurrency=3,
+            adaptive_concurrency=True,
+        )
+
+        list(create_estat_resource(config))
+
+        controller = mock_client_cls.call_args.kwargs["adaptive_concurrency"]
+        assert controller.max_limit == 3
+
+
+def _pages_fetch(pages, fail_at=None):
+    """Fetch function over (to_number, total) pages, failing at a page index."""
+    calls = []
+
+    def fetch(start_position, on_page):
+        calls.append(start_position)
+        for index, (to_number, total) in enumerate(pages):
+            if to_number < start_position:
+                continue
+            if index == fail_at:
+                raise RequestsConnectionError("connection reset")
+            yield pa.table({"to_number": [to_number]})
+            on_page(to_number, total)
+
+    return fetch, calls
+
+
+def _to_numbers(items):
+    return [item["to_number"][0].as_py() for item in items]
+
+
+class TestFetchWithCheckpoints:
+    """Tests for resuming pagination from checkpoints spooled to disk."""
+
+    PAGES = [(100, 250), (200, 250), (250, 250)]
+
+    def test_failure_keeps_checkpoint_and_raises(self, tmp_path):
+        fetch, _ = _pages_fetch(self.PAGES, fail_at=2)
+        items = []
+
+        with pytest.raises(RequestsConnectionError):
+            for item in _fetch_with_checkpoints(fetch, tmp_path, "0001", {}):
+                items.append(item)
+
+        assert _to_numbers(items) == [100, 200]
+        progress = TableCheckpoint(tmp_path / "0001", "").load()
+        assert progress is not None
+        assert progress["to_number"] == 200
+        assert progress["total_number"] == 250
+        assert progress["items"] == 2
+
+    def test_resume_replays_spooled_pages(self, tmp_path):
+        failing, _ = _pages_fetch(self.PAGES, fail_at=2)
+        with pytest.raises(RequestsConnectionError):
+            list(_fetch_with_checkpoints(failing, tmp_path, "0001", {}))
+        fetch, calls = _pages_fetch(self.PAGES)
+
+        items = list(_fetch_with_checkpoints(fetch, tmp_path, "0001", {}))
+
+        assert calls == [201]
+        assert _to_numbers(items) == [100, 200, 250]
+        # Complete tables start over on the next run
+        assert not (tmp_path / "0001").exists()
+
+    def test_changed_request_and_full_reload_start_over(self, tmp_path):
+        for params, full_reload in (({"cdArea": "01000"}, False), ({}, True)):
+            failing, _ = _pages_fetch(self.PAGES, fail_at=2)
+            with pytest.raises(RequestsConnectionError):
+                list(_fetch_with_checkpoints(failing, tmp_path, "0001", {}))
+            fetch, calls = _pages_fetch(self.PAGES)
+
+            items = list(
+                _fetch_with_checkpoints(fetch, tmp_path, "0001", params, full_reload)
+            )
+
+            assert calls == [1]
+            assert _to_numbers(items) == [100, 200, 250]
+
+    def test_closed_consumer_discards_checkpoint(self, tmp_path):
+        failing, _ = _pages_fetch(self.PAGES, fail_at=2)
+        with pytest.raises(RequestsConnectionError):
+            list(_fetch_with_checkpoints(failing, tmp_path, "0001", {}))
+        fetch, _ = _pages_fetch(self.PAGES)
+
+        items = _fetch_with_checkpoints(fetch, tmp_path, "0001", {})
+        next(items)
+        items.close()
+
+        assert not (tmp_path / "0001").exists()
+
+    def test_failure_before_any_page_is_raised(self, tmp_path):
+        fetch, calls = _pages_fetch(self.PAGES, fail_at=0)
+
+        with pytest.raises(RequestsConnectionError):
+            list(_fetch_with_checkpoints(fetch, tmp_path, "0001", {}))
+        assert TableCheckpoint(tmp_path / "0001", "").load() is None
+
+
+class TestCreateEstatResourceResumable:
+    """Tests for resuming create_estat_resource after a failed page."""
+
+    @patch("estat_api_dlt_helper.loader.dlt_resource.EstatApiClient")
+    def test_rerun_resumes_from_failed_page(
+        self, mock_client_cls, sample_response_data, tmp_path
+    ):
+        def page(from_number, to_number):
+            data = _page(sample_response_data)
+            data["GET_STATS_DATA"]["STATISTICAL_DATA"]["RESULT_INF"] = {
+                "TOTAL_NUMBER": 4,
+                "FROM_NUMBER": from_number,
+                "TO_NUMBER": to_number,
+            }
+            return data
+
+        start_positions = []
+
+        def generator(start_position=1, **kwargs):
+            start_positions.append(start_position)
+            if start_position == 1:
+                yield page(1, 2)
+                raise RequestsConnectionError("connection reset")
+            yield page(3, 4)
+
+        mock_client_cls.return_value.get_stats_data_generator.side_effect = generator
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": "0000020201", "limit": 2},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "pop",
+                "write_disposition": "append",
+            },
+            resumable=True,
+        )
+        pipeline = dlt.pipeline(
+            pipeline_name="resumable_resource",
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / "resume.duckdb")),
+            dataset_name="estat",
+        )
+
+        with pytest.raises(PipelineStepFailed):
+            pipeline.run(create_estat_resource(config))
+        pipeline.run(create_estat_resource(config))
+
+        # The second run starts at the failed page and loads the first
+        # page from the checkpoint
+        assert start_positions == [1, 3]
+        with pipeline.sql_client() as client:
+            count = client.execute_sql("SELECT COUNT(*) FROM pop")
+        assert count[0][0] == 4
+        checkpoints = Path(pipeline.working_dir) / "estat_checkpoints" / "pop"
+        assert not (checkpoints / "0000020201").exists()
+
+    def test_max_concurrency_not_supported(self):
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": ["0000020201", "0000020202"]},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "pop",
+                "write_disposition": "append",
+            },
+            resumable=True,
+            max_concurrency=2,
+        )
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            create_estat_resource(config)
@@ -1,11 +1,16 @@
 """Tests for estat_source function."""
 
+import importlib
 import inspect
+import threading
+import time
 
 import dlt
+import pyarrow as pa
 import pytest
 from dlt.extract.source import DltSource
 
+from estat_api_dlt_helper.api.client import EstatApiClient
 from estat_api_dlt_helper.loader.estat_source import (
     _normalize_stats_data_ids,
     estat_source,
@@ -387,3 +392,322 @@ class TestEstatSourceIncremental:
             sig = inspect.signature(resource._pipe.gen.__wrapped__)  # type: ignore[union-attr]
             default = sig.parameters["time_incremental"].default
             assert default is None
+
+
+class TestEstatSourceSkipUnchanged:
+    """Tests for UPDATED_DATE based change detection."""
+
+    @pytest.fixture
+    def fake_api(self, monkeypatch):
+        """Patch the metadata call and the data fetch; return the call log."""
+        api = {"updated_date": "2024-06-21", "fetched": [], "checked": []}
+
+        def fake_updated_date(client, stats_data_id, params):
+            api["checked"].append(params.get("lang"))
+            return api["updated_date"]
+
+        def fake_fetch(client, stats_data_id, **kwargs):
+            api["fetched"].append(stats_data_id)
+            yield pa.table({"time": ["2020"], "value": [1.0]})
+
+        # The loader package re-exports functions under the module names
+        table_module = importlib.import_module(
+            "estat_api_dlt_helper.loader.estat_table"
+        )
+        monkeypatch.setattr(table_module, "_get_updated_date", fake_updated_date)
+        monkeypatch.setattr(table_module, "_fetch_estat_data", fake_fetch)
+        return api
+
+    def _run(self, pipeline, **kwargs):
+        pipeline.run(
+            estat_source(
+                stats_data_ids="0000020201",
+                app_id="test_app_id",
+                skip_unchanged=True,
+                **kwargs,
+            )
+        )
+
+    def test_unchanged_table_is_skipped_without_truncation(self, fake_api, tmp_path):
+        pipeline = dlt.pipeline(
+            pipeline_name="skip_unchanged",
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / "skip.duckdb")),
+            dataset_name="estat",
+        )
+
+        self._run(pipeline)
+        self._run(pipeline)
+
+        assert fake_api["fetched"] == ["0000020201"]
+        with pipeline.sql_client() as client:
+            rows = client.execute_sql("SELECT COUNT(*) FROM estat_0000020201")
+        assert rows[0][0] == 1
+
+        fake_api["updated_date"] = "2024-07-01"
+        self._run(pipeline)
+
+        assert fake_api["fetched"] == ["0000020201", "0000020201"]
+
+    def test_checked_on_extract_with_table_params(self, fake_api, tmp_path):
+        pipeline = dlt.pipeline(
+            pipeline_name="skip_unchanged_lang",
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / "lang.duckdb")),
+            dataset_name="estat",
+        )
+        source = estat_source(
+            stats_data_ids="0000020201",
+            app_id="test_app_id",
+            skip_unchanged=True,
+            lang="E",
+        )
+
+        assert fake_api["checked"] == []
+        pipeline.run(source)
+        assert fake_api["checked"] == ["E"]
+
+    def test_tables_with_skip_unchanged_raises(self):
+        with pytest.raises(ValueError, match="skip_unchanged"):
+            estat_source(
+                tables=[estat_table(stats_data_id="0000020201", app_id="test")],
+                app_id="test_app_id",
+                skip_unchanged=True,
+            )
+
+
+@pytest.fixture
+def fake_estat_api(monkeypatch, sample_response_data):
+    """Serve the sample response for getStatsData and getMetaInfo."""
+    statistical_data = sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]
+
+    def fake_generator(self, stats_data_id, limit_per_request, **kwargs):
+        yield sample_response_data
+
+    def fake_meta_info(self, stats_data_id, **kwargs):
+        return {
+            "GET_META_INFO": {
+                "METADATA_INF": {
+                    "TABLE_INF": statistical_data["TABLE_INF"],
+                    "CLASS_INF": statistical_data["CLASS_INF"],
+                }
+            }
+        }
+
+    monkeypatch.setattr(EstatApiClient, "get_stats_data_generator", fake_generator)
+    monkeypatch.setattr(EstatApiClient, "get_meta_info", fake_meta_info)
+
+
+def _duckdb_pipeline(name, tmp_path):
+    return dlt.pipeline(
+        pipeline_name=name,
+        pipelines_dir=str(tmp_path),
+        destination=dlt.destinations.duckdb(str(tmp_path / f"{name}.duckdb")),
+        dataset_name="estat",
+    )
+
+
+class TestEstatSourceStatInfMode:
+    """Tests for stat_inf_mode="id" and the estat_table_info resource."""
+
+    def test_table_info_resource_added(self):
+        source = estat_source(
+            stats_data_ids=["0000020201", "0004028584"],
+            app_id="test_app_id",
+            stat_inf_mode="id",
+        )
+
+        assert "estat_table_info" in source.resources
+        assert len(source.resources) == 3
+
+    def test_no_table_info_by_default(self):
+        source = estat_source(stats_data_ids="0000020201", app_id="test_app_id")
+
+        assert "estat_table_info" not in source.resources
+
+    def test_tables_mode_uses_table_setting(self):
+        source = estat_source(
+            tables=[
+                estat_table(stats_data_id="0000020201", stat_inf_mode="id"),
+                estat_table(stats_data_id="0004028584"),
+            ],
+            app_id="test_app_id",
+        )
+
+        assert "estat_table_info" in source.resources
+
+    def test_invalid_mode_raises(self):
+        with pytest.raises(ValueError, match="stat_inf_mode"):
+            estat_table(stats_data_id="0000020201", stat_inf_mode="run_end")
+
+    def test_pipeline_loads_table_info_once(self, fake_estat_api, tmp_path):
+        pipeline = _duckdb_pipeline("stat_inf_id", tmp_path)
+
+        for _ in range(2):
+            pipeline.run(
+                estat_source(
+                    stats_data_ids="0000020201",
+                    app_id="test_app_id",
+                    stat_inf_mode="id",
+                )
+            )
+
+        with pipeline.sql_client() as client:
+            rows = client.execute_sql(
+                "SELECT i.id, COUNT(*) FROM estat_0000020201 d "
+                "JOIN estat_table_info i ON d.stat_inf_id = i.id "
+                "GROUP BY i.id"
+            )
+            info_count = client.execute_sql("SELECT COUNT(*) FROM estat_table_info")
+        assert rows == [("0000020201", 2)]
+        assert info_count[0][0] == 1
+
+
+class TestEstatSourceStarSchema:
+    """Tests for star_schema and the estat_dimensions resource."""
+
+    def test_dimensions_resource_added(self):
+        source = estat_source(
+            stats_data_ids={"pop": "0000020201"},
+            app_id="test_app_id",
+            star_schema=True,
+        )
+
+        assert list(source.resources) == ["pop", "pop_dimensions"]
+
+    def test_tables_with_star_schema_raises(self):
+        with pytest.raises(ValueError, match="star_schema"):
+            estat_source(
+                tables=[estat_table(stats_data_id="0000020201", app_id="test")],
+                app_id="test_app_id",
+                star_schema=True,
+            )
+
+    def test_pipeline_loads_fact_and_dimension_tables(self, fake_estat_api, tmp_path):
+        pipeline = _duckdb_pipeline("star_schema", tmp_path)
+
+        pipeline.run(
+            estat_source(
+                stats_data_ids={"pop": "0000020201"},
+                app_id="test_app_id",
+                star_schema=True,
+            )
+        )
+
+        with pipeline.sql_client() as client:
+            columns = [
+                row[0]
+                for row in client.execute_sql(
+                    "SELECT column_name FROM information_schema.columns "
+                    "WHERE table_name = 'pop'"
+                )
+            ]
+            rows = client.execute_sql(
+                "SELECT p.area, a.name FROM pop p "
+                "JOIN pop_area a ON p.area = a.code ORDER BY p.area"
+            )
+            area_count = client.execute_sql("SELECT COUNT(*) FROM pop_area")
+            area_tables = client.execute_sql(
+                "SELECT DISTINCT stats_data_id FROM pop_area"
+            )
+        assert not [c for c in columns if "metadata" in c]
+        assert len(rows) == 2
+        assert area_count[0][0] >= 1
+        assert area_tables == [("0000020201",)]
+        assert pipeline.default_schema.tables["pop_area"]["columns"]["code"].get(
+            "primary_key"
+        )
+
+
+class TestEstatSourceBatchSize:
+    """Tests for loading record batches."""
+
+    def test_incremental_with_record_batches(self, fake_estat_api, tmp_path):
+        pipeline = _duckdb_pipeline("batch_size", tmp_path)
+
+        pipeline.run(
+            estat_source(
+                stats_data_ids="0000020201",
+                app_id="test_app_id",
+                write_disposition="append",
+                incremental=dlt.sources.incremental("time", initial_value="0"),
+                batch_size=1,
+            )
+        )
+
+        with pipeline.sql_client() as client:
+            rows = client.execute_sql("SELECT COUNT(*) FROM estat_0000020201")
+        assert rows[0][0] == 2
+
+    def test_tables_with_batch_size_raises(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            estat_source(
+                tables=[estat_table(stats_data_id="0000020201", app_id="test")],
+                app_id="test_app_id",
+                batch_size=1000,
+            )
+
+
+class TestEstatSourceMaxConcurrency:
+    """Tests for extracting tables in parallel under a shared cap."""
+
+    def test_tables_extracted_in_parallel_under_cap(
+        self, fake_estat_api, monkeypatch, sample_response_data, tmp_path
+    ):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_generator(self, stats_data_id, limit_per_request, **kwargs):
+            nonlocal active, peak
+            for _ in range(2):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+                yield sample_response_data
+
+        monkeypatch.setattr(EstatApiClient, "get_stats_data_generator", slow_generator)
+        pipeline = _duckdb_pipeline("max_concurrency", tmp_path)
+        source = estat_source(
+            stats_data_ids=["0000020201", "0000020202", "0000020203", "0000020204"],
+            app_id="test_app_id",
+            write_disposition="append",
+            incremental=dlt.sources.incremental("time", initial_value="0"),
+            max_concurrency=2,
+        )
+
+        pipeline.run(source)
+
+        assert peak == 2
+        with pipeline.sql_client() as client:
+            for sid in ("0000020201", "0000020204"):
+                rows = client.execute_sql(f"SELECT COUNT(*) FROM estat_{sid}")
+                assert rows[0][0] == 4
+        state = pipeline.state["sources"]["estat"]["resources"]
+        assert state["estat_0000020203"]["incremental"]["time"]["last_value"]
+
+    def test_tables_mode(self, fake_estat_api, tmp_path):
+        pipeline = _duckdb_pipeline("max_concurrency_tables", tmp_path)
+
+        pipeline.run(
+            estat_source(
+                tables=[
+                    estat_table(stats_data_id="0000020201", table_name="a"),
+                    estat_table(stats_data_id="0000020202", table_name="b"),
+                ],
+                app_id="test_app_id",
+                max_concurrency=1,
+            )
+        )
+
+        with pipeline.sql_client() as client:
+            assert client.execute_sql("SELECT COUNT(*) FROM b")[0][0] == 2
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            estat_source(
+                stats_data_ids="0000020201", app_id="test_app_id", max_concurrency=0
+            )
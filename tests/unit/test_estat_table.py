@@ -1,11 +1,15 @@
 """Tests for estat_table function."""
 
+import copy
 import inspect
+from unittest.mock import patch
 
 import dlt
 import pytest
 from dlt.extract.resource import DltResource
+from dlt.pipeline.exceptions import PipelineStepFailed
 from dlt.sources import incremental as dlt_incremental
+from requests import ConnectionError as RequestsConnectionError
 
 from estat_api_dlt_helper.loader.estat_table import (
     _build_api_params,
@@ -117,6 +121,63 @@ class TestEstatTable:
         with pytest.raises(ValueError, match="stats_data_id must not be empty"):
             estat_table(stats_data_id="", app_id="test_app_id")
 
+    def test_resumable_validation(self):
+        with pytest.raises(ValueError, match="partition_by"):
+            estat_table(
+                stats_data_id="0000020201",
+                write_disposition="append",
+                resumable=True,
+                partition_by="auto",
+            )
+
+        with pytest.raises(ValueError, match="incremental"):
+            estat_table(
+                stats_data_id="0000020201",
+                write_disposition="append",
+                resumable=True,
+                incremental=dlt_incremental("time", initial_value="0000000000"),
+            )
+
+        resource = estat_table(stats_data_id="0000020201", resumable=True)
+        assert resource.name == "estat_0000020201"
+
+    @patch("estat_api_dlt_helper.loader.estat_table._make_client")
+    def test_failed_page_does_not_advance_cursor(
+        self, mock_make_client, sample_response_data, tmp_path
+    ):
+        requested_from = []
+        failures = [RequestsConnectionError("connection reset")]
+
+        def generator(cdTimeFrom=None, **kwargs):
+            requested_from.append(cdTimeFrom)
+            yield copy.deepcopy(sample_response_data)
+            if failures:
+                raise failures.pop()
+
+        mock_make_client.return_value.get_stats_data_generator.side_effect = generator
+        resource = estat_table(
+            stats_data_id="0000020201",
+            app_id="test_app_id",
+            write_disposition="append",
+            incremental=dlt_incremental("time", initial_value="0000000000"),
+        )
+        pipeline = dlt.pipeline(
+            pipeline_name="incremental_failure",
+            pipelines_dir=str(tmp_path),
+            destination=dlt.destinations.duckdb(str(tmp_path / "incremental.duckdb")),
+            dataset_name="estat",
+        )
+
+        with pytest.raises(PipelineStepFailed):
+            pipeline.run(resource)
+        pipeline.run(resource)
+
+        # The failed run did not move cdTimeFrom past the missing pages
+        assert requested_from == ["0000000000", "0000000000"]
+        with pipeline.sql_client() as client:
+            count = client.execute_sql("SELECT COUNT(*) FROM estat_0000020201")
+        assert count[0][0] == 2
+
     def test_whitespace_stats_data_id_raises(self):
         with pytest.raises(ValueError, match="stats_data_id must not be empty"):
             estat_table(stats_data_id="   ", app_id="test_app_id")
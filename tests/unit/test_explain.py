@@ -0,0 +1,158 @@
+"""Tests for planning loads without loading (dry run)."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from estat_api_dlt_helper.config import EstatDltConfig
+from estat_api_dlt_helper.loader import estat_source, estat_table, load_estat_data
+from estat_api_dlt_helper.loader.explain import (
+    LoadPlan,
+    TablePlan,
+    explain_load,
+    explain_table,
+    plan_pages,
+)
+
+
+def _client(total_rows, sample_rows=2):
+    client = MagicMock()
+    client.get_stats_data.return_value = {
+        "GET_STATS_DATA": {
+            "STATISTICAL_DATA": {"RESULT_INF": {"TOTAL_NUMBER": total_rows}}
+        }
+    }
+    sample = {
+        "GET_STATS_DATA": {
+            "STATISTICAL_DATA": {
+                "RESULT_INF": {
+                    "TOTAL_NUMBER": total_rows,
+                    "FROM_NUMBER": 1,
+                    "TO_NUMBER": sample_rows,
+                },
+                "DATA_INF": {"VALUE": [{"$": "1"}] * sample_rows},
+            }
+        }
+    }
+    client.get_stats_data_raw.return_value = json.dumps(sample).encode()
+    client.get_meta_info.return_value = {
+        "GET_META_INFO": {"METADATA_INF": {"TABLE_INF": {}, "CLASS_INF": {}}}
+    }
+    return client
+
+
+class TestPlanPages:
+    """Test cases for plan_pages"""
+
+    def test_pages(self):
+        assert plan_pages(250, 100) == [100, 100, 50]
+        assert plan_pages(0, 100) == []
+
+    def test_last_page_trimmed_to_maximum_offset(self):
+        assert plan_pages(250, 100, maximum_offset=150) == [100, 50]
+        assert plan_pages(250, 100, maximum_offset=30) == [30]
+        assert plan_pages(20, 100, maximum_offset=30) == [20]
+
+
+class TestExplainTable:
+    """Test cases for explain_table"""
+
+    def test_plan(self):
+        client = _client(250)
+
+        plan = explain_table(
+            client, "0000020201", {"metaGetFlg": "Y"}, limit=100, maximum_offset=150
+        )
+
+        assert plan.total_rows == 250
+        assert plan.rows == 150
+        assert plan.requests == 2
+        body = client.get_stats_data_raw.return_value
+        assert plan.bytes_per_row == len(body) / 2
+        assert plan.metadata_pages == 2
+        assert plan.estimated_bytes == round(
+            150 * plan.bytes_per_row + 2 * plan.metadata_bytes
+        )
+        probe = client.get_stats_data.call_args.kwargs
+        assert probe["cntGetFlg"] == "Y"
+        sample = client.get_stats_data_raw.call_args.kwargs
+        assert sample["metaGetFlg"] == "N"
+        assert sample["limit"] == 100
+
+    def test_reuse_metadata_and_no_metadata(self):
+        plan = explain_table(
+            _client(250), "0000020201", {}, limit=100, reuse_metadata=True
+        )
+        assert plan.metadata_pages == 1
+
+        client = _client(250)
+        plan = explain_table(client, "0000020201", {"metaGetFlg": "N"}, limit=100)
+        assert plan.metadata_pages == 0
+        client.get_meta_info.assert_not_called()
+
+    def test_empty_table_is_not_sampled(self):
+        client = _client(0)
+
+        plan = explain_table(client, "0000020201", {})
+
+        assert plan.requests == 0
+        assert plan.estimated_bytes == 0
+        client.get_stats_data_raw.assert_not_called()
+
+
+class TestExplainLoad:
+    """Test cases for explain_load"""
+
+    @patch("estat_api_dlt_helper.loader.explain.EstatApiClient")
+    def test_source_tables(self, mock_client_cls):
+        mock_client_cls.return_value = _client(250)
+        source = estat_source(
+            tables=[estat_table("0000020201", limit=100)],
+            app_id="test_app_id",
+            maximum_offset=120,
+        )
+
+        plan = explain_load(source, sample_rows=0)
+
+        assert [table.stats_data_id for table in plan.tables] == ["0000020201"]
+        assert plan.tables[0].page_limits == [100, 20]
+        assert mock_client_cls.call_args.kwargs["app_id"] == "test_app_id"
+
+    def test_resource_without_app_id(self):
+        with pytest.raises(ValueError, match="app_id"):
+            explain_load(estat_table("0000020201"))
+
+    @patch("estat_api_dlt_helper.loader.explain.EstatApiClient")
+    def test_config(self, mock_client_cls):
+        mock_client_cls.return_value = _client(250)
+        config = EstatDltConfig(
+            source={
+                "app_id": "test_app_id",
+                "statsDataId": ["0000020201", "0000020202"],
+                "limit": 100,
+            },
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "test",
+                "table_name": "test",
+            },
+        )
+
+        plan = explain_load(config)
+
+        assert plan.requests == 6
+        assert plan.rows == 500
+        assert "Total: 500 rows, 6 requests" in plan.summary()
+
+    @patch("estat_api_dlt_helper.loader.load_manager.create_estat_pipeline")
+    @patch("estat_api_dlt_helper.loader.load_manager.explain_load")
+    def test_load_estat_data_dry_run(self, mock_explain, mock_pipeline):
+        mock_explain.return_value = LoadPlan([TablePlan("0000020201", 10, 10, [10])])
+        config = MagicMock()
+
+        result = load_estat_data(config, dry_run=True)
+
+        assert result is mock_explain.return_value
+        mock_explain.assert_called_once_with(config)
+        mock_pipeline.assert_not_called()
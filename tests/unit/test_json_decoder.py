@@ -0,0 +1,67 @@
+"""Tests for the pluggable JSON decoder backends."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from estat_api_dlt_helper.api.client import EstatApiClient
+from estat_api_dlt_helper.api.json_decoder import get_json_decoder
+from estat_api_dlt_helper.parser import parse_response
+
+
+class TestGetJsonDecoder:
+    """Test cases for get_json_decoder"""
+
+    def test_stdlib(self):
+        assert get_json_decoder("json")(b'{"a": [1, "b"]}') == {"a": [1, "b"]}
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown JSON decoder backend"):
+            get_json_decoder("ujson")
+
+    @pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+    def test_backend_matches_stdlib(self, backend, sample_response_data):
+        pytest.importorskip(backend)
+        body = json.dumps(sample_response_data, ensure_ascii=False).encode("utf-8")
+
+        decoded = get_json_decoder(backend, stats_data=True)(body)
+
+        assert decoded == sample_response_data
+        assert parse_response(decoded).equals(parse_response(sample_response_data))
+
+    def test_msgspec_validates_value_rows(self):
+        msgspec = pytest.importorskip("msgspec")
+        body = b'{"GET_STATS_DATA": {"STATISTICAL_DATA": {"DATA_INF": {"VALUE": [{"$": 1}]}}}}'
+
+        with pytest.raises(msgspec.ValidationError):
+            get_json_decoder("msgspec", stats_data=True)(body)
+
+
+class TestEstatApiClientJsonDecoder:
+    """Test cases for EstatApiClient with a JSON decoder backend"""
+
+    @patch("estat_api_dlt_helper.api.client.Client")
+    def test_custom_decoder(self, mock_client_cls):
+        mock_client_cls.return_value.get.return_value = Mock(content=b"{}")
+        decoder = Mock(return_value={"decoded": True})
+
+        client = EstatApiClient(app_id="test_app_id", json_decoder=decoder)
+
+        assert client.get_stats_data(stats_data_id="0000020202") == {"decoded": True}
+        assert client.get_stats_list() == {"decoded": True}
+        assert decoder.call_count == 2
+        mock_client_cls.return_value.get.return_value.json.assert_not_called()
+
+    @patch("estat_api_dlt_helper.api.client.Client")
+    def test_orjson_backend(self, mock_client_cls):
+        pytest.importorskip("orjson")
+        mock_client_cls.return_value.get.return_value = Mock(content=b'{"ok": 1}')
+
+        client = EstatApiClient(app_id="test_app_id", json_decoder="orjson")
+
+        assert client.get_meta_info(stats_data_id="0000020202") == {"ok": 1}
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown JSON decoder backend"):
+            EstatApiClient(app_id="test_app_id", json_decoder="ujson")
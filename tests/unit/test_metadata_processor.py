@@ -21,11 +21,7 @@ def sample_class_inf_data():
             {
                 "@id": "tab",
                 "@name": "観測値",
-                "CLASS": {
-                    "@code": "00001",
-                    "@name": "観測値",
-                    "@level": "1"
-                }
+                "CLASS": {"@code": "00001", "@name": "観測値", "@level": "1"},
             },
             {
                 "@id": "area",
@@ -35,25 +31,21 @@ def sample_class_inf_data():
                         "@code": "01100",
                         "@name": "北海道 札幌市",
                         "@level": "2",
-                        "@parentCode": "01000"
+                        "@parentCode": "01000",
                     },
                     {
                         "@code": "01101",
                         "@name": "北海道 札幌市 中央区",
                         "@level": "3",
-                        "@parentCode": "01100"
-                    }
-                ]
+                        "@parentCode": "01100",
+                    },
+                ],
             },
             {
                 "@id": "time",
                 "@name": "時間軸",
-                "CLASS": {
-                    "@code": "2020100000",
-                    "@name": "2020年度",
-                    "@level": "1"
-                }
-            }
+                "CLASS": {"@code": "2020100000", "@name": "2020年度", "@level": "1"},
+            },
         ]
     }
 
@@ -66,126 +58,134 @@ def class_inf_model(sample_class_inf_data):
 
 class TestMetadataProcessor:
     """Test cases for MetadataProcessor."""
-    
-    def test_create_metadata_struct_type_basic(self, metadata_processor, class_inf_model):
+
+    def test_create_metadata_struct_type_basic(
+        self, metadata_processor, class_inf_model
+    ):
         """Test creating metadata struct type with basic fields."""
         # Get the area class obj
         area_obj = next(obj for obj in class_inf_model.class_obj if obj.id == "area")
-        
+
         struct_type = metadata_processor._create_metadata_struct_type(area_obj)
-        
+
         # Check it's a struct type
         assert isinstance(struct_type, pa.StructType)
-        
+
         # Check required fields exist
         field_names = struct_type.names
         assert "code" in field_names
         assert "name" in field_names
         assert "level" in field_names
         assert "parent_code" in field_names
-        
+
         # Check field types
         for field in struct_type:
             assert field.type == pa.string()
-    
-    def test_create_metadata_struct_type_without_optional_fields(self, metadata_processor, class_inf_model):
+
+    def test_create_metadata_struct_type_without_optional_fields(
+        self, metadata_processor, class_inf_model
+    ):
         """Test struct type for metadata without optional fields."""
         # Get the tab class obj (has no level, unit, parent_code)
         tab_obj = next(obj for obj in class_inf_model.class_obj if obj.id == "tab")
-        
+
         # Modify to ensure no optional fields
         for cls in tab_obj.class_info:
             cls.attributes.level = "1"  # This will be included
-        
+
         struct_type = metadata_processor._create_metadata_struct_type(tab_obj)
-        
+
         field_names = struct_type.names
         assert "code" in field_names
         assert "name" in field_names
         assert "level" in field_names
         assert "unit" not in field_names  # Should not be included
         assert "parent_code" not in field_names  # Should not be included
-    
+
     def test_create_metadata_mapping(self, metadata_processor, class_inf_model):
         """Test creating metadata mapping."""
         area_obj = next(obj for obj in class_inf_model.class_obj if obj.id == "area")
-        
+
         mapping = metadata_processor._create_metadata_mapping(area_obj)
-        
+
         # Check mapping structure
         assert "01100" in mapping
         assert "01101" in mapping
-        
+
         # Check Sapporo data
         sapporo = mapping["01100"]
         assert sapporo["code"] == "01100"
         assert sapporo["name"] == "北海道 札幌市"
         assert sapporo["level"] == "2"
         assert sapporo["parent_code"] == "01000"
-        
+
         # Check Chuo-ku data
         chuo = mapping["01101"]
         assert chuo["code"] == "01101"
         assert chuo["name"] == "北海道 札幌市 中央区"
         assert chuo["level"] == "3"
         assert chuo["parent_code"] == "01100"
-    
+
     def test_process_metadata_complete(self, metadata_processor, class_inf_model):
         """Test complete metadata processing."""
         struct_types, mappings = metadata_processor.process_metadata(class_inf_model)
-        
+
         # Check all expected fields are present
         expected_fields = {"tab", "area", "time"}
         assert set(struct_types.keys()) == expected_fields
         assert set(mappings.keys()) == expected_fields
-        
+
         # Verify area struct has correct fields
         area_struct = struct_types["area"]
         assert area_struct.num_fields >= 4  # code, name, level, parent_code
-        
+
         # Verify time struct has fewer fields (no parent_code)
         time_struct = struct_types["time"]
         time_fields = set(time_struct.names)
         assert "parent_code" not in time_fields
-    
-    def test_metadata_struct_fields_consistency(self, metadata_processor, class_inf_model):
+
+    def test_metadata_struct_fields_consistency(
+        self, metadata_processor, class_inf_model
+    ):
         """Test that struct fields match actual data attributes."""
         struct_types, _ = metadata_processor.process_metadata(class_inf_model)
-        
+
         # Check time metadata (should have only code, name, level)
         time_struct = struct_types["time"]
         time_fields = set(time_struct.names)
         expected_time_fields = {"code", "name", "level"}
         assert time_fields == expected_time_fields
-        
+
         # Check area metadata (should have code, name, level, parent_code)
         area_struct = struct_types["area"]
         area_fields = set(area_struct.names)
         expected_area_fields = {"code", "name", "level", "parent_code"}
         assert area_fields == expected_area_fields
-    
+
     def test_create_arrow_schema(self, metadata_processor):
         """Test creating complete Arrow schema."""
         value_columns = ["tab", "cat01", "area", "time", "unit", "value"]
         struct_types = {
             "tab": pa.struct([("code", pa.string()), ("name", pa.string())]),
             "cat01": pa.struct([("code", pa.string()), ("name", pa.string())]),
-            "area": pa.struct([
-                ("code", pa.string()), 
-                ("name", pa.string()),
-                ("level", pa.string()),
-                ("parent_code", pa.string())
-            ])
+            "area": pa.struct(
+                [
+                    ("code", pa.string()),
+                    ("name", pa.string()),
+                    ("level", pa.string()),
+                    ("parent_code", pa.string()),
+                ]
+            ),
         }
         stat_inf_type = pa.struct([("id", pa.string()), ("cycle", pa.string())])
-        
+
         schema = metadata_processor.create_arrow_schema(
             value_columns, struct_types, stat_inf_type
         )
-        
+
         # Check schema fields
         assert isinstance(schema, pa.Schema)
-        
+
         # Check value columns
         assert schema.field("tab").type == pa.string()
         assert schema.field("cat01").type == pa.string()
@@ -193,40 +193,93 @@ class TestMetadataProcessor:
         assert schema.field("time").type == pa.string()
         assert schema.field("unit").type == pa.string()
         assert schema.field("value").type == pa.float64()
-        
+
         # Check metadata columns
         assert pa.types.is_struct(schema.field("tab_metadata").type)
         assert pa.types.is_struct(schema.field("cat01_metadata").type)
         assert pa.types.is_struct(schema.field("area_metadata").type)
-        
+
         # Check stat_inf column
         assert pa.types.is_struct(schema.field("stat_inf").type)
-    
+
     def test_dynamic_metadata_fields(self, metadata_processor):
         """Test handling of dynamic extra attributes."""
         data = {
-            "CLASS_OBJ": [{
-                "@id": "custom",
-                "@name": "カスタム",
-                "CLASS": [{
-                    "@code": "001",
-                    "@name": "テスト",
-                    "@customField1": "value1",
-                    "@customField2": "value2"
-                }]
-            }]
+            "CLASS_OBJ": [
+                {
+                    "@id": "custom",
+                    "@name": "カスタム",
+                    "CLASS": [
+                        {
+                            "@code": "001",
+                            "@name": "テスト",
+                            "@customField1": "value1",
+                            "@customField2": "value2",
+                        }
+                    ],
+                }
+            ]
         }
-        
+
         class_inf = ClassInfModel.model_validate(data)
         struct_types, mappings = metadata_processor.process_metadata(class_inf)
-        
+
         # Check struct has custom fields
         custom_struct = struct_types["custom"]
         field_names = set(custom_struct.names)
         assert "customField1" in field_names
         assert "customField2" in field_names
-        
+
         # Check mapping has custom field values
         custom_mapping = mappings["custom"]["001"]
         assert custom_mapping["customField1"] == "value1"
-        assert custom_mapping["customField2"] == "value2"
\ No newline at end of file
+        assert custom_mapping["customField2"] == "value2"
+
+    def test_create_metadata_lookup(self, metadata_processor, class_inf_model):
+        """Test columnar lookup arrays with a trailing empty entry."""
+        struct_types, mappings = metadata_processor.process_metadata(class_inf_model)
+
+        codes, entries = metadata_processor.create_metadata_lookup(
+            struct_types["area"], mappings["area"]
+        )
+
+        assert codes.to_pylist() == list(mappings["area"].keys())
+        assert len(entries) == len(codes) + 1
+        assert entries.type == struct_types["area"]
+        assert entries[0].as_py()["code"] == codes[0].as_py()
+        assert all(value is None for value in entries[-1].as_py().values())
+
+    @pytest.mark.parametrize("single_class_obj", [False, True])
+    def test_process_raw_metadata_matches_validated(
+        self, metadata_processor, sample_class_inf_data, single_class_obj
+    ):
+        """The trusted path gives the same result as pydantic validation."""
+        sample_class_inf_data["CLASS_OBJ"][1]["CLASS"][0]["@unit"] = "人"
+        sample_class_inf_data["CLASS_OBJ"][1]["CLASS"][1]["@customField"] = "x"
+        if single_class_obj:
+            # A single CLASS_OBJ may come as an object instead of a list
+            area = sample_class_inf_data["CLASS_OBJ"][1]
+            sample_class_inf_data["CLASS_OBJ"] = [area]
+            expected = metadata_processor.process_metadata(
+                ClassInfModel.model_validate(sample_class_inf_data)
+            )
+            sample_class_inf_data["CLASS_OBJ"] = area
+        else:
+            expected = metadata_processor.process_metadata(
+                ClassInfModel.model_validate(sample_class_inf_data)
+            )
+        struct_types, mappings = metadata_processor.process_raw_metadata(
+            sample_class_inf_data
+        )
+
+        assert struct_types == expected[0]
+        assert mappings == expected[1]
+        for field_name, mapping in mappings.items():
+            for code, metadata in mapping.items():
+                assert list(metadata) == list(expected[1][field_name][code])
+
+    def test_process_raw_metadata_missing_code(self, metadata_processor):
+        data = {"CLASS_OBJ": {"@id": "area", "CLASS": {"@name": "全国"}}}
+
+        with pytest.raises(KeyError):
+            metadata_processor.process_raw_metadata(data)
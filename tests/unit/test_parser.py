@@ -1,93 +1,108 @@
 """Tests for the parser module."""
 
-import pytest
+import copy
+
 import pyarrow as pa
+import pytest
 
 from estat_api_dlt_helper import parse_response
+from estat_api_dlt_helper.parser import (
+    dimensions_to_arrow,
+    iter_record_batches,
+    prepare_metadata,
+    table_info_to_arrow,
+)
 
 
 class TestParseResponse:
     """Test cases for parse_response function."""
-    
+
     def test_parse_valid_response(self, sample_response_data):
         """Test parsing a valid e-Stat API response."""
         result = parse_response(sample_response_data)
-        
+
         # Check result is an Arrow table
         assert isinstance(result, pa.Table)
-        
+
         # Check number of rows
         assert result.num_rows == 2
-        
+
         # Check columns exist
         expected_columns = [
-            "tab", "cat01", "area", "time", "unit", "value",
-            "tab_metadata", "cat01_metadata", "area_metadata", "stat_inf"
+            "tab",
+            "cat01",
+            "area",
+            "time",
+            "unit",
+            "value",
+            "tab_metadata",
+            "cat01_metadata",
+            "area_metadata",
+            "stat_inf",
         ]
         assert set(result.column_names) == set(expected_columns)
-        
+
         # Check value column data
         values = result.column("value").to_pylist()
         assert values == [1973395.0, 248680.0]
-        
+
         # Check string columns
         areas = result.column("area").to_pylist()
         assert areas == ["01100", "01101"]
-    
+
     def test_parse_response_with_metadata(self, sample_response_data):
         """Test that metadata is properly attached to rows."""
         result = parse_response(sample_response_data)
-        
+
         # Check area metadata
         area_metadata = result.column("area_metadata").to_pylist()
         assert len(area_metadata) == 2
-        
+
         # First row metadata
         assert area_metadata[0]["code"] == "01100"
         assert area_metadata[0]["name"] == "北海道 札幌市"
         assert area_metadata[0]["level"] == "2"
         assert area_metadata[0]["parent_code"] == "01000"
-        
+
         # Second row metadata
         assert area_metadata[1]["code"] == "01101"
         assert area_metadata[1]["name"] == "北海道 札幌市 中央区"
         assert area_metadata[1]["level"] == "3"
         assert area_metadata[1]["parent_code"] == "01100"
-    
+
     def test_parse_response_stat_inf(self, sample_response_data):
         """Test that table information is properly included."""
         result = parse_response(sample_response_data)
-        
+
         # Check stat_inf column
         stat_inf = result.column("stat_inf").to_pylist()
         assert len(stat_inf) == 2
-        
+
         # All rows should have the same stat_inf
         assert stat_inf[0] == stat_inf[1]
-        
+
         # Check some fields
         assert stat_inf[0]["id"] == "0000020201"
-        assert stat_inf[0]["statistics_name"] == "市区町村データ 基礎データ（廃置分合処理済）"
+        assert (
+            stat_inf[0]["statistics_name"]
+            == "市区町村データ 基礎データ（廃置分合処理済）"
+        )
         assert stat_inf[0]["cycle"] == "年度次"
-    
+
     def test_parse_invalid_response_missing_section(self):
         """Test parsing fails gracefully with missing sections."""
         invalid_data = {"wrong_key": "value"}
-        
+
         with pytest.raises(ValueError, match="missing GET_STATS_DATA"):
             parse_response(invalid_data)
-    
+
     def test_parse_invalid_response_missing_statistical_data(self):
         """Test parsing fails with missing STATISTICAL_DATA."""
-        invalid_data = {
-            "GET_STATS_DATA": {
-                "RESULT": {"STATUS": 0}
-            }
-        }
-        
+        invalid_data = {"GET_STATS_DATA": {"RESULT": {"STATUS": 0}}}
+
         with pytest.raises(ValueError, match="missing STATISTICAL_DATA"):
             parse_response(invalid_data)
-    
+
     def test_parse_invalid_response_missing_value_data(self):
         """Test parsing fails with missing VALUE data."""
         invalid_data = {
@@ -95,14 +110,14 @@ class TestParseResponse:
                 "STATISTICAL_DATA": {
                     "TABLE_INF": {},
                     "CLASS_INF": {"CLASS_OBJ": []},
-                    "DATA_INF": {}  # Missing VALUE
+                    "DATA_INF": {},  # Missing VALUE
                 }
             }
         }
-        
+
         with pytest.raises(ValueError, match="DATA_INF missing VALUE"):
             parse_response(invalid_data)
-    
+
     def test_parse_response_with_non_numeric_values(self):
         """Test handling of non-numeric values."""
         data = {
@@ -125,43 +140,212 @@ class TestParseResponse:
                         "UPDATED_DATE": "2024-01-01",
                         "STATISTICS_NAME_SPEC": {
                             "TABULATION_CATEGORY": "Test",
-                            "TABULATION_SUB_CATEGORY1": "Test"
-                        },
-                        "DESCRIPTION": {
-                            "TABULATION_CATEGORY_EXPLANATION": "Test"
+                            "TABULATION_SUB_CATEGORY1": "Test",
                         },
-                        "TITLE_SPEC": {
-                            "TABLE_NAME": "Test"
-                        }
+                        "DESCRIPTION": {"TABULATION_CATEGORY_EXPLANATION": "Test"},
+                        "TITLE_SPEC": {"TABLE_NAME": "Test"},
                     },
                     "CLASS_INF": {
                         "CLASS_OBJ": [
                             {
                                 "@id": "cat",
                                 "@name": "Category",
-                                "CLASS": {
-                                    "@code": "001",
-                                    "@name": "Test Category"
-                                }
+                                "CLASS": {"@code": "001", "@name": "Test Category"},
                             }
                         ]
                     },
                     "DATA_INF": {
                         "VALUE": [
-                            {"@cat": "001", "$": "123"},      # Numeric
-                            {"@cat": "001", "$": "N/A"},      # Non-numeric
-                            {"@cat": "001", "$": ""},         # Empty
-                            {"@cat": "001", "$": "123.45"},   # Float
+                            {"@cat": "001", "$": "123"},  # Numeric
+                            {"@cat": "001", "$": "N/A"},  # Non-numeric
+                            {"@cat": "001", "$": ""},  # Empty
+                            {"@cat": "001", "$": "123.45"},  # Float
                         ]
-                    }
+                    },
                 }
             }
         }
-        
+
         result = parse_response(data)
         values = result.column("value").to_pylist()
-        
+
         assert values[0] == 123.0
         assert values[1] is None  # Non-numeric becomes None
         assert values[2] is None  # Empty becomes None
-        assert values[3] == 123.45
\ No newline at end of file
+        assert values[3] == 123.45
+
+
+class TestPrepareMetadata:
+    """Test cases for reusing prepared metadata across pages."""
+
+    def test_parse_page_without_metadata(self, sample_response_data):
+        """Pages fetched with metaGetFlg=N are parsed with cached metadata."""
+        metadata = prepare_metadata(sample_response_data)
+
+        page = copy.deepcopy(sample_response_data)
+        statistical_data = page["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        del statistical_data["CLASS_INF"]
+        del statistical_data["TABLE_INF"]
+
+        result = parse_response(page, metadata)
+        expected = parse_response(sample_response_data)
+
+        assert result.equals(expected)
+
+    def test_page_without_metadata_requires_prepared_metadata(
+        self, sample_response_data
+    ):
+        page = copy.deepcopy(sample_response_data)
+        del page["GET_STATS_DATA"]["STATISTICAL_DATA"]["CLASS_INF"]
+
+        with pytest.raises(ValueError, match="CLASS_INF"):
+            parse_response(page)
+
+    def test_prepare_metadata_from_meta_info(self, sample_response_data):
+        """getMetaInfo responses are accepted as a metadata source."""
+        statistical_data = sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        meta_info = {
+            "GET_META_INFO": {
+                "METADATA_INF": {
+                    "TABLE_INF": statistical_data["TABLE_INF"],
+                    "CLASS_INF": statistical_data["CLASS_INF"],
+                }
+            }
+        }
+
+        metadata = prepare_metadata(meta_info)
+
+        assert set(metadata.struct_types) == {"tab", "cat01", "area"}
+        assert metadata.stat_inf_data["id"] == "0000020201"
+
+    def test_prepare_metadata_missing_sections(self):
+        with pytest.raises(ValueError, match="TABLE_INF"):
+            prepare_metadata({"GET_META_INFO": {"METADATA_INF": {}}})
+
+
+class TestStatInfMode:
+    """Test cases for the stat_inf_mode of parse_response"""
+
+    def test_id_mode(self, sample_response_data):
+        table = parse_response(sample_response_data, stat_inf_mode="id")
+
+        assert "stat_inf" not in table.column_names
+        assert table["stat_inf_id"].to_pylist() == ["0000020201"] * len(table)
+        assert table.drop_columns("stat_inf_id").equals(
+            parse_response(sample_response_data).drop_columns("stat_inf")
+        )
+
+    @pytest.mark.parametrize(
+        "mode, type_check",
+        [
+            ("run_end", pa.types.is_run_end_encoded),
+            ("dictionary", pa.types.is_dictionary),
+        ],
+    )
+    def test_encoded_modes(self, sample_response_data, mode, type_check):
+        expected = parse_response(sample_response_data)["stat_inf"].to_pylist()
+
+        table = parse_response(sample_response_data, stat_inf_mode=mode)
+
+        assert type_check(table.schema.field("stat_inf").type)
+        assert table["stat_inf"].to_pylist() == expected
+
+    def test_unknown_mode_raises(self, sample_response_data):
+        with pytest.raises(ValueError, match="stat_inf_mode"):
+            parse_response(sample_response_data, stat_inf_mode="flat")  # type: ignore[arg-type]
+
+    def test_table_info_to_arrow(self, sample_response_data):
+        table_info = table_info_to_arrow(prepare_metadata(sample_response_data))
+
+        assert len(table_info) == 1
+        assert (
+            table_info.to_pylist()
+            == parse_response(sample_response_data)["stat_inf"].to_pylist()[:1]
+        )
+
+
+class TestStarSchema:
+    """Test cases for parse_response(embed_metadata=False) and its dimensions"""
+
+    def test_without_metadata_columns(self, sample_response_data):
+        table = parse_response(sample_response_data, embed_metadata=False)
+
+        assert not [c for c in table.column_names if c.endswith("_metadata")]
+        assert table.drop_columns("stat_inf").equals(
+            parse_response(sample_response_data).select(
+                [c for c in table.column_names if c != "stat_inf"]
+            )
+        )
+
+    def test_dimensions_to_arrow(self, sample_response_data):
+        metadata = prepare_metadata(sample_response_data)
+
+        dimensions = dimensions_to_arrow(metadata)
+
+        assert set(dimensions) == {"tab", "cat01", "area"}
+        for dimension, table in dimensions.items():
+            assert table.schema.field("code").nullable is False
+            assert table.to_pylist() == [
+                {field.name: row.get(field.name) for field in table.schema}
+                for row in metadata.mappings[dimension].values()
+            ]
+
+    def test_dimensions_join_to_rows(self, sample_response_data):
+        full = parse_response(sample_response_data)
+        facts = parse_response(
+            sample_response_data, stat_inf_mode="id", embed_metadata=False
+        )
+        area = dimensions_to_arrow(prepare_metadata(sample_response_data))["area"]
+
+        joined = facts.join(area, "area", "code", join_type="left outer")
+
+        expected = {
+            row["area"]: row["area_metadata"]["name"] for row in full.to_pylist()
+        }
+        names = zip(joined["area"].to_pylist(), joined["name"].to_pylist(), strict=True)
+        assert dict(names) == expected
+
+
+class TestValidateMetadata:
+    """Test cases for the opt-in pydantic validation of CLASS_INF"""
+
+    def test_same_result(self, sample_response_data):
+        assert parse_response(sample_response_data, validate_metadata=True).equals(
+            parse_response(sample_response_data)
+        )
+
+    def test_validation_errors(self, sample_response_data):
+        statistical_data = sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        statistical_data["CLASS_INF"]["CLASS_OBJ"][0]["@name"] = None
+
+        with pytest.raises(ValueError):
+            parse_response(sample_response_data, validate_metadata=True)
+
+
+class TestIterRecordBatches:
+    """Test cases for iter_record_batches"""
+
+    def test_matches_parse_response(self, sample_response_data):
+        batches = list(iter_record_batches(sample_response_data, batch_size=1))
+
+        assert [batch.num_rows for batch in batches] == [1, 1]
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert pa.Table.from_batches(batches).equals(
+            parse_response(sample_response_data)
+        )
+
+    def test_single_batch(self, sample_response_data):
+        batches = list(iter_record_batches(sample_response_data))
+
+        assert len(batches) == 1
+
+    def test_empty_values(self, sample_response_data):
+        sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]["DATA_INF"][
+            "VALUE"
+        ] = []
+
+        assert list(iter_record_batches(sample_response_data)) == []
+
+    def test_invalid_batch_size(self, sample_response_data):
+        with pytest.raises(ValueError, match="batch_size"):
+            list(iter_record_batches(sample_response_data, batch_size=0))
@@ -0,0 +1,107 @@
+"""Tests for the parser session and its metadata cache."""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from estat_api_dlt_helper.parser import (
+    ParserSession,
+    metadata_fingerprint,
+    parse_response,
+)
+
+
+def _statistical_data(response):
+    return response["GET_STATS_DATA"]["STATISTICAL_DATA"]
+
+
+def _other_table(sample_response_data):
+    response = copy.deepcopy(sample_response_data)
+    _statistical_data(response)["TABLE_INF"]["@id"] = "0000020202"
+    return response
+
+
+class TestMetadataFingerprint:
+    """Test cases for metadata_fingerprint"""
+
+    def test_same_for_equal_metadata(self, sample_response_data):
+        other = copy.deepcopy(sample_response_data)
+
+        assert metadata_fingerprint(
+            _statistical_data(sample_response_data)
+        ) == metadata_fingerprint(_statistical_data(other))
+
+    def test_differs_by_table(self, sample_response_data):
+        assert metadata_fingerprint(
+            _statistical_data(sample_response_data)
+        ) != metadata_fingerprint(_statistical_data(_other_table(sample_response_data)))
+
+    def test_differs_by_classes(self, sample_response_data):
+        other = copy.deepcopy(sample_response_data)
+        class_obj = _statistical_data(other)["CLASS_INF"]["CLASS_OBJ"][0]
+        classes = class_obj["CLASS"]
+        if isinstance(classes, dict):
+            classes = [classes]
+        class_obj["CLASS"] = classes + [{"@code": "999", "@name": "other"}]
+
+        assert metadata_fingerprint(
+            _statistical_data(sample_response_data)
+        ) != metadata_fingerprint(_statistical_data(other))
+
+
+class TestParserSession:
+    """Test cases for ParserSession"""
+
+    def test_matches_parse_response(self, sample_response_data):
+        session = ParserSession()
+
+        for _ in range(3):
+            table = session.parse_response(sample_response_data)
+            assert table.equals(parse_response(sample_response_data))
+
+        assert (session.hits, session.misses) == (2, 1)
+        assert session.hit_rate == pytest.approx(2 / 3)
+
+    def test_pages_skip_metadata_preparation(self, sample_response_data):
+        session = ParserSession()
+        converter = session._converter
+
+        with patch.object(
+            converter, "prepare_metadata", wraps=converter.prepare_metadata
+        ) as prepare:
+            for _ in range(5):
+                session.parse_response(copy.deepcopy(sample_response_data))
+
+        assert prepare.call_count == 1
+
+    def test_lru_eviction(self, sample_response_data):
+        other = _other_table(sample_response_data)
+        session = ParserSession(max_entries=1)
+
+        session.parse_response(sample_response_data)
+        session.parse_response(other)
+        session.parse_response(sample_response_data)
+
+        assert (session.hits, session.misses) == (0, 3)
+
+    def test_given_metadata_bypasses_cache(self, sample_response_data):
+        session = ParserSession()
+        metadata = session.prepare_metadata(_statistical_data(sample_response_data))
+
+        session.parse_response(sample_response_data, metadata)
+
+        assert (session.hits, session.misses) == (0, 1)
+
+    def test_clear(self, sample_response_data):
+        session = ParserSession()
+        session.parse_response(sample_response_data)
+        session.clear()
+
+        assert session.hit_rate == 0.0
+        session.parse_response(sample_response_data)
+        assert session.misses == 1
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError, match="max_entries"):
+            ParserSession(max_entries=0)
@@ -0,0 +1,262 @@
+"""Tests for splitting large tables into code ranges."""
+
+import copy
+from unittest.mock import MagicMock
+
+import pytest
+from requests import Timeout
+
+from estat_api_dlt_helper.loader.dlt_resource import _fetch_estat_data
+from estat_api_dlt_helper.loader.partition_planner import (
+    Partition,
+    choose_partition_dimension,
+    fetch_partition,
+    partition_param,
+    plan_partitions,
+)
+from estat_api_dlt_helper.parser import prepare_metadata
+
+
+def _counter(rows_by_code):
+    """Count function over codes with known row counts, recording probes.
+
+    Ranges follow the order of rows_by_code, like CLASS_OBJ order.
+    """
+    codes = list(rows_by_code)
+    probes = []
+
+    def count(params):
+        probes.append(params)
+        if "cdTime" in params:
+            selected = [params["cdTime"]]
+        else:
+            lo = codes.index(params["cdTimeFrom"])
+            hi = codes.index(params["cdTimeTo"])
+            selected = codes[lo : hi + 1]
+        return sum(rows_by_code[code] for code in selected)
+
+    return count, probes
+
+
+class TestPartition:
+    """Test cases for Partition"""
+
+    def test_params(self):
+        assert partition_param("cat01") == "cdCat01"
+        assert Partition("area", ("01000",)).params == {"cdArea": "01000"}
+        assert Partition("time", ("2019", "2020", "2021")).params == {
+            "cdTimeFrom": "2019",
+            "cdTimeTo": "2021",
+        }
+
+    def test_split(self):
+        first, second = Partition("time", ("a", "b", "c")).split()  # type: ignore[misc]
+
+        assert first.codes == ("a",)
+        assert second.codes == ("b", "c")
+        assert Partition("time", ("a",)).split() is None
+
+
+class TestChoosePartitionDimension:
+    """Test cases for choose_partition_dimension"""
+
+    def test_dimension_with_most_codes(self, sample_response_data):
+        metadata = prepare_metadata(sample_response_data)
+
+        assert choose_partition_dimension(metadata, {}) == "area"
+
+    def test_filtered_dimensions_are_skipped(self, sample_response_data):
+        metadata = prepare_metadata(sample_response_data)
+
+        # cat01 has a single code and tab is never a candidate
+        assert choose_partition_dimension(metadata, {"cdAreaFrom": "01100"}) is None
+
+
+class TestPlanPartitions:
+    """Test cases for plan_partitions"""
+
+    def test_splits_until_ranges_fit(self):
+        count, _ = _counter({"2018": 50, "2019": 50, "2020": 80, "2021": 90})
+
+        partitions = plan_partitions(
+            count, "time", ["2018", "2019", "2020", "2021"], 100
+        )
+
+        assert [p.codes for p in partitions] == [
+            ("2018", "2019"),
+            ("2020",),
+            ("2021",),
+        ]
+        assert [p.rows for p in partitions] == [100, 80, 90]
+
+    def test_keeps_class_order(self):
+        # CLASS_OBJ order that differs from the string order of the codes
+        count, probes = _counter({"2020": 60, "2018": 60, "2019": 60})
+
+        partitions = plan_partitions(count, "time", ["2020", "2018", "2019"], 100)
+
+        assert probes[0] == {"cdTimeFrom": "2020", "cdTimeTo": "2019"}
+        assert [p.codes for p in partitions] == [("2020",), ("2018",), ("2019",)]
+
+    def test_single_fitting_range_probed_once(self):
+        count, probes = _counter({"2019": 10, "2020": 10})
+
+        partitions = plan_partitions(count, "time", ["2019", "2020"], 100)
+
+        assert len(partitions) == 1
+        assert probes == [{"cdTimeFrom": "2019", "cdTimeTo": "2020"}]
+
+    def test_empty_ranges_left_out_and_large_codes_kept(self):
+        count, _ = _counter({"2019": 0, "2020": 250})
+
+        partitions = plan_partitions(count, "time", ["2019", "2020"], 100)
+
+        assert [(p.codes, p.rows) for p in partitions] == [(("2020",), 250)]
+
+    def test_invalid_arguments(self):
+        count, _ = _counter({})
+
+        with pytest.raises(ValueError):
+            plan_partitions(count, "time", ["2020"], 0)
+        with pytest.raises(ValueError):
+            plan_partitions(count, "time", [], 100)
+
+
+class TestFetchPartition:
+    """Test cases for fetch_partition"""
+
+    def test_timeout_splits_range(self):
+        calls = []
+
+        def fetch(params):
+            calls.append(params)
+            if "cdTimeFrom" in params:
+                raise Timeout()
+            yield params["cdTime"]
+
+        items = list(fetch_partition(fetch, Partition("time", ("2019", "2020"))))
+
+        assert items == ["2019", "2020"]
+        assert calls[0] == {"cdTimeFrom": "2019", "cdTimeTo": "2020"}
+
+    def test_timeout_after_items_is_raised(self):
+        def fetch(params):
+            yield "page"
+            raise Timeout()
+
+        with pytest.raises(Timeout):
+            list(fetch_partition(fetch, Partition("time", ("2019", "2020"))))
+
+    def test_timeout_of_single_code_is_raised(self):
+        def fetch(params):
+            raise Timeout()
+            yield
+
+        with pytest.raises(Timeout):
+            list(fetch_partition(fetch, Partition("time", ("2020",))))
+
+
+class TestFetchEstatDataPartitioned:
+    """Tests for fetching a table in code ranges through _fetch_estat_data."""
+
+    def _client(self, sample_response_data):
+        statistical_data = sample_response_data["GET_STATS_DATA"]["STATISTICAL_DATA"]
+        client = MagicMock()
+        client.get_meta_info.return_value = {
+            "GET_META_INFO": {
+                "METADATA_INF": {
+                    "TABLE_INF": statistical_data["TABLE_INF"],
+                    "CLASS_INF": statistical_data["CLASS_INF"],
+                }
+            }
+        }
+
+        def count(stats_data_id, **params):
+            assert params["cntGetFlg"] == "Y"
+            total = 1 if "cdArea" in params else 2
+            return {
+                "GET_STATS_DATA": {
+                    "STATISTICAL_DATA": {"RESULT_INF": {"TOTAL_NUMBER": total}}
+                }
+            }
+
+        def pages(stats_data_id, **params):
+            page = copy.deepcopy(sample_response_data)
+            values = page["GET_STATS_DATA"]["STATISTICAL_DATA"]["DATA_INF"]["VALUE"]
+            page["GET_STATS_DATA"]["STATISTICAL_DATA"]["DATA_INF"]["VALUE"] = [
+                v for v in values if v["@area"] == params["cdArea"]
+            ]
+            return iter([page])
+
+        client.get_stats_data.side_effect = count
+        client.get_stats_data_generator.side_effect = pages
+        return client
+
+    def test_ranges_fetched_in_code_order(self, sample_response_data):
+        client = self._client(sample_response_data)
+
+        tables = list(
+            _fetch_estat_data(
+                client, "0000020201", {"lang": "J"}, limit=1, partition_by="auto"
+            )
+        )
+
+        assert [t["area"].to_pylist() for t in tables] == [["01100"], ["01101"]]
+        areas = sorted(
+            call.kwargs["cdArea"]
+            for call in client.get_stats_data_generator.call_args_list
+        )
+        assert areas == ["01100", "01101"]
+
+    def test_mismatched_counts_fetch_unpartitioned(self, sample_response_data):
+        client = self._client(sample_response_data)
+        count = client.get_stats_data.side_effect
+
+        def inconsistent_count(stats_data_id, **params):
+            if any(key.startswith("cdArea") for key in params):
+                return count(stats_data_id, **params)
+            # The ranges miss rows of the unfiltered table
+            return {
+                "GET_STATS_DATA": {
+                    "STATISTICAL_DATA": {"RESULT_INF": {"TOTAL_NUMBER": 3}}
+                }
+            }
+
+        client.get_stats_data.side_effect = inconsistent_count
+        client.get_stats_data_generator.side_effect = lambda stats_data_id, **params: (
+            iter([copy.deepcopy(sample_response_data)])
+        )
+
+        tables = list(
+            _fetch_estat_data(
+                client, "0000020201", {"lang": "J"}, limit=1, partition_by="area"
+            )
+        )
+
+        assert [t["area"].to_pylist() for t in tables] == [["01100", "01101"]]
+        (call,) = client.get_stats_data_generator.call_args_list
+        assert not any(key.startswith("cdArea") for key in call.kwargs)
+
+    def test_unknown_dimension(self, sample_response_data):
+        client = self._client(sample_response_data)
+
+        with pytest.raises(ValueError, match="no dimension"):
+            list(
+                _fetch_estat_data(
+                    client, "0000020201", {}, limit=1, partition_by="cat05"
+                )
+            )
+
+    def test_maximum_offset_not_supported(self, sample_response_data):
+        client = self._client(sample_response_data)
+
+        with pytest.raises(ValueError, match="maximum_offset"):
+            list(
+                _fetch_estat_data(
+                    client,
+                    "0000020201",
+                    {},
+                    maximum_offset=10,
+                    partition_by="area",
+                )
+            )
@@ -0,0 +1,182 @@
+"""Tests for the background prefetch helper."""
+
+import threading
+import time
+
+import pytest
+
+from estat_api_dlt_helper.utils import prefetch, prefetch_each
+
+
+class TestPrefetch:
+    """Test cases for prefetch"""
+
+    def test_yields_in_order(self):
+        assert list(prefetch(range(100), max_queued=3)) == list(range(100))
+
+    def test_runs_on_another_thread(self):
+        def source():
+            yield threading.current_thread().name
+
+        assert list(prefetch(source(), max_queued=1)) == ["estat-prefetch"]
+
+    def test_reraises_source_error(self):
+        def source():
+            yield 1
+            raise RuntimeError("page failed")
+
+        items = prefetch(source(), max_queued=2)
+
+        assert next(items) == 1
+        with pytest.raises(RuntimeError, match="page failed"):
+            next(items)
+
+    def test_keyboard_interrupt_ends_fetcher_thread(self):
+        errors = []
+
+        def source():
+            yield 1
+            raise KeyboardInterrupt
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(threading, "excepthook", errors.append)
+            items = prefetch(source(), max_queued=2)
+
+            assert next(items) == 1
+            with pytest.raises(KeyboardInterrupt):
+                next(items)
+
+        # Not swallowed by the fetcher thread
+        assert [args.exc_type for args in errors] == [KeyboardInterrupt]
+
+    def test_backpressure(self):
+        produced = []
+
+        def source():
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        items = prefetch(source(), max_queued=2)
+        assert next(items) == 0
+        time.sleep(0.2)
+
+        # One item consumed, two queued, one waiting to be queued
+        assert len(produced) == 4
+        items.close()
+
+    def test_early_close_stops_source(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                yield from range(1000)
+            finally:
+                closed.set()
+
+        items = prefetch(source(), max_queued=1)
+        assert next(items) == 0
+        items.close()
+
+        assert closed.is_set()
+
+    def test_overlaps_fetch_and_processing(self):
+        def source():
+            for i in range(5):
+                time.sleep(0.05)
+                yield i
+
+        start = time.perf_counter()
+        for _ in prefetch(source(), max_queued=2):
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+
+        # Sequential would take 0.5 s; pipelined about 0.3 s
+        assert elapsed < 0.45
+
+    def test_invalid_max_queued(self):
+        with pytest.raises(ValueError, match="max_queued"):
+            list(prefetch([], max_queued=0))
+
+
+class TestPrefetchEach:
+    """Test cases for prefetch_each"""
+
+    def test_same_output_as_chaining(self):
+        sources = [range(i * 10, i * 10 + 10) for i in range(5)]
+
+        items = [
+            item
+            for iterator in prefetch_each(sources, max_active=3, max_queued=2)
+            for item in iterator
+        ]
+
+        assert items == list(range(50))
+
+    def test_fetches_next_iterables_concurrently(self):
+        def source(i):
+            time.sleep(0.1)
+            yield i
+
+        start = time.perf_counter()
+        items = [
+            item
+            for iterator in prefetch_each(
+                (source(i) for i in range(4)), max_active=4, max_queued=1
+            )
+            for item in iterator
+        ]
+        elapsed = time.perf_counter() - start
+
+        # Sequential would take 0.4 s
+        assert items == [0, 1, 2, 3]
+        assert elapsed < 0.3
+
+    def test_limits_active_iterables(self):
+        started = []
+
+        def source(i):
+            started.append(i)
+            yield i
+
+        iterators = prefetch_each(
+            (source(i) for i in range(5)), max_active=2, max_queued=1
+        )
+        first = next(iterators)
+        time.sleep(0.1)
+
+        assert started == [0, 1]
+        assert list(first) == [0]
+        iterators.close()
+
+    def test_early_close_stops_all_sources(self):
+        closed = []
+
+        def source(i):
+            try:
+                yield from range(1000)
+            finally:
+                closed.append(i)
+
+        iterators = prefetch_each(
+            (source(i) for i in range(3)), max_active=3, max_queued=1
+        )
+        assert next(next(iterators)) == 0
+        iterators.close()
+
+        assert sorted(closed) == [0, 1, 2]
+
+    def test_reraises_source_error(self):
+        def failing():
+            raise RuntimeError("table failed")
+            yield
+
+        iterators = prefetch_each([[1], failing()], max_active=2, max_queued=1)
+
+        assert list(next(iterators)) == [1]
+        with pytest.raises(RuntimeError, match="table failed"):
+            list(next(iterators))
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="max_active"):
+            list(prefetch_each([], max_active=0, max_queued=1))
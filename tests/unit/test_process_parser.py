@@ -0,0 +1,62 @@
+"""Tests for ProcessPoolParser."""
+
+import json
+
+import pyarrow as pa
+import pytest
+
+from estat_api_dlt_helper.parser import ProcessPoolParser, parse_response
+
+
+def _body(data):
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+class TestProcessPoolParser:
+    """Test cases for ProcessPoolParser"""
+
+    def test_matches_parse_response(self, sample_response_data):
+        with ProcessPoolParser(max_workers=1) as parser:
+            buffer, result_inf = parser.submit(_body(sample_response_data)).result()
+            tables = parser.read(buffer)
+
+        assert len(tables) == 1
+        assert tables[0].equals(parse_response(sample_response_data))
+        assert result_inf == sample_response_data["GET_STATS_DATA"][
+            "STATISTICAL_DATA"
+        ].get("RESULT_INF", {})
+
+    def test_batch_size(self, sample_response_data):
+        with ProcessPoolParser(max_workers=1, batch_size=1) as parser:
+            buffer, _ = parser.submit(_body(sample_response_data)).result()
+            batches = parser.read(buffer)
+
+        assert len(batches) == 2
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert pa.Table.from_batches(batches).equals(
+            parse_response(sample_response_data)
+        )
+
+    def test_options(self, sample_response_data):
+        with ProcessPoolParser(
+            max_workers=1, stat_inf_mode="id", embed_metadata=False
+        ) as parser:
+            buffer, _ = parser.submit(_body(sample_response_data)).result()
+            (table,) = parser.read(buffer)
+
+        assert table.equals(
+            parse_response(
+                sample_response_data, stat_inf_mode="id", embed_metadata=False
+            )
+        )
+
+    def test_invalid_response_raises(self):
+        with ProcessPoolParser(max_workers=1) as parser:
+            future = parser.submit(b'{"GET_STATS_DATA": {}}')
+            with pytest.raises(ValueError, match="STATISTICAL_DATA"):
+                future.result()
+
+    @pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"batch_size": 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            ProcessPoolParser(**{"max_workers": 1, **kwargs})
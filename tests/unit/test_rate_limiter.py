@@ -0,0 +1,128 @@
+"""Tests for the token bucket rate limiter."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from estat_api_dlt_helper.api.cache import ResponseCache
+from estat_api_dlt_helper.api.client import EstatApiClient
+from estat_api_dlt_helper.api.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter"""
+
+    def test_burst_then_rate(self):
+        limiter = RateLimiter(requests_per_second=20, burst=3)
+
+        assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.try_acquire() == pytest.approx(0.05, abs=0.01)
+
+    def test_acquire_waits(self):
+        limiter = RateLimiter(requests_per_second=50, burst=1)
+
+        start = time.perf_counter()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.09
+        assert limiter.waits == 5
+        assert limiter.waited_seconds > 0
+
+    def test_shared_between_threads(self):
+        limiter = RateLimiter(requests_per_second=100, burst=1)
+
+        def take():
+            for _ in range(5):
+                limiter.acquire()
+
+        threads = [threading.Thread(target=take) for _ in range(4)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        # 20 requests at 100/s with a single token burst
+        assert elapsed >= 0.18
+
+    def test_state_file_shared_between_limiters(self, tmp_path):
+        state_file = tmp_path / "estat.bucket"
+        first = RateLimiter(requests_per_second=1, burst=2, state_file=state_file)
+        second = RateLimiter(requests_per_second=1, burst=2, state_file=state_file)
+
+        assert first.try_acquire() == 0.0
+        assert second.try_acquire() == 0.0
+        assert first.try_acquire() > 0.0
+        assert second.try_acquire() > 0.0
+
+    def test_state_file_shared_between_processes(self, tmp_path):
+        state_file = tmp_path / "estat.bucket"
+        code = (
+            "from estat_api_dlt_helper.api.rate_limiter import RateLimiter;"
+            f"l = RateLimiter(1, burst=2, state_file={str(state_file)!r});"
+            "print(l.try_acquire(), l.try_acquire())"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+        assert result.stdout.split() == ["0.0", "0.0"]
+        limiter = RateLimiter(1, burst=2, state_file=state_file)
+        assert limiter.try_acquire() > 0.0
+
+    def test_corrupt_state_file_starts_full(self, tmp_path):
+        state_file = tmp_path / "estat.bucket"
+        state_file.write_text("not json")
+
+        limiter = RateLimiter(requests_per_second=1, burst=1, state_file=state_file)
+
+        assert limiter.try_acquire() == 0.0
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"requests_per_second": 0}, {"requests_per_second": 1, "burst": 0}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+    def test_get_rate_limiter_shared_per_app_id(self):
+        limiter = get_rate_limiter("rate_limited_app", 5)
+
+        assert get_rate_limiter("rate_limited_app", 5) is limiter
+        assert get_rate_limiter("other_rate_limited_app", 5) is not limiter
+
+
+class TestEstatApiClientRateLimit:
+    """Test cases for EstatApiClient with a rate limiter"""
+
+    @patch("estat_api_dlt_helper.api.client.Client")
+    def test_requests_take_tokens(self, mock_client_cls, tmp_path):
+        mock_client_cls.return_value.get.return_value = Mock(
+            ok=True, content=b'{"GET_META_INFO": {}}'
+        )
+        limiter = Mock()
+        client = EstatApiClient(
+            app_id="test_app_id",
+            cache=ResponseCache(tmp_path / "cache"),
+            rate_limiter=limiter,
+        )
+
+        client.get_meta_info(stats_data_id="0000020201")
+        client.get_meta_info(stats_data_id="0000020201")
+        client.get_meta_info(stats_data_id="0000020202")
+
+        # The repeated request is served from the cache without a token
+        assert limiter.acquire.call_count == 2
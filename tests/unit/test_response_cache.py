@@ -0,0 +1,102 @@
+"""Tests for the on-disk response cache."""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+from estat_api_dlt_helper.api.cache import ResponseCache
+from estat_api_dlt_helper.api.client import EstatApiClient
+
+URL = "https://api.e-stat.go.jp/rest/3.0/app/json/getStatsData"
+OK_BODY = b'{"GET_STATS_DATA": {"RESULT": {"STATUS": 0}}}'
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache"""
+
+    def test_make_key_ignores_app_id_and_order(self):
+        key1 = ResponseCache.make_key(
+            URL, {"appId": "a", "statsDataId": "0000020201", "limit": 10}
+        )
+        key2 = ResponseCache.make_key(
+            URL, {"limit": "10", "statsDataId": "0000020201", "appId": "b"}
+        )
+        key3 = ResponseCache.make_key(URL, {"statsDataId": "0000020201", "limit": 20})
+
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_roundtrip_and_counters(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.make_key(URL, {"statsDataId": "1"})
+
+        assert cache.get(key) is None
+        cache.set(key, OK_BODY)
+        assert cache.get(key) == OK_BODY
+
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_entries_are_compressed(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        body = OK_BODY + b" " * 10000
+        cache.set("key", body)
+
+        (entry,) = tmp_path.glob("*.json.gz")
+        assert entry.stat().st_size < len(body)
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=60)
+        cache.set("key", OK_BODY)
+        (entry,) = tmp_path.glob("*.json.gz")
+        old = time.time() - 120
+        os.utime(entry, (old, old))
+
+        assert cache.get("key") is None
+        assert not entry.exists()
+
+    def test_error_status_not_cached(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.set("key", b'{"GET_STATS_DATA": {"RESULT": {"STATUS": 100}}}')
+
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self, tmp_path):
+        body = os.urandom(2000)
+        cache = ResponseCache(tmp_path, max_size_bytes=5000)
+        cache.set("a", body)
+        cache.set("b", body)
+        # Make "a" the most recently used entry
+        now = time.time()
+        os.utime(tmp_path / "b.json.gz", (now - 100, now))
+        cache.get("a")
+
+        cache.set("c", body)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == body
+        assert cache.get("c") == body
+        assert cache.evictions == 1
+
+
+class TestEstatApiClientCache:
+    """Test cases for EstatApiClient with a response cache"""
+
+    @patch("estat_api_dlt_helper.api.client.Client")
+    def test_second_request_served_from_cache(self, mock_client_cls, tmp_path):
+        mock_response = Mock(ok=True, content=OK_BODY)
+        mock_client_cls.return_value.get.return_value = mock_response
+
+        cache = ResponseCache(tmp_path)
+        client = EstatApiClient(app_id="test_app_id", cache=cache)
+
+        first = client.get_stats_data(stats_data_id="0000020202")
+        client.app_id = "another_app_id"
+        second = client.get_stats_data(stats_data_id="0000020202")
+
+        assert mock_client_cls.return_value.get.call_count == 1
+        assert second == {"GET_STATS_DATA": {"RESULT": {"STATUS": 0}}}
+        assert first is mock_response.json.return_value
+        assert cache.hits == 1
+        assert cache.misses == 1
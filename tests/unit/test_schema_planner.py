@@ -0,0 +1,165 @@
+"""Tests for planning the superset schema of several tables."""
+
+import copy
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from estat_api_dlt_helper.config import EstatDltConfig
+from estat_api_dlt_helper.loader.dlt_resource import create_estat_resource
+from estat_api_dlt_helper.loader.schema_planner import (
+    conform_to_schema,
+    plan_superset_schema,
+)
+from estat_api_dlt_helper.parser import parse_response, prepare_metadata
+
+
+def _variant(sample_response_data):
+    """Same table without @parentCode on areas and with a cat02 dimension."""
+    page = copy.deepcopy(sample_response_data)
+    statistical_data = page["GET_STATS_DATA"]["STATISTICAL_DATA"]
+    class_objs = statistical_data["CLASS_INF"]["CLASS_OBJ"]
+    for cls in class_objs[2]["CLASS"]:
+        del cls["@parentCode"]
+    class_objs.append(
+        {"@id": "cat02", "@name": "性別", "CLASS": {"@code": "1", "@name": "男"}}
+    )
+    for value in statistical_data["DATA_INF"]["VALUE"]:
+        value["@cat02"] = "1"
+    return page
+
+
+def _meta_info(page):
+    statistical_data = page["GET_STATS_DATA"]["STATISTICAL_DATA"]
+    return {
+        "GET_META_INFO": {
+            "METADATA_INF": {
+                "TABLE_INF": statistical_data["TABLE_INF"],
+                "CLASS_INF": statistical_data["CLASS_INF"],
+            }
+        }
+    }
+
+
+class TestPlanSupersetSchema:
+    """Test cases for plan_superset_schema"""
+
+    def test_union_of_dimensions_and_fields(self, sample_response_data):
+        variant = _variant(sample_response_data)
+
+        schema = plan_superset_schema(
+            [prepare_metadata(variant), prepare_metadata(sample_response_data)]
+        )
+
+        assert schema.names == [
+            "tab",
+            "cat01",
+            "area",
+            "cat02",
+            "value",
+            "tab_metadata",
+            "cat01_metadata",
+            "area_metadata",
+            "cat02_metadata",
+            "stat_inf",
+        ]
+        assert schema.field("area_metadata").type.names == [
+            "code",
+            "name",
+            "level",
+            "parent_code",
+        ]
+
+    def test_options(self, sample_response_data):
+        schema = plan_superset_schema(
+            [prepare_metadata(sample_response_data)],
+            embed_metadata=False,
+            keep_value_symbols=True,
+            stat_inf_mode="id",
+        )
+
+        assert schema.names == [
+            "tab",
+            "cat01",
+            "area",
+            "value",
+            "value_symbol",
+            "stat_inf_id",
+        ]
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            plan_superset_schema([])
+
+
+class TestConformToSchema:
+    """Test cases for conform_to_schema"""
+
+    def test_fills_missing_columns_and_fields(self, sample_response_data):
+        variant = _variant(sample_response_data)
+        schema = plan_superset_schema(
+            [prepare_metadata(sample_response_data), prepare_metadata(variant)]
+        )
+
+        original = conform_to_schema(parse_response(sample_response_data), schema)
+        changed = conform_to_schema(parse_response(variant), schema)
+
+        assert original.schema == changed.schema
+        assert original.column("cat02").null_count == original.num_rows
+        assert changed.column("area_metadata").to_pylist()[0]["parent_code"] is None
+        assert original.column("value").equals(changed.column("value"))
+
+    def test_unplanned_columns_kept_before_value(self, sample_response_data):
+        table = parse_response(sample_response_data)
+        schema = plan_superset_schema([prepare_metadata(sample_response_data)])
+
+        conformed = conform_to_schema(table, schema)
+
+        # time has no CLASS_OBJ in the sample and unit never has one
+        assert "time" not in schema.names
+        assert "unit" not in schema.names
+        assert conformed.column_names == table.column_names
+
+    def test_record_batch(self, sample_response_data):
+        batch = parse_response(sample_response_data).to_batches()[0]
+        schema = plan_superset_schema(
+            [prepare_metadata(_variant(sample_response_data))]
+        )
+
+        conformed = conform_to_schema(batch, schema)
+
+        assert isinstance(conformed, pa.RecordBatch)
+        assert "cat02" in conformed.schema.names
+
+
+class TestCreateEstatResourcePlanSchema:
+    """Test cases for create_estat_resource with plan_schema"""
+
+    @patch("estat_api_dlt_helper.loader.dlt_resource.EstatApiClient")
+    def test_first_table_has_final_schema(self, mock_client_cls, sample_response_data):
+        variant = _variant(sample_response_data)
+        client = mock_client_cls.return_value
+        client.get_meta_info.side_effect = [
+            _meta_info(sample_response_data),
+            _meta_info(variant),
+        ]
+        client.get_stats_data_generator.side_effect = [
+            iter([sample_response_data]),
+            iter([variant]),
+        ]
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": ["0000020201", "0000020202"]},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "pop",
+            },
+            plan_schema=True,
+        )
+
+        tables = list(create_estat_resource(config))
+
+        assert client.get_meta_info.call_count == 2
+        assert tables[0].schema == tables[1].schema
+        assert "cat02_metadata" in tables[0].column_names
@@ -0,0 +1,147 @@
+"""Tests for the streaming getStatsData parser."""
+
+import copy
+import io
+import json
+from unittest.mock import MagicMock, Mock
+
+import pyarrow as pa
+import pytest
+
+from estat_api_dlt_helper.loader.dlt_resource import _fetch_estat_data
+from estat_api_dlt_helper.parser import (
+    StreamingResponseParser,
+    parse_response,
+    prepare_metadata,
+)
+
+
+def _stream(data) -> io.BytesIO:
+    return io.BytesIO(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def _page(sample_response_data, total, start, with_metadata=True):
+    page = copy.deepcopy(sample_response_data)
+    statistical_data = page["GET_STATS_DATA"]["STATISTICAL_DATA"]
+    rows = len(statistical_data["DATA_INF"]["VALUE"])
+    statistical_data["RESULT_INF"] = {
+        "TOTAL_NUMBER": total,
+        "FROM_NUMBER": start,
+        "TO_NUMBER": start + rows - 1,
+    }
+    if not with_metadata:
+        del statistical_data["CLASS_INF"]
+        del statistical_data["TABLE_INF"]
+    return page
+
+
+class TestStreamingResponseParser:
+    """Test cases for StreamingResponseParser"""
+
+    def test_matches_parse_response(self, sample_response_data):
+        parser = StreamingResponseParser()
+        tables = list(parser.iter_tables(_stream(sample_response_data)))
+
+        assert len(tables) == 1
+        assert tables[0].equals(parse_response(sample_response_data))
+
+    def test_chunks(self, sample_response_data):
+        parser = StreamingResponseParser(chunk_size=1)
+        tables = list(parser.iter_tables(_stream(sample_response_data)))
+
+        assert [len(table) for table in tables] == [1, 1]
+        assert pa.concat_tables(tables).equals(parse_response(sample_response_data))
+
+    def test_single_value_object(self, sample_response_data):
+        data = copy.deepcopy(sample_response_data)
+        data_inf = data["GET_STATS_DATA"]["STATISTICAL_DATA"]["DATA_INF"]
+        data_inf["VALUE"] = data_inf["VALUE"][0]
+
+        tables = list(StreamingResponseParser().iter_tables(_stream(data)))
+
+        assert len(tables) == 1
+        assert tables[0].equals(parse_response(data))
+
+    def test_result_inf(self, sample_response_data):
+        parser = StreamingResponseParser()
+        list(parser.iter_tables(_stream(_page(sample_response_data, 10, 1))))
+
+        assert parser.result_inf == {
+            "TOTAL_NUMBER": 10,
+            "FROM_NUMBER": 1,
+            "TO_NUMBER": 2,
+        }
+
+    def test_with_prepared_metadata(self, sample_response_data):
+        metadata = prepare_metadata(sample_response_data)
+        page = _page(sample_response_data, 2, 1, with_metadata=False)
+
+        parser = StreamingResponseParser(metadata=metadata)
+        tables = list(parser.iter_tables(_stream(page)))
+
+        assert tables[0].equals(parse_response(sample_response_data))
+
+    def test_missing_metadata_raises(self, sample_response_data):
+        page = _page(sample_response_data, 2, 1, with_metadata=False)
+
+        with pytest.raises(ValueError, match="TABLE_INF, CLASS_INF"):
+            list(StreamingResponseParser().iter_tables(_stream(page)))
+
+    def test_missing_statistical_data_raises(self):
+        data = {"GET_STATS_DATA": {"RESULT": {"STATUS": 100}}}
+
+        with pytest.raises(ValueError, match="STATISTICAL_DATA"):
+            list(StreamingResponseParser().iter_tables(_stream(data)))
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            StreamingResponseParser(chunk_size=0)
+
+
+class TestFetchEstatDataStreaming:
+    """Tests for the streaming path of _fetch_estat_data."""
+
+    def test_paginates_and_reuses_metadata(self, sample_response_data):
+        client = MagicMock()
+        client.get_stats_data_stream.side_effect = [
+            Mock(raw=_stream(_page(sample_response_data, 4, 1))),
+            Mock(raw=_stream(_page(sample_response_data, 4, 3, with_metadata=False))),
+        ]
+
+        tables = list(
+            _fetch_estat_data(
+                client,
+                "0000020201",
+                {"metaGetFlg": "Y"},
+                limit=2,
+                reuse_metadata=True,
+                stream_chunk_size=1,
+            )
+        )
+
+        assert len(tables) == 4
+        calls = client.get_stats_data_stream.call_args_list
+        assert [c.kwargs["start_position"] for c in calls] == [1, 3]
+        assert calls[0].kwargs["metaGetFlg"] == "Y"
+        assert calls[1].kwargs["metaGetFlg"] == "N"
+        client.get_stats_data_generator.assert_not_called()
+
+    def test_stops_at_maximum_offset(self, sample_response_data):
+        client = MagicMock()
+        client.get_stats_data_stream.return_value = Mock(
+            raw=_stream(_page(sample_response_data, 10, 1))
+        )
+
+        tables = list(
+            _fetch_estat_data(
+                client,
+                "0000020201",
+                {},
+                limit=2,
+                maximum_offset=2,
+                stream_chunk_size=10,
+            )
+        )
+
+        assert len(tables) == 1
+        assert client.get_stats_data_stream.call_count == 1
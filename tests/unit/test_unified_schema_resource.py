@@ -0,0 +1,148 @@
+"""Tests for the Arrow-native unified schema resource."""
+
+import copy
+from unittest.mock import patch
+
+import pyarrow as pa
+
+from estat_api_dlt_helper.config import EstatDltConfig
+from estat_api_dlt_helper.loader.unified_schema_resource import (
+    _to_unified_table,
+    create_unified_estat_resource,
+    unified_arrow_schema,
+)
+from estat_api_dlt_helper.parser import parse_response
+
+
+def _with_parent_codes(sample_response_data):
+    # Same table, but the area CLASS entries lack @parentCode
+    page = copy.deepcopy(sample_response_data)
+    class_objs = page["GET_STATS_DATA"]["STATISTICAL_DATA"]["CLASS_INF"]["CLASS_OBJ"]
+    for cls in class_objs[2]["CLASS"]:
+        del cls["@parentCode"]
+    return page
+
+
+class TestUnifiedArrowSchema:
+    """Test cases for unified_arrow_schema"""
+
+    def test_metadata_structs_have_all_model_fields(self):
+        schema = unified_arrow_schema()
+
+        assert schema.field("time_metadata").type == pa.struct(
+            [
+                ("code", pa.string()),
+                ("name", pa.string()),
+                ("level", pa.string()),
+                ("parent_code", pa.string()),
+                ("unit", pa.string()),
+            ]
+        )
+        assert schema.field("value").type == pa.float64()
+        assert "extra_dimensions" not in schema.names
+
+    def test_cached(self):
+        assert unified_arrow_schema() is unified_arrow_schema()
+
+
+class TestToUnifiedTable:
+    """Test cases for _to_unified_table"""
+
+    def test_tables_with_different_structs_concatenate(self, sample_response_data):
+        with_parent = _to_unified_table(parse_response(sample_response_data))
+        without_parent = _to_unified_table(
+            parse_response(_with_parent_codes(sample_response_data))
+        )
+
+        assert with_parent.schema == without_parent.schema
+        combined = pa.concat_tables([with_parent, without_parent])
+        areas = combined.column("area_metadata").to_pylist()
+        assert areas[0]["parent_code"] == "01000"
+        assert list(areas[0]) == ["code", "name", "level", "parent_code"]
+        assert areas[-1]["parent_code"] is None
+
+    def test_values_preserved_in_schema_order(self, sample_response_data):
+        table = parse_response(sample_response_data)
+
+        unified = _to_unified_table(table)
+
+        known = unified_arrow_schema().names
+        assert unified.column_names[: len(known)] == known
+        assert unified.column("value").to_pylist() == table.column("value").to_pylist()
+        assert unified.column("stat_inf").type == table.column("stat_inf").type
+
+    def test_missing_columns_added_as_nulls(self):
+        table = pa.table({"time": ["2020"], "value": [1.0]})
+
+        unified = _to_unified_table(table)
+
+        assert unified.schema == unified_arrow_schema()
+        assert unified.column("cat15").to_pylist() == [None]
+        assert unified.column("value").to_pylist() == [1.0]
+
+    def test_null_structs_stay_null(self):
+        table = pa.table(
+            {
+                "time": ["2020", "2021"],
+                "time_metadata": pa.array(
+                    [{"code": "2020", "name": "2020年"}, None],
+                    type=pa.struct([("code", pa.string()), ("name", pa.string())]),
+                ),
+            }
+        )
+
+        unified = _to_unified_table(table)
+
+        assert unified.column("time_metadata").to_pylist()[1] is None
+        assert unified.column("time_metadata").to_pylist()[0]["level"] is None
+
+    def test_unknown_columns(self):
+        table = pa.table(
+            {
+                "cat16": ["A"],
+                "cat16_metadata": pa.array(
+                    [{"code": "A", "name": "a", "extra": "x"}],
+                    type=pa.struct(
+                        [
+                            ("code", pa.string()),
+                            ("name", pa.string()),
+                            ("extra", pa.string()),
+                        ]
+                    ),
+                ),
+            }
+        )
+
+        unified = _to_unified_table(table)
+
+        assert unified.column_names[-2:] == ["cat16", "cat16_metadata"]
+        assert unified.schema.field("cat16").type == pa.string()
+        assert (
+            unified.schema.field("cat16_metadata").type
+            == unified_arrow_schema().field("cat01_metadata").type
+        )
+
+
+class TestCreateUnifiedEstatResource:
+    """Test cases for create_unified_estat_resource"""
+
+    @patch("estat_api_dlt_helper.loader.unified_schema_resource.EstatApiClient")
+    def test_yields_unified_tables(self, mock_client_cls, sample_response_data):
+        mock_client_cls.return_value.get_stats_data_generator.side_effect = [
+            iter([sample_response_data]),
+            iter([_with_parent_codes(sample_response_data)]),
+        ]
+        config = EstatDltConfig(
+            source={"app_id": "test", "statsDataId": ["0000020201", "0000020202"]},
+            destination={
+                "destination": "duckdb",
+                "dataset_name": "estat",
+                "table_name": "unified",
+            },
+        )
+
+        tables = list(create_unified_estat_resource(config))
+
+        assert len(tables) == 2
+        assert all(isinstance(table, pa.Table) for table in tables)
+        assert tables[0].schema == tables[1].schema